@@ -1,8 +1,11 @@
 """Main Agent class with tool calling and state management."""
 
 import asyncio
+import hashlib
 import json
-from collections.abc import AsyncIterator, Callable
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +21,17 @@ from .resilience.retry import resilient_streaming_call
 from .tools import Tool
 from .tools.registry import ToolRegistry
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
 
 class Agent:
     """Agent with LLM and tool calling capabilities."""
@@ -41,6 +55,8 @@ class Agent:
         billing_hook: BillingHook | None = None,
         max_rounds: int | None = None,
         max_rounds_with_plan: int | None = None,
+        response_cache_size: int = 0,
+        parallel_tools: int = 1,
     ):
         """Initialize agent.
 
@@ -61,6 +77,9 @@ class Agent:
             billing_hook: Optional hook for tracking costs
             max_rounds: Maximum conversation rounds (replaces max_iterations)
             max_rounds_with_plan: Maximum rounds after plan tool is used
+            response_cache_size: Number of LLM responses to cache in run() (0 disables)
+            parallel_tools: Max thread-safe tool calls from one response to run
+                concurrently in run() (1 runs them sequentially)
         """
         self.name = name
         self.llm = llm or LLM()
@@ -81,20 +100,20 @@ class Agent:
 
         # Use enhanced ToolRegistry from tools/registry.py
         self.registry = ToolRegistry()
+        # Tool objects by name, used by the synchronous run() loop
+        self._tools: dict[str, Tool] = {}
         if tools:
             for tool in tools:
-                # Get schema from Tool object
-                schema = tool.to_openai_schema()
-                self.registry.register(
-                    name=tool.name,
-                    handler=tool.func,
-                    schema=schema,
-                )
+                self.add_tool(tool)
+        self.parallel_tools = parallel_tools
 
         self.history: list[Message] = []
         if system_prompt:
             self.history.append(Message(role="system", content=system_prompt))
 
+        self.response_cache_size = response_cache_size
+        self._response_cache: OrderedDict[str, Response] = OrderedDict()
+
         self.message_queue = MessageQueue()
         self._plan_used = False  # Track if plan tool has been used
         self._rounds_since_plan = 0  # Track rounds since plan tool
@@ -109,6 +128,39 @@ class Agent:
         if self.verbose:
             print(message)
 
+    def _cached_chat(
+        self, messages: Iterable[Message], tools: list[dict[str, Any]] | None = None
+    ) -> Response:
+        """Call the LLM, reusing a cached response for an identical request.
+
+        The key covers the model and temperature as well as the messages and
+        tools, so swapping ``llm`` or its model never replays stale responses.
+
+        Args:
+            messages: Messages to send
+            tools: Tool schemas to send
+
+        Returns:
+            LLM response
+        """
+        config = self.llm.config
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_dumps([config.model, getattr(config, "temperature", None)]))
+        digest.update(_dumps([msg.model_dump() for msg in messages]))
+        digest.update(_dumps(tools or []))
+        key = digest.hexdigest()
+
+        cache = self._response_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        response = self.llm.chat(messages=messages, tools=tools)
+        cache[key] = response
+        if len(cache) > self.response_cache_size:
+            cache.popitem(last=False)
+        return response
+
     def add_tool(self, tool: Tool) -> None:
         """Add a tool to the agent.
 
@@ -121,6 +173,175 @@ class Agent:
             handler=tool.func,
             schema=schema,
         )
+        self._tools[tool.name] = tool
+
+    def _call_tool(self, name: str, args: dict[str, Any]) -> Any:
+        """Execute a tool by name with parsed arguments.
+
+        Args:
+            name: Tool name
+            args: Tool arguments
+
+        Returns:
+            Tool result
+
+        Raises:
+            KeyError: If no tool with this name was added
+        """
+        tool = self._tools.get(name)
+        if tool is None:
+            raise KeyError(f"Tool '{name}' not found")
+        return tool.execute(**args)
+
+    def _can_run_parallel(self, tool_calls: list[dict[str, Any]]) -> bool:
+        """Check whether a response's tool calls may run concurrently."""
+        if self.parallel_tools <= 1 or len(tool_calls) <= 1:
+            return False
+        for tool_call in tool_calls:
+            tool = self._tools.get(tool_call.get("function", {}).get("name"))
+            if tool is None or not tool.thread_safe:
+                return False
+        return True
+
+    def _run_tool_calls_parallel(self, tool_calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Execute thread-safe tool calls concurrently, keeping their order.
+
+        Only the tool bodies run in worker threads; logging and the
+        on_tool_start/on_tool_end callbacks stay on the calling thread.
+
+        Args:
+            tool_calls: Tool calls from one LLM response
+
+        Returns:
+            Tool result dicts in the same order as ``tool_calls``
+        """
+        calls = []
+        for tool_call in tool_calls:
+            function = tool_call.get("function", {})
+            tool_name = function.get("name")
+            tool_args = json.loads(function.get("arguments", "{}"))
+            self._log(f"[cyan]→ Calling tool: {tool_name}({tool_args})[/cyan]")
+            if self.on_tool_start:
+                self.on_tool_start(tool_name, tool_args)
+            calls.append((tool_call.get("id"), tool_name, tool_args))
+
+        def run_one(call: tuple[Any, str, dict[str, Any]]) -> tuple[bool, Any]:
+            try:
+                return True, self._call_tool(call[1], call[2])
+            except Exception as e:
+                return False, e
+
+        with ThreadPoolExecutor(max_workers=min(self.parallel_tools, len(calls))) as pool:
+            outcomes = list(pool.map(run_one, calls))
+
+        tool_results = []
+        for (call_id, tool_name, _), (ok, value) in zip(calls, outcomes, strict=True):
+            if ok:
+                content = str(value)
+                self._log(f"[green]✓ Result: {value}[/green]")
+                if self.on_tool_end:
+                    self.on_tool_end(tool_name, value)
+            else:
+                content = f"Error: {value}"
+                self._log(f"[red]✗ {content}[/red]")
+            tool_results.append(
+                {
+                    "tool_call_id": call_id,
+                    "role": "tool",
+                    "name": tool_name,
+                    "content": content,
+                }
+            )
+        return tool_results
+
+    def _run_tool_calls(self, tool_calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Execute one response's tool calls one after another.
+
+        Args:
+            tool_calls: Tool calls from one LLM response
+
+        Returns:
+            Tool result dicts in the same order as ``tool_calls``
+        """
+        tool_results = []
+        for tool_call in tool_calls:
+            function = tool_call.get("function", {})
+            tool_name = function.get("name")
+            tool_args = json.loads(function.get("arguments", "{}"))
+
+            self._log(f"[cyan]→ Calling tool: {tool_name}({tool_args})[/cyan]")
+
+            if self.on_tool_start:
+                self.on_tool_start(tool_name, tool_args)
+
+            try:
+                result = self._call_tool(tool_name, tool_args)
+                tool_results.append(
+                    {
+                        "tool_call_id": tool_call.get("id"),
+                        "role": "tool",
+                        "name": tool_name,
+                        "content": str(result),
+                    }
+                )
+                self._log(f"[green]✓ Result: {result}[/green]")
+
+                if self.on_tool_end:
+                    self.on_tool_end(tool_name, result)
+            except Exception as e:
+                error_msg = f"Error: {e}"
+                tool_results.append(
+                    {
+                        "tool_call_id": tool_call.get("id"),
+                        "role": "tool",
+                        "name": tool_name,
+                        "content": error_msg,
+                    }
+                )
+                self._log(f"[red]✗ {error_msg}[/red]")
+        return tool_results
+
+    def _tool_round(
+        self, content: str | None, tool_calls: list[dict[str, Any]], check_queue: bool
+    ) -> None:
+        """Execute a response's tool calls and record the round in history.
+
+        Args:
+            content: Text the assistant sent alongside the tool calls
+            tool_calls: Tool calls from the response
+            check_queue: Pick up steering messages after the tools ran
+        """
+        if self._can_run_parallel(tool_calls):
+            tool_results = self._run_tool_calls_parallel(tool_calls)
+        else:
+            tool_results = self._run_tool_calls(tool_calls)
+
+        # Add assistant message and tool results to history
+        history = self.history
+        history.append(
+            Message(
+                role="assistant",
+                content=content or None,
+                metadata={"tool_calls": tool_calls},
+            )
+        )
+        for tool_result in tool_results:
+            history.append(
+                Message(
+                    role="tool",
+                    content=tool_result["content"],
+                    metadata={
+                        "tool_call_id": tool_result["tool_call_id"],
+                        "name": tool_result["name"],
+                    },
+                )
+            )
+
+        # Check for steering messages after tool execution
+        if check_queue and self.message_queue.has_steering():
+            for msg in self.message_queue.get_steering_messages():
+                self._log(f"[yellow]⚡ Steering: {msg.content}[/yellow]")
+                history.append(Message(role="user", content=msg.content))
 
     def run(self, message: str, check_queue: bool = True) -> Response:
         """Run agent with a user message.
@@ -132,104 +353,49 @@ class Agent:
         Returns:
             Agent response
         """
-        self._log(f"[bold blue]User:[/bold blue] {message}")
-        self.history.append(Message(role="user", content=message))
+        # Bind hot attributes to locals; none of them change during a run
+        history = self.history
+        registry = self.registry
+        chat = self._cached_chat if self.response_cache_size > 0 else self.llm.chat
+        log = self._log
+        message_queue = self.message_queue
+
+        log(f"[bold blue]User:[/bold blue] {message}")
+        history.append(Message(role="user", content=message))
+
+        # Tools don't change mid-run, so the schema list is built once
+        tools_schema = registry.get_schemas() if len(registry) > 0 else None
 
         iterations = 0
         while iterations < self.max_iterations:
             iterations += 1
-            self._log(f"[dim]Iteration {iterations}[/dim]")
-
-            # Get tool schemas
-            tools_schema = self.registry.get_schemas() if len(self.registry) > 0 else None
+            log(f"[dim]Iteration {iterations}[/dim]")
 
             # Call LLM
-            response = self.llm.chat(
-                messages=self.history,
+            response = chat(
+                messages=history,
                 tools=tools_schema,
             )
 
             # Check if tool calls are needed
-            if hasattr(response, "tool_calls") and response.tool_calls:
-                self._log(f"[yellow]Tool calls requested: {len(response.tool_calls)}[/yellow]")
-
-                # Execute tools
-                tool_results = []
-                for tool_call in response.tool_calls:
-                    tool_name = tool_call.get("function", {}).get("name")
-                    tool_args = json.loads(tool_call.get("function", {}).get("arguments", "{}"))
-
-                    self._log(f"[cyan]→ Calling tool: {tool_name}({tool_args})[/cyan]")
-
-                    if self.on_tool_start:
-                        self.on_tool_start(tool_name, tool_args)
-
-                    try:
-                        result = self.registry.execute(tool_name, **tool_args)
-                        tool_results.append(
-                            {
-                                "tool_call_id": tool_call.get("id"),
-                                "role": "tool",
-                                "name": tool_name,
-                                "content": str(result),
-                            }
-                        )
-                        self._log(f"[green]✓ Result: {result}[/green]")
-
-                        if self.on_tool_end:
-                            self.on_tool_end(tool_name, result)
-                    except Exception as e:
-                        error_msg = f"Error: {e}"
-                        tool_results.append(
-                            {
-                                "tool_call_id": tool_call.get("id"),
-                                "role": "tool",
-                                "name": tool_name,
-                                "content": error_msg,
-                            }
-                        )
-                        self._log(f"[red]✗ {error_msg}[/red]")
-
-                # Add assistant message and tool results to history
-                self.history.append(
-                    Message(
-                        role="assistant",
-                        content=response.content or "",
-                        metadata={"tool_calls": response.tool_calls},
-                    )
-                )
-                for tool_result in tool_results:
-                    self.history.append(
-                        Message(
-                            role="tool",
-                            content=tool_result["content"],
-                            metadata={
-                                "tool_call_id": tool_result["tool_call_id"],
-                                "name": tool_result["name"],
-                            },
-                        )
-                    )
-
-                # Check for steering messages after tool execution
-                if check_queue and self.message_queue.has_steering():
-                    steering = self.message_queue.get_steering_messages()
-                    for msg in steering:
-                        self._log(f"[yellow]⚡ Steering: {msg.content}[/yellow]")
-                        self.history.append(Message(role="user", content=msg.content))
+            tool_calls = getattr(response, "tool_calls", None)
+            if tool_calls:
+                log(f"[yellow]Tool calls requested: {len(tool_calls)}[/yellow]")
+                self._tool_round(response.content, tool_calls, check_queue)
 
                 # Continue loop to get final response
                 continue
             else:
                 # No tool calls, we have final response
-                self.history.append(Message(role="assistant", content=response.content))
-                self._log(f"[bold green]Agent:[/bold green] {response.content}")
+                history.append(Message(role="assistant", content=response.content))
+                log(f"[bold green]Agent:[/bold green] {response.content}")
 
                 # Check for follow-up messages
-                if check_queue and self.message_queue.has_followup():
-                    followup = self.message_queue.get_followup_messages()
+                if check_queue and message_queue.has_followup():
+                    followup = message_queue.get_followup_messages()
                     if followup:
                         # Process first follow-up recursively
-                        self._log(f"[cyan]→ Follow-up: {followup[0].content}[/cyan]")
+                        log(f"[cyan]→ Follow-up: {followup[0].content}[/cyan]")
                         return self.run(followup[0].content, check_queue=True)
 
                 return response
@@ -239,9 +405,74 @@ class Agent:
             content="Maximum iterations reached without completion.",
             model=self.llm.config.model,
         )
-        self.history.append(Message(role="assistant", content=final_response.content))
+        history.append(Message(role="assistant", content=final_response.content))
         return final_response
 
+    def stream(self, message: str, check_queue: bool = True) -> Iterator[str]:
+        """Run agent with a user message, yielding response text as it arrives.
+
+        Same tool loop as run(), but every LLM turn is streamed; tool calls
+        are executed once the turn's stream ends. If tools are registered and
+        the LLM cannot stream tool calls, the whole run() response is yielded
+        as a single chunk instead.
+
+        Args:
+            message: User message
+            check_queue: Check message queue for interrupts
+
+        Yields:
+            Response text chunks
+        """
+        registry = self.registry
+        if len(registry) > 0 and getattr(self.llm, "streams_tool_calls", False) is not True:
+            yield self.run(message, check_queue=check_queue).content
+            return
+
+        history = self.history
+        log = self._log
+        log(f"[bold blue]User:[/bold blue] {message}")
+        history.append(Message(role="user", content=message))
+
+        tools_schema = registry.get_schemas() if len(registry) > 0 else None
+
+        iterations = 0
+        while iterations < self.max_iterations:
+            iterations += 1
+            log(f"[dim]Iteration {iterations}[/dim]")
+
+            parts = []
+            tool_calls = None
+            for chunk in self.llm.chat_stream(messages=history, tools=tools_schema):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield chunk.content
+                if chunk.metadata and chunk.metadata.get("tool_calls"):
+                    tool_calls = chunk.metadata["tool_calls"]
+            content = "".join(parts)
+
+            if tool_calls:
+                log(f"[yellow]Tool calls requested: {len(tool_calls)}[/yellow]")
+                if content:
+                    # Keep the next turn's text off the end of this one
+                    yield "\n"
+                self._tool_round(content, tool_calls, check_queue)
+                continue
+
+            history.append(Message(role="assistant", content=content))
+            log(f"[bold green]Agent:[/bold green] {content}")
+
+            if check_queue and self.message_queue.has_followup():
+                followup = self.message_queue.get_followup_messages()
+                if followup:
+                    log(f"[cyan]→ Follow-up: {followup[0].content}[/cyan]")
+                    yield "\n"
+                    yield from self.stream(followup[0].content, check_queue=True)
+            return
+
+        content = "Maximum iterations reached without completion."
+        history.append(Message(role="assistant", content=content))
+        yield content
+
     async def arun(self, message: str, check_queue: bool = True) -> Response:
         """Async run agent with a user message using enhanced subsystems.
 
@@ -381,7 +612,7 @@ class Agent:
                 self.history.append(
                     Message(
                         role="assistant",
-                        content=response_content or "",
+                        content=response_content or None,
                         metadata={"tool_calls": response_tool_calls},
                     )
                 )
@@ -474,16 +705,16 @@ class Agent:
         )
 
         # Restore history
-        agent.history = [Message(**msg) for msg in state.messages]
+        agent.history.clear()
+        agent.history.extend(Message(**msg) for msg in state.messages)
 
         return agent
 
     def clear_history(self) -> None:
         """Clear conversation history (keeps system prompt)."""
+        self.history.clear()
         if self.system_prompt:
-            self.history = [Message(role="system", content=self.system_prompt)]
-        else:
-            self.history = []
+            self.history.append(Message(role="system", content=self.system_prompt))
 
     async def respond(
         self,
@@ -628,7 +859,7 @@ class Agent:
             self.history.append(
                 Message(
                     role="assistant",
-                    content=assistant_content or "",
+                    content=assistant_content or None,
                     metadata={"tool_calls": assistant_tool_calls},
                 )
             )
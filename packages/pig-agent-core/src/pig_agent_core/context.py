@@ -4,6 +4,25 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Protocol
 
+_CONTEXT_FILES = ("SYSTEM.md", "AGENTS.md", "APPEND_SYSTEM.md")
+
+# Rendered system prompts keyed by (default prompt, context-file signature)
+_PROMPT_CACHE: dict[tuple[str, tuple], str] = {}
+_PROMPT_CACHE_SIZE = 32
+
+
+def _files_signature(files: dict[str, list[Path]]) -> tuple:
+    """Identify the current state of context files by path, mtime and size."""
+    signature = []
+    for paths in files.values():
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
 
 class ContextManager:
     """Manages context files like AGENTS.md, SYSTEM.md."""
@@ -27,17 +46,26 @@ class ContextManager:
         Returns:
             List of found files (ordered: global, parents, cwd)
         """
-        found = []
+        return self._find_all((filename,))[filename]
 
-        # Global config
-        global_file = Path.home() / ".agents" / filename
-        if global_file.exists():
-            found.append(global_file)
+    def _find_all(self, filenames: tuple[str, ...]) -> dict[str, list[Path]]:
+        """Find several context files in one walk up the directory hierarchy.
+
+        Args:
+            filenames: Files to search for
+
+        Returns:
+            Mapping of filename to found files, ordered as in find_context_files
+        """
+        found: dict[str, list[Path]] = {name: [] for name in filenames}
 
-        # Alternative global (for pi compatibility)
-        pi_global = Path.home() / ".pi" / "agent" / filename
-        if pi_global.exists() and pi_global not in found:
-            found.append(pi_global)
+        # Global config, then the alternative global (for pi compatibility)
+        home = Path.home()
+        for base in (home / ".agents", home / ".pi" / "agent"):
+            for name, paths in found.items():
+                path = base / name
+                if path.exists() and path not in paths:
+                    paths.append(path)
 
         # Walk up from workspace
         current = self.workspace
@@ -48,33 +76,29 @@ class ContextManager:
                 break
             visited.add(current)
 
-            # Check current directory
-            file_path = current / filename
-            if file_path.exists() and file_path not in found:
-                found.append(file_path)
-
-            # Check .agents directory
-            agents_file = current / ".agents" / filename
-            if agents_file.exists() and agents_file not in found:
-                found.append(agents_file)
-
-            # Check .pi directory
-            pi_file = current / ".pi" / filename
-            if pi_file.exists() and pi_file not in found:
-                found.append(pi_file)
+            # Check current directory, then its .agents and .pi directories
+            for base in (current, current / ".agents", current / ".pi"):
+                for name, paths in found.items():
+                    path = base / name
+                    if path.exists() and path not in paths:
+                        paths.append(path)
 
             # Move to parent
             current = current.parent
 
         return found
 
-    def load_agents_md(self) -> str | None:
+    def load_agents_md(self, files: list[Path] | None = None) -> str | None:
         """Load all AGENTS.md files.
 
+        Args:
+            files: Already-located AGENTS.md files (searched for if omitted)
+
         Returns:
             Combined content of all AGENTS.md files
         """
-        files = self.find_context_files("AGENTS.md")
+        if files is None:
+            files = self.find_context_files("AGENTS.md")
 
         if not files:
             return None
@@ -89,13 +113,17 @@ class ContextManager:
 
         return "\n\n---\n\n".join(content_parts) if content_parts else None
 
-    def load_system_md(self) -> str | None:
+    def load_system_md(self, files: list[Path] | None = None) -> str | None:
         """Load SYSTEM.md (replaces default system prompt).
 
+        Args:
+            files: Already-located SYSTEM.md files (searched for if omitted)
+
         Returns:
             Content of SYSTEM.md if found
         """
-        files = self.find_context_files("SYSTEM.md")
+        if files is None:
+            files = self.find_context_files("SYSTEM.md")
 
         if not files:
             return None
@@ -107,13 +135,17 @@ class ContextManager:
             print(f"Warning: Failed to load SYSTEM.md: {e}")
             return None
 
-    def load_append_system_md(self) -> str | None:
+    def load_append_system_md(self, files: list[Path] | None = None) -> str | None:
         """Load APPEND_SYSTEM.md (appends to system prompt).
 
+        Args:
+            files: Already-located APPEND_SYSTEM.md files (searched for if omitted)
+
         Returns:
             Combined content of all APPEND_SYSTEM.md files
         """
-        files = self.find_context_files("APPEND_SYSTEM.md")
+        if files is None:
+            files = self.find_context_files("APPEND_SYSTEM.md")
 
         if not files:
             return None
@@ -131,29 +163,43 @@ class ContextManager:
     def build_system_prompt(self, default_prompt: str) -> str:
         """Build final system prompt from context files.
 
+        The rendered prompt is cached per (default prompt, context files) and
+        keyed by each file's path, mtime and size, so an unchanged workspace
+        reuses the same prompt text (and hence the provider's prefix cache)
+        without re-reading the files.
+
         Args:
             default_prompt: Default system prompt
 
         Returns:
             Final system prompt with context files applied
         """
+        files = self._find_all(_CONTEXT_FILES)
+        key = (default_prompt, _files_signature(files))
+        cached = _PROMPT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         # Check for SYSTEM.md override
-        system_md = self.load_system_md()
+        system_md = self.load_system_md(files["SYSTEM.md"])
         if system_md:
             base_prompt = system_md
         else:
             base_prompt = default_prompt
 
         # Append AGENTS.md if exists
-        agents_md = self.load_agents_md()
+        agents_md = self.load_agents_md(files["AGENTS.md"])
         if agents_md:
             base_prompt += f"\n\n# Project Context\n\n{agents_md}"
 
         # Append APPEND_SYSTEM.md if exists
-        append_md = self.load_append_system_md()
+        append_md = self.load_append_system_md(files["APPEND_SYSTEM.md"])
         if append_md:
             base_prompt += f"\n\n{append_md}"
 
+        if len(_PROMPT_CACHE) >= _PROMPT_CACHE_SIZE:
+            _PROMPT_CACHE.pop(next(iter(_PROMPT_CACHE)))
+        _PROMPT_CACHE[key] = base_prompt
         return base_prompt
 
     def watch_for_changes(self) -> None:
@@ -1,10 +1,15 @@
 """Session export functionality (HTML, Markdown, etc.)."""
 
+import html
+import re
 from datetime import datetime
 from pathlib import Path
 
 from .session import Session
 
+_CODE_BLOCK_RE = re.compile(r"```(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+
 
 class SessionExporter:
     """Export sessions to various formats."""
@@ -134,24 +139,16 @@ class SessionExporter:
 """
 
     @staticmethod
-    def export_to_html(
-        session: Session, output_path: Path | None = None, title: str | None = None
-    ) -> Path:
-        """Export session to HTML file.
+    def render_html(session: Session, title: str | None = None) -> str:
+        """Render session as an HTML document.
 
         Args:
-            session: Session to export
-            output_path: Output file path (auto-generated if None)
+            session: Session to render
             title: Page title (uses session name if None)
 
         Returns:
-            Path to exported file
+            HTML document
         """
-        if output_path is None:
-            # Auto-generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = Path(f"{session.name}_{timestamp}.html")
-
         # Get conversation
         conversation = session.get_current_conversation()
 
@@ -172,7 +169,7 @@ class SessionExporter:
             messages_html.append(msg_html)
 
         # Fill template
-        html = SessionExporter.HTML_TEMPLATE.format(
+        return SessionExporter.HTML_TEMPLATE.format(
             title=title or session.name,
             session_id=session.id[:8],
             export_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -180,8 +177,26 @@ class SessionExporter:
             messages_html="\n".join(messages_html),
         )
 
-        # Write file
-        output_path.write_text(html)
+    @staticmethod
+    def export_to_html(
+        session: Session, output_path: Path | None = None, title: str | None = None
+    ) -> Path:
+        """Export session to HTML file.
+
+        Args:
+            session: Session to export
+            output_path: Output file path (auto-generated if None)
+            title: Page title (uses session name if None)
+
+        Returns:
+            Path to exported file
+        """
+        if output_path is None:
+            # Auto-generate filename
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = Path(f"{session.name}_{timestamp}.html")
+
+        output_path.write_text(SessionExporter.render_html(session, title=title))
 
         return output_path
 
@@ -195,9 +210,6 @@ class SessionExporter:
         Returns:
             HTML-formatted content
         """
-        import html
-        import re
-
         # Escape HTML
         content = html.escape(content)
 
@@ -206,10 +218,10 @@ class SessionExporter:
             code = match.group(1)
             return f"<pre><code>{code}</code></pre>"
 
-        content = re.sub(r"```(.*?)```", replace_code_block, content, flags=re.DOTALL)
+        content = _CODE_BLOCK_RE.sub(replace_code_block, content)
 
         # Detect inline code `
-        content = re.sub(r"`([^`]+)`", r"<code>\1</code>", content)
+        content = _INLINE_CODE_RE.sub(r"<code>\1</code>", content)
 
         # Convert newlines to <br> (outside code blocks)
         # This is simplified - a real implementation would be smarter
@@ -218,19 +230,15 @@ class SessionExporter:
         return content
 
     @staticmethod
-    def export_to_markdown(session: Session, output_path: Path | None = None) -> Path:
-        """Export session to Markdown file.
+    def render_markdown(session: Session) -> str:
+        """Render session as Markdown.
 
         Args:
-            session: Session to export
-            output_path: Output file path
+            session: Session to render
 
         Returns:
-            Path to exported file
+            Markdown document
         """
-        if output_path is None:
-            output_path = Path(f"{session.name}.md")
-
         conversation = session.get_current_conversation()
 
         lines = [
@@ -253,6 +261,22 @@ class SessionExporter:
                 lines.append(f"*{entry.timestamp}*")
                 lines.append("")
 
-        output_path.write_text("\n".join(lines))
+        return "\n".join(lines)
+
+    @staticmethod
+    def export_to_markdown(session: Session, output_path: Path | None = None) -> Path:
+        """Export session to Markdown file.
+
+        Args:
+            session: Session to export
+            output_path: Output file path
+
+        Returns:
+            Path to exported file
+        """
+        if output_path is None:
+            output_path = Path(f"{session.name}.md")
+
+        output_path.write_text(SessionExporter.render_markdown(session))
 
         return output_path
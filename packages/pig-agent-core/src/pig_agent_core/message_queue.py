@@ -1,8 +1,10 @@
 """Message queue for handling messages while agent is working."""
 
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-
-from pydantic import BaseModel
+from heapq import merge
+from itertools import count
 
 
 class MessageType(str, Enum):
@@ -12,7 +14,8 @@ class MessageType(str, Enum):
     FOLLOWUP = "followup"  # Wait until agent completely done
 
 
-class QueuedMessage(BaseModel):
+@dataclass(slots=True)
+class QueuedMessage:
     """A message in the queue."""
 
     content: str
@@ -25,18 +28,29 @@ class MessageQueue:
 
     def __init__(self):
         """Initialize message queue."""
-        self.queue: list[QueuedMessage] = []
+        # One deque per type; entries carry a sequence number so the
+        # overall submission order can be recovered cheaply.
+        self._steering: deque[tuple[int, QueuedMessage]] = deque()
+        self._followup: deque[tuple[int, QueuedMessage]] = deque()
+        self._seq = count()
         self.is_processing = False
         self.steering_mode = "one-at-a-time"  # or "all"
         self.followup_mode = "one-at-a-time"  # or "all"
 
+    @property
+    def queue(self) -> list[QueuedMessage]:
+        """All queued messages in submission order."""
+        return [m for _, m in merge(self._steering, self._followup)]
+
     def add_steering(self, message: str) -> None:
         """Add a steering message (interrupt after current tool).
 
         Args:
             message: Message content
         """
-        self.queue.append(QueuedMessage(content=message, type=MessageType.STEERING))
+        self._steering.append(
+            (next(self._seq), QueuedMessage(content=message, type=MessageType.STEERING))
+        )
 
     def add_followup(self, message: str) -> None:
         """Add a follow-up message (wait until fully done).
@@ -44,7 +58,21 @@ class MessageQueue:
         Args:
             message: Message content
         """
-        self.queue.append(QueuedMessage(content=message, type=MessageType.FOLLOWUP))
+        self._followup.append(
+            (next(self._seq), QueuedMessage(content=message, type=MessageType.FOLLOWUP))
+        )
+
+    @staticmethod
+    def _drain(bucket: deque[tuple[int, QueuedMessage]], mode: str) -> list[QueuedMessage]:
+        """Empty a bucket and return its messages according to mode."""
+        if not bucket:
+            return []
+        if mode == "one-at-a-time":
+            messages = [bucket[0][1]]
+        else:
+            messages = [m for _, m in bucket]
+        bucket.clear()
+        return messages
 
     def get_steering_messages(self) -> list[QueuedMessage]:
         """Get all steering messages and remove from queue.
@@ -52,15 +80,7 @@ class MessageQueue:
         Returns:
             List of steering messages
         """
-        steering = [m for m in self.queue if m.type == MessageType.STEERING]
-
-        # Remove from queue
-        self.queue = [m for m in self.queue if m.type != MessageType.STEERING]
-
-        # Apply mode
-        if self.steering_mode == "one-at-a-time" and steering:
-            return [steering[0]]
-        return steering
+        return self._drain(self._steering, self.steering_mode)
 
     def get_followup_messages(self) -> list[QueuedMessage]:
         """Get all follow-up messages and remove from queue.
@@ -68,15 +88,7 @@ class MessageQueue:
         Returns:
             List of follow-up messages
         """
-        followup = [m for m in self.queue if m.type == MessageType.FOLLOWUP]
-
-        # Remove from queue
-        self.queue = [m for m in self.queue if m.type != MessageType.FOLLOWUP]
-
-        # Apply mode
-        if self.followup_mode == "one-at-a-time" and followup:
-            return [followup[0]]
-        return followup
+        return self._drain(self._followup, self.followup_mode)
 
     def peek(self) -> QueuedMessage | None:
         """Peek at next message without removing.
@@ -84,7 +96,10 @@ class MessageQueue:
         Returns:
             Next message or None
         """
-        return self.queue[0] if self.queue else None
+        steering, followup = self._steering, self._followup
+        if steering and (not followup or steering[0][0] < followup[0][0]):
+            return steering[0][1]
+        return followup[0][1] if followup else None
 
     def clear(self) -> list[QueuedMessage]:
         """Clear all queued messages.
@@ -92,8 +107,9 @@ class MessageQueue:
         Returns:
             List of cleared messages
         """
-        messages = self.queue.copy()
-        self.queue.clear()
+        messages = self.queue
+        self._steering.clear()
+        self._followup.clear()
         return messages
 
     def has_steering(self) -> bool:
@@ -102,7 +118,7 @@ class MessageQueue:
         Returns:
             True if steering messages exist
         """
-        return any(m.type == MessageType.STEERING for m in self.queue)
+        return bool(self._steering)
 
     def has_followup(self) -> bool:
         """Check if there are follow-up messages.
@@ -110,15 +126,15 @@ class MessageQueue:
         Returns:
             True if follow-up messages exist
         """
-        return any(m.type == MessageType.FOLLOWUP for m in self.queue)
+        return bool(self._followup)
 
     def __len__(self) -> int:
         """Get queue length."""
-        return len(self.queue)
+        return len(self._steering) + len(self._followup)
 
     def __bool__(self) -> bool:
         """Check if queue has messages."""
-        return len(self.queue) > 0
+        return bool(self._steering or self._followup)
 
     def get_status(self) -> str:
         """Get queue status string.
@@ -126,11 +142,11 @@ class MessageQueue:
         Returns:
             Status description
         """
-        if not self.queue:
+        if not self:
             return "Queue empty"
 
-        steering = sum(1 for m in self.queue if m.type == MessageType.STEERING)
-        followup = sum(1 for m in self.queue if m.type == MessageType.FOLLOWUP)
+        steering = len(self._steering)
+        followup = len(self._followup)
 
         parts = []
         if steering:
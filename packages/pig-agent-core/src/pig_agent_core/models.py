@@ -1,19 +1,26 @@
 """Data models for agent runtime."""
 
+from dataclasses import asdict, dataclass
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class ToolCall(BaseModel):
+@dataclass(slots=True)
+class ToolCall:
     """Represents a tool call request from LLM."""
 
     id: str
     name: str
     arguments: dict[str, Any]
 
+    def model_dump(self) -> dict[str, Any]:
+        """Return the tool call as a plain dict."""
+        return asdict(self)
 
-class ToolResult(BaseModel):
+
+@dataclass(slots=True)
+class ToolResult:
     """Result of a tool execution."""
 
     tool_call_id: str
@@ -22,18 +29,19 @@ class ToolResult(BaseModel):
     error: str | None = None
     success: bool = True
 
+    def model_dump(self) -> dict[str, Any]:
+        """Return the tool result as a plain dict."""
+        return asdict(self)
+
 
 class AgentState(BaseModel):
     """State of an agent."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="ignore", defer_build=True)
+
     name: str
     system_prompt: str | None = None
     messages: list[dict[str, Any]] = Field(default_factory=list)
     tool_calls: list[ToolCall] = Field(default_factory=list)
     tool_results: list[ToolResult] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
-
-    class Config:
-        """Pydantic config."""
-
-        arbitrary_types_allowed = True
@@ -11,6 +11,8 @@ class ToolRegistry:
     def __init__(self):
         """Initialize tool registry."""
         self._tools: dict[str, Tool] = {}
+        self._schemas_cache: list[dict[str, Any]] | None = None
+        self._last: tuple[str, Tool] | None = None  # Most recently executed tool
 
     def register(self, tool: Tool) -> None:
         """Register a tool.
@@ -19,6 +21,8 @@ class ToolRegistry:
             tool: Tool to register
         """
         self._tools[tool.name] = tool
+        self._schemas_cache = None
+        self._last = None
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name.
@@ -27,6 +31,8 @@ class ToolRegistry:
             name: Tool name to unregister
         """
         self._tools.pop(name, None)
+        self._schemas_cache = None
+        self._last = None
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name.
@@ -53,7 +59,30 @@ class ToolRegistry:
         Returns:
             List of tool schemas for LLM function calling
         """
-        return [tool.to_openai_schema() for tool in self._tools.values()]
+        if self._schemas_cache is None:
+            self._schemas_cache = [tool.to_openai_schema() for tool in self._tools.values()]
+        return list(self._schemas_cache)
+
+    def _lookup(self, name: str) -> Tool:
+        """Resolve a tool for execution, remembering the last one used.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Registered tool
+
+        Raises:
+            KeyError: If tool not found
+        """
+        last = self._last
+        if last is not None and last[0] is name:
+            return last[1]
+        tool = self._tools.get(name)
+        if tool is None:
+            raise KeyError(f"Tool '{name}' not found in registry")
+        self._last = (name, tool)
+        return tool
 
     def execute(self, name: str, **kwargs) -> Any:
         """Execute a tool by name.
@@ -68,9 +97,7 @@ class ToolRegistry:
         Raises:
             KeyError: If tool not found
         """
-        tool = self.get(name)
-        if not tool:
-            raise KeyError(f"Tool '{name}' not found in registry")
+        tool = self._lookup(name)
         return tool.execute(**kwargs)
 
     async def aexecute(self, name: str, **kwargs) -> Any:
@@ -86,9 +113,7 @@ class ToolRegistry:
         Raises:
             KeyError: If tool not found
         """
-        tool = self.get(name)
-        if not tool:
-            raise KeyError(f"Tool '{name}' not found in registry")
+        tool = self._lookup(name)
         return await tool.aexecute(**kwargs)
 
     def __len__(self) -> int:
@@ -8,6 +8,20 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+try:
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        return _orjson_dumps(obj, option=OPT_NON_STR_KEYS)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 
 class SessionEntry(BaseModel):
     """A single entry in the session tree."""
@@ -330,9 +344,9 @@ class Session:
         }
 
         # Write header + tree
-        with open(path, "w") as f:
-            f.write(json.dumps(data) + "\n")
-            f.write(data["tree"])
+        with open(path, "wb") as f:
+            f.write(_dumps(data) + b"\n")
+            f.write(data["tree"].encode())
 
         return path
 
@@ -346,12 +360,12 @@ class Session:
         Returns:
             Loaded session
         """
-        with open(path) as f:
+        with open(path, "rb") as f:
             # Read header
-            header = json.loads(f.readline())
+            header = _loads(f.readline())
 
             # Read tree
-            tree_jsonl = f.read()
+            tree_jsonl = f.read().decode()
 
         # Create session
         session = cls(name=header["name"], workspace=str(path.parent.parent), auto_save=False)
@@ -1,44 +1,160 @@
 """Session manager for listing and selecting sessions."""
 
+import bisect
+import heapq
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _loads
+
+_HEADER_CHUNK = 4096
+
+# Below this many unread headers a thread pool costs more than it saves
+_PARALLEL_HEADER_THRESHOLD = 8
+
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+
+
+def _read_header_line(path: Path) -> bytes:
+    """Read the first line of a session file without a buffered file object.
+
+    Args:
+        path: Path to session file
+
+    Returns:
+        First line as bytes, without the trailing newline
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        buf = os.read(fd, _HEADER_CHUNK)
+        nl = buf.find(b"\n")
+        if nl >= 0:
+            return buf[:nl]
+
+        # Header embeds the session tree, so it can exceed one chunk
+        chunks = [buf]
+        while True:
+            chunk = os.read(fd, _HEADER_CHUNK * 16)
+            if not chunk:
+                return b"".join(chunks)
+            nl = chunk.find(b"\n")
+            if nl >= 0:
+                chunks.append(chunk[:nl])
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _by_mtime(info: "SessionInfo") -> float:
+    return info.mtime
+
+
+def _by_session_id(entry: tuple[str, "SessionInfo"]) -> str:
+    return entry[0]
 
 
 class SessionInfo:
     """Information about a session file."""
 
-    def __init__(self, path: Path):
+    __slots__ = ("path", "name", "mtime", "size", "_modified", "_created", "_header_data")
+
+    def __init__(self, path: Path, stat_result: os.stat_result | None = None):
         """Initialize session info.
 
         Args:
             path: Path to session file
+            stat_result: Pre-fetched stat result (avoids another stat call)
         """
         self.path = path
         self.name = path.stem
-        self.modified = datetime.fromtimestamp(path.stat().st_mtime)
-        self.size = path.stat().st_size
+        st = stat_result if stat_result is not None else path.stat()
+        self.mtime = st.st_mtime
+        self.size = st.st_size
+        self._modified: datetime | None = None
+        self._created: datetime | None = None
+        self._header_data: dict[str, Any] | None = None
+
+    @property
+    def modified(self) -> datetime:
+        """Modification time as a datetime (mtime is the cheap sort key)."""
+        if self._modified is None:
+            self._modified = datetime.fromtimestamp(self.mtime)
+        return self._modified
+
+    @property
+    def _header(self) -> dict[str, Any]:
+        """Session header, read from the first line on first access."""
+        if self._header_data is None:
+            try:
+                header = _loads(_read_header_line(self.path))
+                self._header_data = header if isinstance(header, dict) else {}
+            except Exception:
+                self._header_data = {}
+        return self._header_data
+
+    @property
+    def session_id(self) -> str:
+        """Session UUID from the header (empty if unavailable)."""
+        return str(self._header.get("id", ""))
+
+    @property
+    def session_name(self) -> str:
+        """Session name from the header, falling back to the file stem."""
+        return self._header.get("name", self.name)
+
+    @property
+    def created(self) -> datetime:
+        """Creation time from the header, falling back to modified time."""
+        if self._created is None:
+            try:
+                self._created = datetime.fromisoformat(self._header["created_at"])
+            except (KeyError, TypeError, ValueError):
+                self._created = self.modified
+        return self._created
 
-        # Try to load header for more info
-        try:
-            import json
-
-            with open(path) as f:
-                header = json.loads(f.readline())
-                self.session_name = header.get("name", self.name)
-                self.created = datetime.fromisoformat(header["created_at"])
-                self.entries = header.get("metadata", {}).get("entries", 0)
-        except Exception:
-            self.session_name = self.name
-            self.created = self.modified
-            self.entries = 0
+    @property
+    def entries(self) -> int:
+        """Number of entries recorded in the header metadata."""
+        metadata = self._header.get("metadata") or {}
+        return metadata.get("entries", 0)
 
     def __repr__(self) -> str:
         return f"SessionInfo(name={self.name}, modified={self.modified})"
 
 
+def _prefetch_headers(sessions: list[SessionInfo]) -> None:
+    """Parse unread session headers concurrently.
+
+    Header reads are dominated by open/read syscalls, which release the GIL,
+    so a thread pool overlaps them well.
+
+    Args:
+        sessions: Sessions whose header fields are about to be read
+    """
+    pending = [info for info in sessions if info._header_data is None]
+    if len(pending) <= _PARALLEL_HEADER_THRESHOLD:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+        for _ in executor.map(lambda info: info._header, pending):
+            pass
+
+
 class SessionManager:
     """Manages multiple sessions."""
 
+    __slots__ = ("workspace", "sessions_dir", "_cache", "_name_index", "_id_index")
+
     def __init__(self, workspace: Path | None = None):
         """Initialize session manager.
 
@@ -48,6 +164,51 @@ class SessionManager:
         self.workspace = Path(workspace) if workspace else Path.cwd()
         self.sessions_dir = self.workspace / ".sessions"
 
+        # path -> ((mtime_ns, size), info); entries are reused while unchanged
+        self._cache: dict[str, tuple[tuple[int, int], SessionInfo]] = {}
+        # Lookup indexes, rebuilt lazily after the cache changes
+        self._name_index: dict[str, SessionInfo] | None = None
+        self._id_index: list[tuple[str, SessionInfo]] | None = None
+
+    def _session_entries(self) -> list[os.DirEntry]:
+        """List session file entries in a single scandir pass.
+
+        Returns:
+            DirEntry objects for ``*.jsonl`` files
+        """
+        with os.scandir(self.sessions_dir) as it:
+            return [e for e in it if e.name.endswith(".jsonl") and e.is_file()]
+
+    def _scan(self) -> list[SessionInfo]:
+        """Scan the sessions directory, reusing cached info for unchanged files.
+
+        Returns:
+            Session info for every session file (unsorted)
+        """
+        cache: dict[str, tuple[tuple[int, int], SessionInfo]] = {}
+        changed = False
+
+        for entry in self._session_entries():
+            try:
+                st = entry.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = self._cache.get(entry.path)
+                if cached is not None and cached[0] == key:
+                    info = cached[1]
+                else:
+                    info = SessionInfo(Path(entry.path), st)
+                    changed = True
+                cache[entry.path] = (key, info)
+            except Exception as e:
+                print(f"Warning: Failed to load session info from {entry.path}: {e}")
+
+        if changed or cache.keys() != self._cache.keys():
+            self._name_index = None
+            self._id_index = None
+        self._cache = cache
+
+        return [info for _, info in cache.values()]
+
     def list_sessions(self, limit: int | None = None) -> list[SessionInfo]:
         """List available sessions.
 
@@ -60,20 +221,13 @@ class SessionManager:
         if not self.sessions_dir.exists():
             return []
 
-        sessions = []
-        for session_file in self.sessions_dir.glob("*.jsonl"):
-            try:
-                info = SessionInfo(session_file)
-                sessions.append(info)
-            except Exception as e:
-                print(f"Warning: Failed to load session info from {session_file}: {e}")
-
-        # Sort by modified time (newest first)
-        sessions.sort(key=lambda s: s.modified, reverse=True)
+        sessions = self._scan()
 
+        # Newest first; only the top `limit` need ordering
         if limit:
-            sessions = sessions[:limit]
+            return heapq.nlargest(limit, sessions, key=_by_mtime)
 
+        sessions.sort(key=_by_mtime, reverse=True)
         return sessions
 
     def get_most_recent(self) -> SessionInfo | None:
@@ -82,38 +236,55 @@ class SessionManager:
         Returns:
             Most recent session info or None
         """
-        sessions = self.list_sessions(limit=1)
-        return sessions[0] if sessions else None
+        if not self.sessions_dir.exists():
+            return None
+        return max(self._scan(), key=_by_mtime, default=None)
 
     def find_session(self, name_or_id: str) -> Path | None:
         """Find a session by name or partial ID.
 
+        A file name match wins outright. Otherwise the newest session whose
+        header name equals ``name_or_id`` or whose ID starts with it is used.
+
         Args:
             name_or_id: Session name or partial UUID
 
         Returns:
             Path to session file if found
         """
+        # Exact file name match needs a single stat, no directory scan
+        if name_or_id and "/" not in name_or_id and os.sep not in name_or_id:
+            candidate = self.sessions_dir / f"{name_or_id}.jsonl"
+            if candidate.is_file():
+                return candidate
+
+        # Newest first, so setdefault keeps the newest session per header name
         sessions = self.list_sessions()
 
-        for info in sessions:
-            # Match by name
-            if info.session_name == name_or_id or info.name == name_or_id:
-                return info.path
+        if self._name_index is None:
+            _prefetch_headers(sessions)
+            index: dict[str, SessionInfo] = {}
+            for info in sessions:
+                index.setdefault(info.session_name, info)
+            self._name_index = index
 
-            # Match by partial ID (from header)
-            try:
-                import json
+        best = self._name_index.get(name_or_id)
 
-                with open(info.path) as f:
-                    header = json.loads(f.readline())
-                    session_id = header.get("id", "")
-                    if session_id.startswith(name_or_id):
-                        return info.path
-            except Exception:
-                continue
+        # Partial IDs: every match sits in one contiguous run of the sorted index
+        if self._id_index is None:
+            self._id_index = sorted(
+                ((info.session_id, info) for info in sessions), key=_by_session_id
+            )
 
-        return None
+        ids = self._id_index
+        i = bisect.bisect_left(ids, name_or_id, key=_by_session_id)
+        while i < len(ids) and ids[i][0].startswith(name_or_id):
+            info = ids[i][1]
+            if best is None or info.mtime > best.mtime:
+                best = info
+            i += 1
+
+        return best.path if best is not None else None
 
     def delete_session(self, path: Path) -> bool:
         """Delete a session file.
@@ -126,11 +297,17 @@ class SessionManager:
         """
         try:
             path.unlink()
-            return True
         except Exception as e:
             print(f"Error deleting session: {e}")
             return False
 
+        # Drop the file from the cache and the lookup indexes
+        self._cache.pop(str(path), None)
+        if self._name_index is not None:
+            self._name_index = {k: v for k, v in self._name_index.items() if v.path != path}
+        self._id_index = None
+        return True
+
     def cleanup_old_sessions(self, keep_days: int = 30) -> int:
         """Delete sessions older than specified days.
 
@@ -140,16 +317,32 @@ class SessionManager:
         Returns:
             Number of sessions deleted
         """
-        if not self.sessions_dir.exists():
-            return 0
-
-        cutoff = datetime.now().timestamp() - (keep_days * 24 * 3600)
+        cutoff = time.time() - keep_days * _DAY
         deleted = 0
 
-        for session_file in self.sessions_dir.glob("*.jsonl"):
-            if session_file.stat().st_mtime < cutoff:
-                if self.delete_session(session_file):
+        try:
+            it = os.scandir(self.sessions_dir)
+        except FileNotFoundError:
+            return 0
+
+        with it:
+            for entry in it:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_mtime >= cutoff or not entry.is_file():
+                        continue
+                    os.unlink(entry.path)
                     deleted += 1
+                except OSError as e:
+                    print(f"Error deleting session: {e}")
+                    continue
+                self._cache.pop(entry.path, None)
+
+        if deleted:
+            self._name_index = None
+            self._id_index = None
 
         return deleted
 
@@ -165,34 +358,38 @@ class SessionManager:
         if not sessions:
             return "No sessions found"
 
+        _prefetch_headers(sessions)
+        now = time.time()
         lines = []
         for i, info in enumerate(sessions, 1):
-            age = self._format_age(info.modified)
+            age = self._format_age(info.mtime, now)
             lines.append(f"{i}. {info.session_name:<30} {age:<15} ({info.entries} entries)")
 
         return "\n".join(lines)
 
-    def _format_age(self, dt: datetime) -> str:
+    def _format_age(self, timestamp: float, now: float | None = None) -> str:
         """Format time difference as human-readable string.
 
         Args:
-            dt: Datetime to format
+            timestamp: POSIX timestamp to format
+            now: Current POSIX timestamp (computed if None)
 
         Returns:
             Human-readable age (e.g., "2 hours ago")
         """
-        now = datetime.now()
-        diff = now - dt
-
-        if diff.days > 1:
-            return f"{diff.days} days ago"
-        elif diff.days == 1:
+        if now is None:
+            now = time.time()
+        delta = max(int(now - timestamp), 0)
+        days, seconds = divmod(delta, _DAY)
+
+        if days > 1:
+            return f"{days} days ago"
+        elif days == 1:
             return "yesterday"
-        elif diff.seconds > 3600:
-            hours = diff.seconds // 3600
+        elif seconds > _HOUR:
+            hours = seconds // _HOUR
             return f"{hours} hour{'s' if hours > 1 else ''} ago"
-        elif diff.seconds > 60:
-            minutes = diff.seconds // 60
-            return f"{minutes} min ago"
+        elif seconds > _MINUTE:
+            return f"{seconds // _MINUTE} min ago"
         else:
             return "just now"
@@ -1,10 +1,18 @@
 """Share sessions via GitHub Gist."""
 
-from pathlib import Path
+import json
+from typing import Any
 
 from .export import SessionExporter
 from .session import Session
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
 
 class GistSharer:
     """Share sessions via GitHub Gist."""
@@ -19,6 +27,39 @@ class GistSharer:
                          (get from https://github.com/settings/tokens)
         """
         self.github_token = github_token
+        self._client = None
+
+    def _get_client(self):
+        """Get the pooled HTTP client, creating it on first use.
+
+        Returns:
+            httpx.Client with GitHub auth headers
+        """
+        if self._client is None:
+            # Import lazily so pig_agent_core can be imported without optional share deps.
+            import httpx
+
+            self._client = httpx.Client(
+                headers={
+                    "Authorization": f"token {self.github_token}",
+                    "Accept": "application/vnd.github.v3+json",
+                },
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "GistSharer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def share_session(
         self,
@@ -46,22 +87,12 @@ class GistSharer:
                 "Get token from: https://github.com/settings/tokens"
             )
 
-        # Export session to HTML (in-memory)
-        html_path = Path(f"/tmp/{session.name}.html")
-        SessionExporter.export_to_html(session, html_path, title=session.name)
-        html_content = html_path.read_text()
-        html_path.unlink()  # Clean up
-
-        # Also export as markdown
-        md_path = Path(f"/tmp/{session.name}.md")
-        SessionExporter.export_to_markdown(session, md_path)
-        md_content = md_path.read_text()
-        md_path.unlink()  # Clean up
-
-        # Create gist payload
+        # Render session as HTML and markdown (in-memory)
         files = {
-            f"{session.name}.html": {"content": html_content},
-            f"{session.name}.md": {"content": md_content},
+            f"{session.name}.html": {
+                "content": SessionExporter.render_html(session, title=session.name)
+            },
+            f"{session.name}.md": {"content": SessionExporter.render_markdown(session)},
         }
 
         payload = {
@@ -71,15 +102,12 @@ class GistSharer:
         }
 
         # Create gist
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        # Import lazily so pig_agent_core can be imported without optional share deps.
-        import httpx
-
-        response = httpx.post(self.GIST_API, json=payload, headers=headers, timeout=30)
+        # Encode once to UTF-8 bytes rather than letting httpx re-serialize
+        response = self._get_client().post(
+            self.GIST_API,
+            content=_dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
 
         response.raise_for_status()
 
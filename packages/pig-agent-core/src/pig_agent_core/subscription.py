@@ -1,5 +1,7 @@
 """Subscription login helpers (Claude Pro, ChatGPT Plus, etc.)."""
 
+import os
+
 
 class SubscriptionAuth:
     """Authentication via subscription accounts."""
@@ -79,6 +81,14 @@ class APIKeyManager:
     def __init__(self):
         """Initialize API key manager."""
         self.keys = {}
+        self._env_vars: dict[str, str] = {}
+        self.refresh_env()
+
+    def refresh_env(self) -> None:
+        """Rescan environment variables for ``*_API_KEY`` providers."""
+        self._env_providers = {
+            var[: -len("_API_KEY")].lower() for var in os.environ if var.endswith("_API_KEY")
+        }
 
     def set_key(self, provider: str, api_key: str) -> None:
         """Set API key for a provider.
@@ -102,30 +112,23 @@ class APIKeyManager:
         Returns:
             API key or None
         """
-        import os
-
         # Check stored keys
         if provider in self.keys:
             return self.keys[provider]
 
         # Check environment variables
-        env_var = f"{provider.upper()}_API_KEY"
-        return os.getenv(env_var)
+        env_var = self._env_vars.get(provider)
+        if env_var is None:
+            env_var = self._env_vars[provider] = f"{provider.upper()}_API_KEY"
+        return os.environ.get(env_var)
 
     def list_providers(self) -> list[str]:
         """List providers with API keys.
 
+        Environment providers come from the snapshot taken at construction;
+        call refresh_env() to pick up later changes.
+
         Returns:
             List of provider names
         """
-        import os
-
-        providers = set(self.keys.keys())
-
-        # Check common env vars
-        for var in os.environ:
-            if var.endswith("_API_KEY"):
-                provider = var.replace("_API_KEY", "").lower()
-                providers.add(provider)
-
-        return sorted(providers)
+        return sorted(self.keys.keys() | self._env_providers)
@@ -1,11 +1,39 @@
 """Tool system for agents."""
 
+import functools
 import inspect
+import types
 from collections.abc import Callable
-from typing import Any, get_type_hints
+from typing import Any, Union, get_args, get_origin, get_type_hints
 
 from pydantic import BaseModel, create_model
 
+# Annotations simple enough to check with an exact type() test
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _scalar_types(annotation: Any) -> tuple[type, ...] | None:
+    """Exact types accepted for a scalar annotation, or None if not scalar."""
+    if annotation in _SCALAR_TYPES:
+        return (annotation,)
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = get_args(annotation)
+        if all(a in _SCALAR_TYPES or a is type(None) for a in args):
+            return args
+    return None
+
+
+@functools.cache
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Memoized inspect.signature, keyed by function object."""
+    return inspect.signature(func)
+
+
+@functools.cache
+def _cached_type_hints(func: Callable) -> dict[str, Any]:
+    """Memoized get_type_hints, keyed by function object."""
+    return get_type_hints(func)
+
 
 class Tool:
     """Represents a tool that an agent can use."""
@@ -16,6 +44,7 @@ class Tool:
         name: str | None = None,
         description: str | None = None,
         params_model: type[BaseModel] | None = None,
+        thread_safe: bool = False,
     ):
         """Initialize tool.
 
@@ -24,37 +53,60 @@ class Tool:
             name: Tool name (defaults to function name)
             description: Tool description for LLM
             params_model: Optional Pydantic model for parameters
+            thread_safe: Whether calls may run concurrently with other
+                thread-safe tools (e.g. read-only I/O)
         """
         self.func = func
+        self.thread_safe = thread_safe
         self.name = name or func.__name__
         self.description = description or (func.__doc__ or "").strip()
+        # name -> (accepted types, required); set only for all-scalar signatures
+        self._fast_params: dict[str, tuple[tuple[type, ...], bool]] | None = None
         self.params_model = params_model or self._create_params_model(func)
+        self._openai_schema: dict[str, Any] | None = None
+        self._is_coro = inspect.iscoroutinefunction(func)
 
     def __set_name__(self, owner, name):
-        """Called when the Tool is assigned as a class attribute."""
+        """Called when the Tool is assigned as a class attribute.
+
+        Records the attribute name in ``owner.__tools__`` (inheriting the base
+        class's list) so tool methods can be enumerated without ``dir()``.
+        """
         self._attr_name = name
+        if "__tools__" not in owner.__dict__:
+            owner.__tools__ = list(getattr(owner, "__tools__", ()))
+        if name not in owner.__tools__:
+            owner.__tools__.append(name)
 
     def __get__(self, obj, objtype=None):
         """Descriptor protocol: bind self to the instance when accessed on an object."""
         if obj is None:
             return self
         # Return a bound copy of this Tool
-        import functools
-
         bound = Tool(
             func=functools.partial(self.func, obj),
             name=self.name,
             description=self.description,
             params_model=self.params_model,
+            thread_safe=self.thread_safe,
         )
+        # Bound copies describe the same function; share the rendered schema
+        bound._openai_schema = self.to_openai_schema()
+        bound._fast_params = self._fast_params
         return bound
 
     def _create_params_model(self, func: Callable) -> type[BaseModel]:
         """Create Pydantic model from function signature."""
-        sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
+        try:
+            sig = _cached_signature(func)
+            type_hints = _cached_type_hints(func)
+        except TypeError:
+            # Unhashable callable; introspect without caching
+            sig = inspect.signature(func)
+            type_hints = get_type_hints(func)
 
         fields = {}
+        fast_params = {}
         for param_name, param in sig.parameters.items():
             if param_name == "self":
                 continue
@@ -64,34 +116,74 @@ class Tool:
 
             fields[param_name] = (param_type, default)
 
+            accepted = _scalar_types(param_type)
+            if fast_params is not None:
+                if accepted is None or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                    fast_params = None
+                else:
+                    fast_params[param_name] = (accepted, default is ...)
+
+        self._fast_params = fast_params
+
         return create_model(f"{self.name.title()}Params", **fields)
 
     def to_openai_schema(self) -> dict[str, Any]:
-        """Convert tool to OpenAI function calling schema."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.params_model.model_json_schema(),
-            },
-        }
+        """Convert tool to OpenAI function calling schema.
+
+        The schema is rendered once and cached; treat the result as read-only.
+        """
+        if self._openai_schema is None:
+            self._openai_schema = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.params_model.model_json_schema(),
+                },
+            }
+        return self._openai_schema
+
+    def _fast_args(self, kwargs: dict[str, Any]) -> dict[str, Any] | None:
+        """Pick arguments without pydantic when they already have exact scalar types.
+
+        Returns:
+            Arguments to pass to the function, or None to fall back to validation
+        """
+        fast_params = self._fast_params
+        if fast_params is None:
+            return None
+
+        args = {}
+        for name, (accepted, required) in fast_params.items():
+            if name in kwargs:
+                value = kwargs[name]
+                if type(value) not in accepted:
+                    return None
+                args[name] = value
+            elif required:
+                return None
+        return args
+
+    def _validate(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Validate arguments against the params model."""
+        args = self._fast_args(kwargs)
+        if args is not None:
+            return args
+        # A shallow dict avoids model_dump's recursive copy
+        return dict(self.params_model.model_validate(kwargs))
 
     def execute(self, **kwargs) -> Any:
         """Execute the tool with given arguments."""
         try:
-            # Validate parameters
-            validated = self.params_model(**kwargs)
-            # Execute function
-            return self.func(**validated.model_dump())
+            # Validate parameters, then execute function
+            return self.func(**self._validate(kwargs))
         except Exception as e:
             raise RuntimeError(f"Tool {self.name} failed: {e}") from e
 
     async def aexecute(self, **kwargs) -> Any:
         """Async execute the tool."""
-        if inspect.iscoroutinefunction(self.func):
-            validated = self.params_model(**kwargs)
-            return await self.func(**validated.model_dump())
+        if self._is_coro:
+            return await self.func(**self._validate(kwargs))
         else:
             return self.execute(**kwargs)
 
@@ -106,6 +198,7 @@ def tool(
     name: str | None = None,
     description: str | None = None,
     params_model: type[BaseModel] | None = None,
+    thread_safe: bool = False,
 ) -> Callable:
     """Decorator to create a tool from a function.
 
@@ -125,6 +218,7 @@ def tool(
             name=name,
             description=description,
             params_model=params_model,
+            thread_safe=thread_safe,
         )
 
     if func is None:
@@ -41,6 +41,7 @@ class ToolRegistry:
         self._retries: dict[str, int] = {}  # tool_name -> max_retries
         self._fallbacks: dict[str, list[str]] = {}  # tool_name -> [fallback_tool_names]
         self._confirmed_tools: set[str] = set()  # Write tools that have been confirmed
+        self._schemas_cache: list[dict[str, Any]] | None = None  # Active schemas, sorted
 
     def register(
         self,
@@ -76,6 +77,7 @@ class ToolRegistry:
         with self._lock:
             self._handlers[name] = handler
             self._schemas[name] = schema
+            self._schemas_cache = None
             self._timeouts[name] = timeout
             self._retries[name] = max_retries
 
@@ -147,6 +149,7 @@ class ToolRegistry:
             self._retries.pop(name, None)
             self._fallbacks.pop(name, None)
             self._confirmed_tools.discard(name)
+            self._schemas_cache = None
 
     def register_package(
         self,
@@ -205,9 +208,13 @@ class ToolRegistry:
             List of tool schemas for LLM function calling
         """
         with self._lock:
-            # Always include core tools
-            active_names = self._core_tools | self._discovered
-            return [self._schemas[name] for name in sorted(active_names) if name in self._schemas]
+            if self._schemas_cache is None:
+                # Always include core tools
+                active_names = self._core_tools | self._discovered
+                self._schemas_cache = [
+                    self._schemas[name] for name in sorted(active_names) if name in self._schemas
+                ]
+            return list(self._schemas_cache)
 
     def activate_tools(self, names: list[str]) -> list[str]:
         """Activate deferred tools by name (lazy loading).
@@ -224,7 +231,9 @@ class ToolRegistry:
                 for n in names
                 if n not in self._core_tools and n not in self._discovered and n in self._schemas
             ]
-            self._discovered.update(new)
+            if new:
+                self._discovered.update(new)
+                self._schemas_cache = None
             return new
 
     def confirm_tool(self, name: str) -> None:
@@ -376,6 +385,7 @@ class ToolRegistry:
         if name not in self._core_tools and name not in self._discovered and name in self._schemas:
             with self._lock:
                 self._discovered.add(name)
+                self._schemas_cache = None
 
         # Get handler
         handler = self._handlers.get(name)
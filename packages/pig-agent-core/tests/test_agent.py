@@ -235,3 +235,217 @@ async def test_agent_respond_with_cancellation():
         chunks.append(chunk)
 
     assert chunks == ["Request was cancelled."]
+
+
+def test_agent_response_cache(mock_llm):
+    """Test identical history and tools reuse the cached LLM response."""
+    from pig_llm import Response
+
+    mock_llm.chat = Mock(return_value=Response(content="Hi", model="test-model"))
+    agent = Agent(llm=mock_llm, system_prompt="sys", response_cache_size=2)
+
+    first = agent.run("Hello")
+    agent.clear_history()
+    second = agent.run("Hello")
+
+    assert first is second
+    assert mock_llm.chat.call_count == 1
+
+    agent.run("Something else")
+    assert mock_llm.chat.call_count == 2
+
+
+def test_agent_response_cache_keyed_by_model(mock_llm):
+    """Test switching model or temperature misses the response cache."""
+    from pig_llm import Response
+
+    mock_llm.config = Mock(model="model-a", temperature=0.0)
+    mock_llm.chat = Mock(return_value=Response(content="Hi", model="model-a"))
+    agent = Agent(llm=mock_llm, system_prompt="sys", response_cache_size=4)
+
+    agent.run("Hello")
+    agent.clear_history()
+    mock_llm.config.model = "model-b"
+    agent.run("Hello")
+    agent.clear_history()
+    mock_llm.config.temperature = 0.7
+    agent.run("Hello")
+    agent.clear_history()
+    agent.run("Hello")
+
+    assert mock_llm.chat.call_count == 3
+
+
+def _tool_call_response(*calls):
+    from pig_llm import Response
+
+    return Response(
+        content="",
+        model="test-model",
+        tool_calls=[
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": name, "arguments": args},
+            }
+            for i, (name, args) in enumerate(calls)
+        ],
+    )
+
+
+def test_agent_run_executes_tools(mock_llm):
+    """Test run() executes sync tools and feeds results back."""
+    from pig_llm import Response
+
+    @tool
+    def double(x: int) -> int:
+        return x * 2
+
+    mock_llm.chat = Mock(
+        side_effect=[
+            _tool_call_response(("double", '{"x": 21}')),
+            Response(content="Done", model="test-model"),
+        ]
+    )
+    agent = Agent(llm=mock_llm, tools=[double])
+
+    assert agent.run("Go").content == "Done"
+    tool_msg = agent.history[-2]
+    assert tool_msg.role == "tool"
+    assert tool_msg.content == "42"
+
+
+def test_agent_run_parallel_tools_keeps_order(mock_llm):
+    """Test thread-safe tool calls run concurrently but report in order."""
+    import threading
+
+    from pig_llm import Response
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    @tool(thread_safe=True)
+    def slow(n: int) -> int:
+        barrier.wait()  # only passes if all three calls run at once
+        return n
+
+    mock_llm.chat = Mock(
+        side_effect=[
+            _tool_call_response(("slow", '{"n": 1}'), ("slow", '{"n": 2}'), ("slow", '{"n": 3}')),
+            Response(content="Done", model="test-model"),
+        ]
+    )
+    ended = []
+    agent = Agent(
+        llm=mock_llm,
+        tools=[slow],
+        parallel_tools=3,
+        on_tool_end=lambda name, result: ended.append(result),
+    )
+
+    agent.run("Go")
+
+    tool_msgs = [m for m in agent.history if m.role == "tool"]
+    assert [m.content for m in tool_msgs] == ["1", "2", "3"]
+    assert [m.metadata["tool_call_id"] for m in tool_msgs] == ["call_0", "call_1", "call_2"]
+    assert ended == [1, 2, 3]
+
+
+def test_agent_run_unsafe_tools_stay_sequential(mock_llm):
+    """Test tools not marked thread_safe never run in the pool."""
+    import threading
+
+    from pig_llm import Response
+
+    threads = set()
+
+    @tool
+    def record() -> str:
+        threads.add(threading.get_ident())
+        return "ok"
+
+    mock_llm.chat = Mock(
+        side_effect=[
+            _tool_call_response(("record", "{}"), ("record", "{}")),
+            Response(content="Done", model="test-model"),
+        ]
+    )
+    agent = Agent(llm=mock_llm, tools=[record], parallel_tools=4)
+    agent.run("Go")
+
+    assert threads == {threading.get_ident()}
+
+
+def test_agent_stream_runs_tool_loop(mock_llm):
+    """Test stream() yields text as it arrives and executes streamed tool calls."""
+    from pig_llm import StreamChunk
+
+    @tool
+    def double(x: int) -> int:
+        return x * 2
+
+    function = {"name": "double", "arguments": '{"x": 2}'}
+    tool_calls = [{"id": "call_0", "type": "function", "function": function}]
+    mock_llm.streams_tool_calls = True
+    mock_llm.chat_stream = Mock(
+        side_effect=[
+            iter(
+                [
+                    StreamChunk(content="Checking"),
+                    StreamChunk(
+                        content="", finish_reason="tool_calls", metadata={"tool_calls": tool_calls}
+                    ),
+                ]
+            ),
+            iter([StreamChunk(content="It is "), StreamChunk(content="4")]),
+        ]
+    )
+    agent = Agent(llm=mock_llm, tools=[double])
+
+    chunks = list(agent.stream("Double 2"))
+
+    assert chunks == ["Checking", "\n", "It is ", "4"]
+    assert [m.role for m in agent.history] == ["user", "assistant", "tool", "assistant"]
+    assert agent.history[2].content == "4"
+    assert agent.history[-1].content == "It is 4"
+
+
+def test_agent_stream_falls_back_without_tool_streaming(mock_llm):
+    """Test stream() uses run() when the LLM cannot stream tool calls."""
+    from pig_llm import Response
+
+    @tool
+    def noop() -> None:
+        return None
+
+    mock_llm.streams_tool_calls = False
+    mock_llm.chat = Mock(return_value=Response(content="Hi", model="test-model"))
+    mock_llm.chat_stream = Mock()
+    agent = Agent(llm=mock_llm, tools=[noop])
+
+    assert list(agent.stream("Hello")) == ["Hi"]
+    mock_llm.chat_stream.assert_not_called()
+
+
+def test_agent_history_supports_slicing_providers(mock_llm, monkeypatch):
+    """Test history reaches providers as a list they can slice (e.g. Cohere)."""
+    import sys
+    import types
+
+    from pig_llm import Config, Response
+
+    stub = types.ModuleType("cohere")
+    stub.Client = stub.AsyncClient = Mock
+    monkeypatch.setitem(sys.modules, "cohere", stub)
+    monkeypatch.delitem(sys.modules, "pig_llm.providers.cohere", raising=False)
+    from pig_llm.providers.cohere import CohereProvider
+
+    provider = CohereProvider(Config(provider="cohere", api_key="test"))
+
+    def chat(messages, **kwargs):
+        preamble, final_message, _ = provider._convert_messages(messages)
+        return Response(content=f"{preamble}:{final_message}", model="test-model")
+
+    mock_llm.chat = Mock(side_effect=chat)
+    agent = Agent(llm=mock_llm, system_prompt="sys")
+
+    assert agent.run("Hello").content == "sys:Hello"
@@ -131,3 +131,18 @@ def test_find_context_files_hierarchy(temp_workspace):
 
     # Should find both
     assert len(files) >= 2
+
+
+def test_build_system_prompt_cached_until_files_change(temp_workspace):
+    """Test the rendered prompt is reused until a context file changes."""
+    ctx = ContextManager(temp_workspace)
+    agents_md = temp_workspace / "AGENTS.md"
+    agents_md.write_text("First")
+
+    first = ctx.build_system_prompt("Default prompt")
+    assert ContextManager(temp_workspace).build_system_prompt("Default prompt") is first
+
+    agents_md.write_text("Second version")
+    updated = ctx.build_system_prompt("Default prompt")
+    assert "Second version" in updated
+    assert "First" not in updated
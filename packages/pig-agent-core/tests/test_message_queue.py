@@ -181,3 +181,16 @@ def test_queue_has_methods():
     queue.add_followup("F")
     assert queue.has_steering()
     assert queue.has_followup()
+
+
+def test_queue_preserves_submission_order():
+    """Test peek and clear follow submission order across types."""
+    queue = MessageQueue()
+
+    queue.add_followup("F1")
+    queue.add_steering("S1")
+    queue.add_followup("F2")
+
+    assert queue.peek().content == "F1"
+    assert [m.content for m in queue.queue] == ["F1", "S1", "F2"]
+    assert [m.content for m in queue.clear()] == ["F1", "S1", "F2"]
@@ -95,6 +95,30 @@ def test_registry_execute():
     assert result == 8
 
 
+def test_registry_execute_after_reregister():
+    """Test repeated execution picks up a re-registered tool."""
+
+    @tool(name="op")
+    def add(x: int, y: int) -> int:
+        return x + y
+
+    @tool(name="op")
+    def mul(x: int, y: int) -> int:
+        return x * y
+
+    registry = ToolRegistry()
+    registry.register(add)
+    assert registry.execute("op", x=2, y=3) == 5
+    assert registry.execute("op", x=2, y=3) == 5
+
+    registry.register(mul)
+    assert registry.execute("op", x=2, y=3) == 6
+
+    registry.unregister("op")
+    with pytest.raises(KeyError):
+        registry.execute("op", x=2, y=3)
+
+
 def test_registry_execute_missing():
     """Test executing non-existent tool."""
     registry = ToolRegistry()
@@ -123,6 +147,28 @@ def test_registry_get_schemas():
     assert all(s["type"] == "function" for s in schemas)
 
 
+def test_registry_get_schemas_invalidated():
+    """Test schema cache is rebuilt after register/unregister."""
+
+    @tool
+    def tool1(x: int) -> int:
+        return x
+
+    @tool
+    def tool2(x: int) -> int:
+        return x
+
+    registry = ToolRegistry()
+    registry.register(tool1)
+    assert [s["function"]["name"] for s in registry.get_schemas()] == ["tool1"]
+
+    registry.register(tool2)
+    assert [s["function"]["name"] for s in registry.get_schemas()] == ["tool1", "tool2"]
+
+    registry.unregister("tool1")
+    assert [s["function"]["name"] for s in registry.get_schemas()] == ["tool2"]
+
+
 def test_registry_iteration():
     """Test iterating over registry."""
 
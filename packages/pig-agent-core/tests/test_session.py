@@ -168,6 +168,17 @@ def test_session_save_load(tmp_path):
     assert len(loaded.tree.entries) == 2
 
 
+def test_session_save_load_unicode(tmp_path):
+    """Test non-ASCII content and metadata survive a save/load round trip."""
+    session = Session(name="unicode", workspace=str(tmp_path), auto_save=False)
+    session.metadata["title"] = "café ☕"
+    session.add_message("user", "héllo 世界")
+
+    loaded = Session.load(session.save())
+    assert loaded.metadata["title"] == "café ☕"
+    assert [e.content for e in loaded.get_current_conversation()] == ["héllo 世界"]
+
+
 def test_session_get_info():
     """Test getting session info."""
     session = Session(name="test", auto_save=False)
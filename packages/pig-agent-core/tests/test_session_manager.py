@@ -30,6 +30,17 @@ def test_session_info_creation(temp_workspace):
     assert info.path == path
 
 
+def test_session_info_uses_stat_result(temp_workspace):
+    """Test session info reuses a pre-fetched stat result."""
+    session = Session(name="test", workspace=str(temp_workspace), auto_save=False)
+    path = session.save()
+
+    st = path.stat()
+    info = SessionInfo(path, st)
+    assert info.size == st.st_size
+    assert info.modified == datetime.fromtimestamp(st.st_mtime)
+
+
 def test_session_manager_creation(temp_workspace):
     """Test creating session manager."""
     mgr = SessionManager(temp_workspace)
@@ -122,6 +133,99 @@ def test_session_manager_find_by_name(temp_workspace):
     assert found == path
 
 
+def test_session_manager_find_by_partial_id(temp_workspace):
+    """Test finding session by partial ID from the header."""
+    session = Session(name="custom", workspace=str(temp_workspace), auto_save=False)
+    path = session.save()
+
+    mgr = SessionManager(temp_workspace)
+    found = mgr.find_session(session.id[:8])
+
+    assert found == path
+
+
+def test_session_info_header_fields(temp_workspace):
+    """Test header fields are parsed on access."""
+    session = Session(name="header", workspace=str(temp_workspace), auto_save=False)
+    path = session.save()
+
+    info = SessionInfo(path)
+    assert info.session_name == "header"
+    assert info.session_id == session.id
+    assert info.created == session.created_at
+
+
+def test_session_info_large_header(temp_workspace):
+    """Test header parsing when the first line exceeds one read chunk."""
+    session = Session(name="big", workspace=str(temp_workspace), auto_save=False)
+    for i in range(50):
+        session.add_message("user", f"Message {i} " + "x" * 200)
+    path = session.save()
+
+    info = SessionInfo(path)
+    assert info.session_name == "big"
+    assert info.created == session.created_at
+
+
+def test_session_manager_reuses_unchanged_info(temp_workspace):
+    """Test session info is cached until the file changes."""
+    session = Session(name="cached", workspace=str(temp_workspace), auto_save=False)
+    path = session.save()
+
+    mgr = SessionManager(temp_workspace)
+    first = mgr.list_sessions()[0]
+    assert mgr.list_sessions()[0] is first
+
+    session.add_message("user", "Hello")
+    session.save(path)
+
+    refreshed = mgr.list_sessions()[0]
+    assert refreshed is not first
+    assert mgr.find_session(session.id[:8]) == path
+
+
+def test_session_manager_find_many_sessions(temp_workspace):
+    """Test lookups when headers are parsed in parallel."""
+    sessions = []
+    for i in range(12):
+        session = Session(name=f"s{i}", workspace=str(temp_workspace), auto_save=False)
+        session.save()
+        sessions.append(session)
+
+    mgr = SessionManager(temp_workspace)
+    target = sessions[7]
+
+    assert mgr.find_session(target.id[:8]) == temp_workspace / ".sessions" / "s7.jsonl"
+    assert "s7" in mgr.format_session_list(mgr.list_sessions())
+
+
+def test_session_manager_find_prefers_newest_match(temp_workspace):
+    """Test ambiguous names and partial IDs resolve to the newest session."""
+    import json
+    import os
+
+    sessions_dir = temp_workspace / ".sessions"
+    sessions_dir.mkdir(exist_ok=True)
+
+    def write(file_name, session_id, name, mtime):
+        path = sessions_dir / f"{file_name}.jsonl"
+        path.write_text(json.dumps({"id": session_id, "name": name}) + "\n")
+        os.utime(path, (mtime, mtime))
+        return path
+
+    write("a", "abc-1", "first", 1_000)
+    newest = write("b", "abc-2", "second", 3_000)
+    write("c", "zzz-9", "abc", 2_000)
+
+    mgr = SessionManager(temp_workspace)
+    # Both ids share the prefix; the newer one wins, not the smaller id
+    assert mgr.find_session("abc-") == newest
+    # A header name match on an older session loses to a newer id-prefix match
+    assert mgr.find_session("abc") == newest
+    # File names still win outright
+    assert mgr.find_session("c") == sessions_dir / "c.jsonl"
+
+
 def test_session_manager_find_missing(temp_workspace):
     """Test finding non-existent session."""
     mgr = SessionManager(temp_workspace)
@@ -159,6 +263,18 @@ def test_session_manager_format_list(temp_workspace):
     assert "ago" in formatted or "just now" in formatted
 
 
+def test_session_manager_format_age():
+    """Test age formatting thresholds."""
+    mgr = SessionManager()
+    now = 1_000_000_000.0
+
+    assert mgr._format_age(now - 30, now) == "just now"
+    assert mgr._format_age(now - 5 * 60, now) == "5 min ago"
+    assert mgr._format_age(now - 2 * 3600 - 1, now) == "2 hours ago"
+    assert mgr._format_age(now - 86400 - 10, now) == "yesterday"
+    assert mgr._format_age(now - 3 * 86400, now) == "3 days ago"
+
+
 def test_session_manager_format_empty():
     """Test formatting empty list."""
     mgr = SessionManager()
@@ -167,6 +283,19 @@ def test_session_manager_format_empty():
     assert "No sessions" in formatted
 
 
+def test_session_manager_find_after_delete(temp_workspace):
+    """Test deleted sessions drop out of the lookup index."""
+    session = Session(name="gone", workspace=str(temp_workspace), auto_save=False)
+    path = session.save()
+
+    mgr = SessionManager(temp_workspace)
+    assert mgr.find_session(session.id[:8]) == path
+
+    assert mgr.delete_session(path)
+    assert mgr.find_session(session.id[:8]) is None
+    assert mgr.find_session("gone") is None
+
+
 def test_session_manager_cleanup_old(temp_workspace):
     """Test cleaning up old sessions."""
     # Create old session (mock by setting mtime)
@@ -185,3 +314,30 @@ def test_session_manager_cleanup_old(temp_workspace):
 
     assert deleted == 1
     assert not path.exists()
+
+
+def test_session_manager_cleanup_evicts_cache(temp_workspace):
+    """Test cleanup drops deleted sessions from the lookup cache."""
+    import os
+
+    session = Session(name="stale", workspace=str(temp_workspace), auto_save=False)
+    path = session.save()
+
+    mgr = SessionManager(temp_workspace)
+    assert mgr.find_session("stale") == path
+
+    old_time = (datetime.now() - timedelta(days=40)).timestamp()
+    os.utime(path, (old_time, old_time))
+
+    assert mgr.cleanup_old_sessions(keep_days=30) == 1
+    assert mgr.find_session("stale") is None
+    assert mgr.cleanup_old_sessions(keep_days=30) == 0
+
+
+def test_session_manager_cleanup_missing_dir(tmp_path):
+    """Test cleanup is a no-op when the sessions directory is gone."""
+    import shutil
+
+    mgr = SessionManager(tmp_path)
+    shutil.rmtree(mgr.sessions_dir, ignore_errors=True)
+    assert mgr.cleanup_old_sessions() == 0
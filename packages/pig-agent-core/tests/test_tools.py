@@ -2,6 +2,7 @@
 
 import pytest
 from pig_agent_core.tools import Tool, tool
+from pydantic import BaseModel
 
 
 def test_tool_creation():
@@ -90,6 +91,70 @@ def test_tool_openai_schema():
     assert "parameters" in schema["function"]
 
 
+def test_tool_openai_schema_cached():
+    """Test schema is rendered once and shared with bound copies."""
+
+    class Calculator:
+        @tool
+        def add(self, x: int, y: int = 0) -> int:
+            return x + y
+
+    schema = Calculator.add.to_openai_schema()
+    assert Calculator.add.to_openai_schema() is schema
+    assert Calculator().add.to_openai_schema() is schema
+
+
+def test_tool_registers_names_on_owner():
+    """Test @tool methods are listed in the owning class's __tools__."""
+
+    class Base:
+        @tool
+        def first(self) -> str:
+            return "a"
+
+    class Child(Base):
+        @tool
+        def second(self) -> str:
+            return "b"
+
+        def helper(self) -> str:
+            return "c"
+
+    assert Base.__tools__ == ["first"]
+    assert Child.__tools__ == ["first", "second"]
+    assert [getattr(Child(), name)() for name in Child.__tools__] == ["a", "b"]
+
+
+def test_tool_execute_nested_model():
+    """Test nested model parameters arrive as validated model instances."""
+
+    class Point(BaseModel):
+        x: int
+        y: int
+
+    @tool
+    def norm(point: Point) -> int:
+        return abs(point.x) + abs(point.y)
+
+    assert norm.execute(point={"x": 3, "y": -4}) == 7
+
+
+def test_tool_execute_scalar_fast_path():
+    """Test scalar tools skip validation only for exactly-typed arguments."""
+
+    @tool
+    def repeat(text: str, times: int = 2, sep: str | None = None) -> str:
+        return (sep or "").join([text] * times)
+
+    assert repeat._fast_params is not None
+    assert repeat.execute(text="ab", times=3) == "ababab"
+    # Coercion still goes through pydantic
+    assert repeat.execute(text="ab", times="2", sep="-") == "ab-ab"
+
+    with pytest.raises(RuntimeError):
+        repeat.execute(times=2)
+
+
 def test_tool_callable():
     """Test that tool is callable."""
 
@@ -1,7 +1,11 @@
 """Interactive coding agent CLI."""
 
-from .agent import CodingAgent
-from .tools import CodeTools, FileTools, ShellTools
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import CodingAgent
+    from .tools import CodeTools, FileTools, ShellTools
 
 __version__ = "0.0.1"
 
@@ -11,3 +15,21 @@ __all__ = [
     "CodeTools",
     "ShellTools",
 ]
+
+# Exports resolved on first access, so `pig-code --help` and other entry points
+# that never build an agent skip importing pig_agent_core, pig_llm and pig_tui.
+_LAZY_EXPORTS = {
+    "CodingAgent": ".agent",
+    "FileTools": ".tools",
+    "CodeTools": ".tools",
+    "ShellTools": ".tools",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
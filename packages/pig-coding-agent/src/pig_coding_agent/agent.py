@@ -11,7 +11,6 @@ from pig_agent_core import (
     SessionManager,
     SkillManager,
 )
-from pig_agent_core.tools import Tool
 from pig_llm import LLM
 from pig_tui import ChatUI, InteractivePrompt
 
@@ -20,6 +19,93 @@ from .file_reference import FileReferenceParser
 from .resilience import create_profile_manager_from_env, get_profile_status
 from .tools import CodeTools, FileTools, ShellTools
 
+# Slash-command help panels, built once at import
+_QUICK_HELP_TEXT = """
+**Available Commands:**
+
+/help       - Show this help
+/exit       - Exit the agent
+/clear      - Clear conversation
+/files      - List files in workspace
+/status     - Show agent status
+
+**Tools Available:**
+- read_file, write_file, list_files
+- generate_code, explain_code
+- run_command, git_status, git_diff
+            """
+
+_HELP_TEXT = """
+**Built-in Commands:**
+
+/help       - Show this help
+/exit       - Exit agent
+/clear      - Clear conversation
+/status     - Agent status
+/config     - Show configuration
+/queue      - Show message queue
+/files      - List workspace files
+
+**Session Management:**
+
+/session    - Show current session info
+/sessions   - List all available sessions
+/tree       - Show conversation tree
+/fork [name] - Fork session from current point
+/compact [instructions] - Compact old messages
+/export [file] - Export session to HTML
+/share      - Share session via GitHub Gist
+/reload     - Reload extensions, skills, prompts, context
+
+**Skills & Extensions:**
+
+/skills     - List available skills
+/skill:name - Invoke a skill
+/extensions - List loaded extensions
+/prompts    - List prompt templates
+/template   - Expand a template
+
+**Model & Auth:**
+
+/model [provider/model] - Switch LLM model
+/login      - OAuth login (subscription accounts)
+/logout <provider> - Logout from provider
+
+**Context Files:**
+
+• AGENTS.md - Project instructions (auto-loaded)
+• SYSTEM.md - Override system prompt
+• APPEND_SYSTEM.md - Append to system prompt
+
+**Message Queue:**
+
+While agent is working, you can queue messages:
+  !message     - Steering (interrupt after current tool)
+  >>message    - Follow-up (wait until agent finishes)
+
+Use /queue to see queued messages.
+
+**File References:**
+
+Use @filename to auto-include file contents:
+  @src/main.py - Include main.py in your message
+  @README.md - Include README
+  @test.py and @utils.py - Multiple files
+
+Files are automatically read and added to context!
+
+**Features:**
+
+• Sessions auto-save to .sessions/
+• Extensions auto-load from .agents/extensions/
+• Skills auto-discover from .agents/skills/
+• Prompts auto-load from .agents/prompts/
+• Context auto-load from AGENTS.md, SYSTEM.md
+• Use /tree to navigate conversation history
+• Use /fork to create alternate branches
+• Queue messages with ! or >>
+        """
+
 
 class CodingAgent:
     """Interactive coding agent with file and code tools."""
@@ -35,6 +121,7 @@ class CodingAgent:
         enable_skills: bool = True,
         enable_resilience: bool = True,
         enable_cost_tracking: bool = True,
+        parallel_tools: int = 4,
     ):
         """Initialize coding agent.
 
@@ -48,6 +135,7 @@ class CodingAgent:
             enable_skills: Enable skills system
             enable_resilience: Enable resilience (API key rotation, fallback)
             enable_cost_tracking: Enable cost tracking
+            parallel_tools: Max read-only tool calls from one response to run concurrently
         """
         self.workspace = Path(workspace).resolve()
         self.llm = llm or LLM()
@@ -81,19 +169,20 @@ class CodingAgent:
 
         # Initialize tools
         file_tools = FileTools(str(self.workspace))
+        self.file_tools = file_tools
         code_tools = CodeTools()
         shell_tools = ShellTools()
 
-        # Get all tool methods (descriptor protocol auto-binds self)
-        tools = []
-        for tool_instance in [file_tools, code_tools, shell_tools]:
-            for attr_name in dir(tool_instance):
-                attr = getattr(tool_instance, attr_name)
-                if isinstance(attr, Tool):
-                    tools.append(attr)
+        # Bind each class's @tool methods (descriptor protocol auto-binds self)
+        tools = [
+            getattr(tool_instance, name)
+            for tool_instance in (file_tools, code_tools, shell_tools)
+            for name in tool_instance.__tools__
+        ]
 
         # Initialize context manager (needed by _get_system_prompt)
         self.context_manager = ContextManager(self.workspace)
+        self._system_prompt: str | None = None
 
         # Initialize skill manager
         self.skill_manager = None
@@ -112,6 +201,7 @@ class CodingAgent:
             verbose=verbose,
             profile_manager=self.profile_manager,
             billing_hook=self.cost_tracker,
+            parallel_tools=parallel_tools,
         )
 
         # Initialize extension manager
@@ -132,6 +222,9 @@ class CodingAgent:
         # Create UI
         self.ui = ChatUI(title="Coding Agent", show_timestamps=False)
 
+        # Gist sharer, created on first /share and reused for keep-alive
+        self._gist_sharer = None
+
     def _load_extensions(self):
         """Load extensions from standard directories."""
         if not self.extension_manager:
@@ -148,8 +241,21 @@ class CodingAgent:
             if path.exists():
                 self.extension_manager.load_from_directory(path)
 
-    def _get_system_prompt(self) -> str:
-        """Get system prompt for coding agent."""
+    def _get_system_prompt(self, refresh: bool = False) -> str:
+        """Get system prompt for coding agent.
+
+        The prompt is built once and reused; ``refresh`` rebuilds it after
+        context files, skills or prompts change (``/reload``).
+
+        Args:
+            refresh: Rebuild instead of returning the cached prompt
+
+        Returns:
+            System prompt text
+        """
+        if self._system_prompt is not None and not refresh:
+            return self._system_prompt
+
         # Default prompt
         default_prompt = f"""\
 You are an expert coding assistant with access to file operations and code generation tools.
@@ -174,6 +280,7 @@ When generating code, provide clean, well-documented, production-ready code.
             skills_prompt = self.skill_manager.get_all_skills_prompt()
             prompt += f"\n\n{skills_prompt}"
 
+        self._system_prompt = prompt
         return prompt
 
     # Base slash commands for tab completion
@@ -289,15 +396,12 @@ When generating code, provide clean, well-documented, production-ready code.
                 self.ui.user(user_input[:200] + "..." if len(user_input) > 200 else user_input)
 
                 # Get agent response (with queue support)
-                response = self.agent.run(user_input)
-
-                # Display response
-                self.ui.assistant(response.content)
+                content = self._stream_response(user_input)
 
                 # Add to session
                 if self.session:
                     self.session.add_message("user", user_input)
-                    self.session.add_message("assistant", response.content)
+                    self.session.add_message("assistant", content)
 
         except KeyboardInterrupt:
             pass
@@ -309,148 +413,104 @@ When generating code, provide clean, well-documented, production-ready code.
                     self.ui.system(f"\nCleared {len(cleared)} queued messages")
             self.ui.system("\nGoodbye!")
 
+    def _stream_response(self, message: str) -> str:
+        """Display the agent's response to a message as it is generated.
+
+        Ctrl-C stops the current response, not the session.
+
+        Args:
+            message: User message
+
+        Returns:
+            Response text shown (partial if interrupted)
+        """
+        parts = []
+        try:
+            with self.ui.assistant_stream() as sink:
+                for chunk in self.agent.stream(message):
+                    sink.write(chunk)
+                    parts.append(chunk)
+        except KeyboardInterrupt:
+            self.ui.system("Response interrupted")
+        return "".join(parts)
+
     def _handle_command(self, command: str) -> None:
         """Handle slash commands.
 
         Args:
             command: Command string
         """
-        cmd = command.lower().strip()
-
-        if cmd == "/exit" or cmd == "/quit":
-            raise KeyboardInterrupt()
-
-        elif cmd == "/clear":
-            self.agent.clear_history()
-            self.ui.clear()
-            self.ui.system("Conversation cleared")
-
-        elif cmd == "/help":
-            self.ui.panel(
-                """
-**Available Commands:**
-
-/help       - Show this help
-/exit       - Exit the agent
-/clear      - Clear conversation
-/files      - List files in workspace
-/status     - Show agent status
-
-**Tools Available:**
-- read_file, write_file, list_files
-- generate_code, explain_code
-- run_command, git_status, git_diff
-            """,
-                title="Help",
-            )
-
-        elif cmd == "/files":
-            files = FileTools(str(self.workspace)).list_files()
-            self.ui.panel(files, title="Files")
-
-        elif cmd == "/status":
-            self.ui.panel(
-                f"""
-**Agent Status**
-
-Model: {self.agent.llm.config.model}
-Workspace: {self.workspace}
-Messages: {len(self.agent.history)}
-Tools: {len(self.agent.registry)}
-            """,
-                title="Status",
-            )
-
-        elif cmd.startswith("/tree"):
-            self._show_tree()
-
-        elif cmd.startswith("/fork"):
-            parts = cmd.split(maxsplit=1)
-            fork_name = parts[1] if len(parts) > 1 else None
-            self._fork_session(fork_name)
-
-        elif cmd.startswith("/compact"):
-            parts = cmd.split(maxsplit=1)
-            instructions = parts[1] if len(parts) > 1 else None
-            self._compact_session(instructions)
-
-        elif cmd.startswith("/session"):
-            self._show_session_info()
-
-        elif cmd.startswith("/sessions"):
-            self._list_sessions()
-
-        elif cmd.startswith("/skill:"):
-            skill_name = cmd.split(":", 1)[1]
-            self._invoke_skill(skill_name)
-
-        elif cmd.startswith("/skills"):
-            self._list_skills()
-
-        elif cmd.startswith("/extensions"):
-            self._list_extensions()
-
-        elif cmd.startswith("/prompts"):
-            self._list_prompts()
-
-        elif cmd.startswith("/reload"):
-            self._reload_resources()
-
-        elif cmd.startswith("/config"):
-            self._show_config()
-
-        elif cmd.startswith("/queue"):
-            self._show_queue()
-
-        elif cmd.startswith("/export"):
-            parts = cmd.split(maxsplit=1)
-            filename = parts[1] if len(parts) > 1 else None
-            self._export_session(filename)
-
-        elif cmd.startswith("/share"):
-            self._share_session()
-
-        elif cmd.startswith("/model"):
-            parts = cmd.split(maxsplit=1)
-            new_model = parts[1] if len(parts) > 1 else None
-            self._switch_model(new_model)
-
-        elif cmd.startswith("/login"):
-            self._login()
-
-        elif cmd.startswith("/logout"):
-            parts = cmd.split(maxsplit=1)
-            provider = parts[1] if len(parts) > 1 else None
-            self._logout(provider)
+        # Only the command word is case-insensitive; arguments (file names,
+        # model names, template variables) keep their case
+        head, _, rest = command.strip().partition(" ")
+        name = head.lower()
+        args = rest.strip() or None
+
+        entry = self._COMMANDS.get(name)
+        if entry is not None:
+            handler, takes_args = entry
+            if takes_args:
+                handler(self, args)
+            else:
+                handler(self)
+            return
 
-        elif cmd.startswith("/resilience"):
-            self._show_resilience_status()
+        if name.startswith("/skill:"):
+            self._invoke_skill(name.split(":", 1)[1])
+            return
 
-        elif cmd.startswith("/cost") or cmd.startswith("/usage"):
-            self._show_cost_summary()
+        if name.startswith("/"):
+            command_name = name[1:]
 
-        elif cmd.startswith("/"):
             # Check if it's a prompt template
-            template_name = cmd.lstrip("/").split()[0]
-            if self.prompt_manager and template_name in self.prompt_manager:
-                # Extract variables from rest of command
-                args_str = cmd.split(maxsplit=1)[1] if " " in cmd else ""
-                self._expand_prompt(template_name, args_str)
+            if self.prompt_manager and command_name in self.prompt_manager:
+                self._expand_prompt(command_name, args or "")
                 return
 
             # Try extension commands
             if self.extension_manager:
-                ext_cmd = cmd.lstrip("/").split()[0]
-                cmd_args = cmd.split(maxsplit=1)[1] if " " in cmd else None
                 try:
-                    result = self.extension_manager.handle_command(ext_cmd, cmd_args)
-                    self.ui.panel(str(result), title=f"/{ext_cmd}")
+                    result = self.extension_manager.handle_command(command_name, args)
+                    self.ui.panel(str(result), title=f"/{command_name}")
                     return
                 except (ValueError, KeyError):
                     pass
 
             self.ui.error(f"Unknown command: {command}")
 
+    def _exit(self):
+        """Leave the interactive loop."""
+        raise KeyboardInterrupt()
+
+    def _clear(self):
+        """Clear conversation history."""
+        self.agent.clear_history()
+        self.ui.clear()
+        self.ui.system("Conversation cleared")
+
+    def _show_quick_help(self):
+        """Show the short command list."""
+        self.ui.panel(_QUICK_HELP_TEXT, title="Help")
+
+    def _show_files(self):
+        """List files in the workspace."""
+        files = self.file_tools.list_files()
+        self.ui.panel(files, title="Files")
+
+    def _show_quick_status(self):
+        """Show a brief agent status."""
+        self.ui.panel(
+            f"""
+**Agent Status**
+
+Model: {self.agent.llm.config.model}
+Workspace: {self.workspace}
+Messages: {len(self.agent.history)}
+Tools: {len(self.agent.registry)}
+            """,
+            title="Status",
+        )
+
     def _show_tree(self):
         """Show session tree."""
         if not self.session:
@@ -609,77 +669,7 @@ Cost: ${info["metadata"].get("cost", 0.0):.4f}
 
     def _show_help(self):
         """Show comprehensive help."""
-        help_text = """
-**Built-in Commands:**
-
-/help       - Show this help
-/exit       - Exit agent
-/clear      - Clear conversation
-/status     - Agent status
-/config     - Show configuration
-/queue      - Show message queue
-/files      - List workspace files
-
-**Session Management:**
-
-/session    - Show current session info
-/sessions   - List all available sessions
-/tree       - Show conversation tree
-/fork [name] - Fork session from current point
-/compact [instructions] - Compact old messages
-/export [file] - Export session to HTML
-/share      - Share session via GitHub Gist
-/reload     - Reload extensions, skills, prompts, context
-
-**Skills & Extensions:**
-
-/skills     - List available skills
-/skill:name - Invoke a skill
-/extensions - List loaded extensions
-/prompts    - List prompt templates
-/template   - Expand a template
-
-**Model & Auth:**
-
-/model [provider/model] - Switch LLM model
-/login      - OAuth login (subscription accounts)
-/logout <provider> - Logout from provider
-
-**Context Files:**
-
-• AGENTS.md - Project instructions (auto-loaded)
-• SYSTEM.md - Override system prompt
-• APPEND_SYSTEM.md - Append to system prompt
-
-**Message Queue:**
-
-While agent is working, you can queue messages:
-  !message     - Steering (interrupt after current tool)
-  >>message    - Follow-up (wait until agent finishes)
-
-Use /queue to see queued messages.
-
-**File References:**
-
-Use @filename to auto-include file contents:
-  @src/main.py - Include main.py in your message
-  @README.md - Include README
-  @test.py and @utils.py - Multiple files
-
-Files are automatically read and added to context!
-
-**Features:**
-
-• Sessions auto-save to .sessions/
-• Extensions auto-load from .agents/extensions/
-• Skills auto-discover from .agents/skills/
-• Prompts auto-load from .agents/prompts/
-• Context auto-load from AGENTS.md, SYSTEM.md
-• Use /tree to navigate conversation history
-• Use /fork to create alternate branches
-• Queue messages with ! or >>
-        """
-        self.ui.panel(help_text, title="Help")
+        self.ui.panel(_HELP_TEXT, title="Help")
 
     def _list_prompts(self):
         """List available prompt templates."""
@@ -749,10 +739,7 @@ Files are automatically read and added to context!
             self.session.add_message("user", rendered)
 
         # Get response
-        response = self.agent.run(rendered)
-
-        # Display response
-        self.ui.assistant(response.content)
+        self._stream_response(rendered)
 
     def _export_session(self, filename: str | None):
         """Export session to HTML."""
@@ -901,7 +888,11 @@ For now, use API keys:
             return
 
         try:
-            sharer = GistSharer(github_token)
+            sharer = self._gist_sharer
+            if sharer is None or sharer.github_token != github_token:
+                if sharer is not None:
+                    sharer.close()
+                sharer = self._gist_sharer = GistSharer(github_token)
 
             self.ui.system("Uploading to GitHub Gist...")
 
@@ -1031,10 +1022,10 @@ Project: .agents/config.json
             reloaded.append(f"Prompts: {new_count} (was {old_count})")
 
         # Reload system prompt (context files)
-        new_prompt = self._get_system_prompt()
+        new_prompt = self._get_system_prompt(refresh=True)
         # Update agent's system prompt
         if self.agent.history and self.agent.history[0].role == "system":
-            self.agent.history[0].content = new_prompt
+            self.agent.history[0] = self.agent.history[0].model_copy(update={"content": new_prompt})
             reloaded.append("Context: Reloaded")
 
         if reloaded:
@@ -1088,6 +1079,11 @@ Branches: {info["branches"]}
 
         self.ui.panel(status_text, title="Status")
 
+    def reset(self) -> None:
+        """Start a fresh conversation with an up-to-date system prompt."""
+        self.agent.system_prompt = self._get_system_prompt(refresh=True)
+        self.agent.clear_history()
+
     def run_once(self, message: str) -> str:
         """Run agent with a single message.
 
@@ -1149,3 +1145,32 @@ In cooldown: {status["cooldown_profiles"]}
 
         # Show usage file location
         self.ui.system(f"\nUsage data: {self.cost_tracker.usage_file}")
+
+    # Slash command -> (handler, whether it takes the rest of the line as argument)
+    _COMMANDS = {
+        "/exit": (_exit, False),
+        "/quit": (_exit, False),
+        "/clear": (_clear, False),
+        "/help": (_show_quick_help, False),
+        "/files": (_show_files, False),
+        "/status": (_show_quick_status, False),
+        "/tree": (_show_tree, False),
+        "/fork": (_fork_session, True),
+        "/compact": (_compact_session, True),
+        "/session": (_show_session_info, False),
+        "/sessions": (_list_sessions, False),
+        "/skills": (_list_skills, False),
+        "/extensions": (_list_extensions, False),
+        "/prompts": (_list_prompts, False),
+        "/reload": (_reload_resources, False),
+        "/config": (_show_config, False),
+        "/queue": (_show_queue, False),
+        "/export": (_export_session, True),
+        "/share": (_share_session, False),
+        "/model": (_switch_model, True),
+        "/login": (_login, False),
+        "/logout": (_logout, True),
+        "/resilience": (_show_resilience_status, False),
+        "/cost": (_show_cost_summary, False),
+        "/usage": (_show_cost_summary, False),
+    }
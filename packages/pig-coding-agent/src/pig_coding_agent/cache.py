@@ -0,0 +1,112 @@
+"""Persistent response cache for single-shot CLI commands."""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+# Entries older than this are treated as misses and purged
+DEFAULT_TTL = 7 * 24 * 3600
+# Oldest entries beyond this count are evicted on every write
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def default_cache_path() -> Path:
+    """Get the cache database path, honouring ``XDG_CACHE_HOME``."""
+    root = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "pig-code" / "responses.sqlite"
+
+
+def cache_key(*parts: str) -> str:
+    """Hash the inputs that determine a response into a cache key.
+
+    Args:
+        *parts: System prompt, model, message and any extra inputs
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed exact-match cache of agent responses with TTL and size cap."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize cache.
+
+        Args:
+            path: Database file (defaults to ``~/.cache/pig-code/responses.sqlite``)
+            ttl: Seconds a response stays valid
+            max_entries: Maximum number of stored responses
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from :func:`cache_key`
+
+        Returns:
+            Response text, or None if missing or expired
+        """
+        row = self._conn.execute(
+            "SELECT response FROM responses WHERE key = ? AND created > ?",
+            (key, time.time() - self.ttl),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response, then evict expired and excess entries.
+
+        Args:
+            key: Cache key from :func:`cache_key`
+            response: Response text
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE created <= ?", (time.time() - self.ttl,)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY created DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        """Get number of stored responses."""
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
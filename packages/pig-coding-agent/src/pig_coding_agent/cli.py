@@ -7,11 +7,8 @@ from pathlib import Path
 from typing import Any
 
 import typer
-from pig_llm import LLM
 from rich.console import Console
 
-from .agent import CodingAgent
-
 app = typer.Typer(
     name="pig-code",
     help="Interactive coding agent CLI",
@@ -21,6 +18,22 @@ app = typer.Typer(
 console = Console()
 
 
+# pig_llm and the agent stack are imported on first use rather than at module
+# load, so `pig-code --help` stays fast. Commands call these by name.
+def LLM(**kwargs: Any):  # noqa: N802 - stands in for pig_llm.LLM
+    """Create a ``pig_llm.LLM``."""
+    from pig_llm import LLM as _LLM
+
+    return _LLM(**kwargs)
+
+
+def CodingAgent(**kwargs: Any):  # noqa: N802 - stands in for .agent.CodingAgent
+    """Create a ``CodingAgent``."""
+    from .agent import CodingAgent as _CodingAgent
+
+    return _CodingAgent(**kwargs)
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -41,6 +54,11 @@ def main(
     base_url: str | None = typer.Option(
         None, "--base-url", help="Custom API base URL (for custom providers)"
     ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Deterministic mode: temperature 0 and reuse responses to repeated requests",
+    ),
 ):
     """Start interactive coding agent."""
     if ctx.invoked_subcommand is not None:
@@ -58,6 +76,11 @@ def main(
         api_key=api_key,
         model=model or ("gpt-3.5-turbo" if provider == "openai" else None),
         base_url=base_url,
+        # Open the provider connection while the agent starts up
+        eager_warmup=True,
+        # Only temperature-0 requests are cacheable; replayed responses still
+        # go through the agent, so their tool calls are executed again
+        **({"temperature": 0.0, "enable_cache": True} if cache else {}),
     )
 
     # Handle session loading
@@ -66,7 +89,12 @@ def main(
         from pig_agent_core import SessionManager
 
         session_mgr = SessionManager(workspace)
-        sessions = session_mgr.list_sessions(limit=10)
+        if continue_session:
+            # Only the newest session is needed: one max() over the scan
+            latest = session_mgr.get_most_recent()
+            sessions = [latest] if latest else []
+        else:
+            sessions = session_mgr.list_sessions(limit=10)
 
         if not sessions:
             console.print("[yellow]No previous sessions found[/yellow]")
@@ -263,11 +291,82 @@ def run_rpc_mode(agent):
     rpc.run_server(handle_request)
 
 
+def run_once_cached(agent, message: str, *key_parts: str, use_cache: bool = True) -> str:
+    """Run a single-shot request, reusing a stored response to identical input.
+
+    The key covers the system prompt (workspace and context files), the model,
+    the message and any extra ``key_parts`` such as a file content hash.
+
+    Args:
+        agent: CodingAgent instance
+        message: User message
+        *key_parts: Extra inputs the response depends on
+        use_cache: Look up and store the response in the persistent cache
+
+    Returns:
+        Agent response
+    """
+    if not use_cache:
+        return agent.run_once(message)
+
+    from .cache import ResponseCache, cache_key
+
+    key = cache_key(agent._get_system_prompt(), agent.llm.config.model, message, *key_parts)
+    cache = ResponseCache()
+    try:
+        result = cache.get(key)
+        if result is None:
+            result = agent.run_once(message)
+            cache.put(key, result)
+        else:
+            console.print("[dim](cached response)[/dim]")
+        return result
+    finally:
+        cache.close()
+
+
+def run_single_shot(
+    message: str, model: str | None, *key_parts: str, use_cache: bool = True
+) -> str:
+    """Answer a single-shot request locally, or via the daemon if enabled.
+
+    With ``PIG_CODE_DAEMON=1`` the request goes to ``pig-code serve`` (started
+    on demand), which keeps a warm agent per workspace and model.
+
+    Args:
+        message: User message
+        model: LLM model (None for the default)
+        *key_parts: Extra cache key inputs (see :func:`run_once_cached`)
+        use_cache: Use the persistent response cache
+
+    Returns:
+        Agent response
+    """
+    if os.getenv("PIG_CODE_DAEMON") == "1":
+        from .daemon import request_or_spawn
+
+        return request_or_spawn(
+            {
+                "cmd": "run",
+                "message": message,
+                "workspace": str(Path.cwd()),
+                "model": model,
+                "key_parts": list(key_parts),
+                "use_cache": use_cache,
+            }
+        )
+
+    llm = LLM(api_key=os.getenv("OPENAI_API_KEY"), model=model or "gpt-3.5-turbo")
+    agent = CodingAgent(llm=llm, verbose=False)
+    return run_once_cached(agent, message, *key_parts, use_cache=use_cache)
+
+
 @app.command()
 def gen(
     description: str = typer.Argument(..., help="What to generate"),
     output: Path | None = typer.Option(None, "--output", "-o", help="Output file"),
     model: str | None = typer.Option(None, "--model", "-m", help="LLM model"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always query the model"),
 ):
     """Generate code from description."""
     api_key = os.getenv("OPENAI_API_KEY")
@@ -275,11 +374,8 @@ def gen(
         console.print("[red]Error: OPENAI_API_KEY not set[/red]")
         raise typer.Exit(1)
 
-    llm = LLM(api_key=api_key, model=model or "gpt-3.5-turbo")
-    agent = CodingAgent(llm=llm, verbose=False)
-
     console.print(f"[cyan]Generating:[/cyan] {description}")
-    result = agent.run_once(f"Generate code for: {description}")
+    result = run_single_shot(f"Generate code for: {description}", model, use_cache=not no_cache)
 
     if output:
         output.write_text(result)
@@ -292,6 +388,7 @@ def gen(
 def analyze(
     path: Path = typer.Argument(..., help="File or directory to analyze"),
     model: str | None = typer.Option(None, "--model", "-m", help="LLM model"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always query the model"),
 ):
     """Analyze code and provide insights."""
     api_key = os.getenv("OPENAI_API_KEY")
@@ -303,13 +400,40 @@ def analyze(
         console.print(f"[red]Error: {path} does not exist[/red]")
         raise typer.Exit(1)
 
-    llm = LLM(api_key=api_key, model=model or "gpt-3.5-turbo")
-    agent = CodingAgent(llm=llm, verbose=False)
-
     console.print(f"[cyan]Analyzing:[/cyan] {path}")
-    result = agent.run_once(f"Analyze the file {path} and provide insights")
+    message = f"Analyze the file {path} and provide insights"
+    if path.is_file():
+        # Editing the file changes the key, so stale analyses are never reused
+        import hashlib
+
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        result = run_single_shot(message, model, content_hash, use_cache=not no_cache)
+    else:
+        # A directory has no cheap content signature; always ask the model
+        result = run_single_shot(message, model, use_cache=False)
     console.print(result)
 
 
+@app.command()
+def serve(
+    socket_file: Path | None = typer.Option(None, "--socket", help="Unix socket path"),
+):
+    """Run a daemon that answers gen/analyze requests with warm agents."""
+    import signal
+
+    from .daemon import AgentDaemon
+
+    daemon = AgentDaemon(socket_file)
+    # Unwind through the finally below on `kill` too, so the socket is removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    console.print(f"[green]✓ pig-code daemon listening on[/green] {daemon.path}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,324 @@
+"""Background daemon that keeps warm coding agents for single-shot CLI commands.
+
+``pig-code serve`` holds one CodingAgent per (workspace, model) and answers
+requests over a Unix domain socket, so ``gen`` and ``analyze`` (with
+``PIG_CODE_DAEMON=1``) skip interpreter startup, imports and agent setup.
+
+Wire format: each message is a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON. Requests are ``{"cmd": "run", "message", "workspace",
+"model", "key_parts", "use_cache"}``; replies are ``{"ok": true, "result"}``
+or ``{"ok": false, "error"}``.
+
+The daemon runs tools (``run_command``, ``write_file``) in whatever workspace
+a request names, so only the user who started it may talk to it. The default
+socket lives in a 0700 directory owned by that user, is bound as 0600, and
+peers with another uid are dropped. Clients check the socket's owner before
+sending anything.
+
+A spawned daemon keeps the environment of the process that started it,
+including ``OPENAI_API_KEY``. Later requests use that key even if the client
+shell has a different one; stop the daemon to pick up a new key.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_HEADER = struct.Struct(">I")
+# struct ucred returned by SO_PEERCRED: pid, uid, gid
+_PEERCRED = struct.Struct("3i")
+
+# How long a client waits for a freshly spawned daemon to start listening
+SPAWN_TIMEOUT = 10.0
+
+
+def socket_path() -> Path:
+    """Get the default daemon socket path.
+
+    The socket lives in a per-user directory: ``$XDG_RUNTIME_DIR/pig-code/``,
+    or ``pig-code-<uid>/`` under the temp directory.
+    """
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "pig-code" / "pig-code.sock"
+    return Path(tempfile.gettempdir()) / f"pig-code-{os.getuid()}" / "pig-code.sock"
+
+
+def _private_dir(path: Path) -> None:
+    """Create a 0700 directory, or check that an existing one is ours and private.
+
+    Args:
+        path: Directory path
+
+    Raises:
+        PermissionError: If the directory is a symlink, another user's, or
+            accessible to group or others
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"{path} must be a directory owned by you with mode 0700")
+
+
+def _check_socket(path: Path) -> None:
+    """Check that a socket file exists and belongs to the current user.
+
+    Args:
+        path: Socket path
+
+    Raises:
+        FileNotFoundError: If nothing exists at the path
+        PermissionError: If the path is not a socket or is another user's
+    """
+    st = os.lstat(path)
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not a pig-code socket owned by you")
+
+
+def _peer_uid(sock: socket.socket) -> int | None:
+    """Get the uid of the process at the other end of a Unix socket.
+
+    Returns:
+        Peer uid, or None where SO_PEERCRED is unavailable (non-Linux)
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+    return _PEERCRED.unpack(creds)[1]
+
+
+def send_message(sock: socket.socket, payload: dict[str, Any]) -> None:
+    """Write one length-prefixed JSON message.
+
+    Args:
+        sock: Connected socket
+        payload: JSON-serializable message
+    """
+    data = json.dumps(payload).encode()
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any]:
+    """Read one length-prefixed JSON message.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        Decoded message
+
+    Raises:
+        ConnectionError: If the peer closes the connection early
+    """
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, size))
+
+
+def _default_agent_factory(workspace: str, model: str | None):
+    from .agent import CodingAgent
+    from .cli import LLM
+
+    llm = LLM(api_key=os.getenv("OPENAI_API_KEY"), model=model or "gpt-3.5-turbo")
+    return CodingAgent(llm=llm, workspace=workspace, verbose=False)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: "AgentDaemon"
+
+    def handle(self) -> None:
+        try:
+            request = recv_message(self.request)
+        except (ConnectionError, ValueError):
+            return
+        try:
+            reply = {"ok": True, "result": self.server.dispatch(request)}
+        except Exception as e:
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        send_message(self.request, reply)
+
+
+class AgentDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server answering requests with cached CodingAgents."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        agent_factory: Callable[[str, str | None], Any] | None = None,
+    ):
+        """Initialize daemon and bind its socket.
+
+        Args:
+            path: Socket path (defaults to :func:`socket_path`)
+            agent_factory: Builds a CodingAgent for (workspace, model)
+        """
+        self.path = Path(path) if path else socket_path()
+        self.agent_factory = agent_factory or _default_agent_factory
+        # (workspace, model) -> (agent, lock); an agent serves one request at a time
+        self._agents: dict[tuple[str, str | None], tuple[Any, threading.Lock]] = {}
+        self._agents_lock = threading.Lock()
+
+        if path is None:
+            _private_dir(self.path.parent)
+        else:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        # A socket file left by a daemon that died is unlinked; a live one
+        # still answers, and binding over it would steal its clients.
+        if os.path.lexists(self.path):
+            _check_socket(self.path)
+            if _is_listening(self.path):
+                raise OSError(f"pig-code daemon already running on {self.path}")
+            self.path.unlink()
+        # Bind with the final 0600 mode; a chmod after bind would leave a window
+        # in which other users could connect.
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def verify_request(self, request: socket.socket, client_address: Any) -> bool:
+        """Accept only peers running as the daemon's own user."""
+        uid = _peer_uid(request)
+        return uid is None or uid == os.getuid()
+
+    def _agent(self, workspace: str, model: str | None) -> tuple[Any, threading.Lock]:
+        key = (workspace, model)
+        with self._agents_lock:
+            entry = self._agents.get(key)
+            if entry is None:
+                entry = self._agents[key] = (self.agent_factory(workspace, model), threading.Lock())
+            return entry
+
+    def dispatch(self, request: dict[str, Any]) -> Any:
+        """Handle one decoded request.
+
+        Args:
+            request: Request message
+
+        Returns:
+            Result to send back
+
+        Raises:
+            ValueError: If the command is unknown
+        """
+        cmd = request.get("cmd")
+        if cmd == "ping":
+            return "pong"
+        if cmd != "run":
+            raise ValueError(f"Unknown command: {cmd}")
+
+        from .cli import run_once_cached
+
+        agent, lock = self._agent(request.get("workspace") or ".", request.get("model"))
+        with lock:
+            # Every request is an independent single-shot conversation
+            agent.reset()
+            return run_once_cached(
+                agent,
+                request["message"],
+                *request.get("key_parts", ()),
+                use_cache=request.get("use_cache", True),
+            )
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def _is_listening(path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+def request(payload: dict[str, Any], path: Path | None = None) -> Any:
+    """Send one request to a running daemon.
+
+    Args:
+        payload: Request message
+        path: Socket path (defaults to :func:`socket_path`)
+
+    Returns:
+        The daemon's result
+
+    Raises:
+        OSError: If no daemon is listening (FileNotFoundError, ConnectionRefusedError)
+        PermissionError: If the socket or the process serving it is another user's
+        RuntimeError: If the daemon reports an error
+    """
+    path = path or socket_path()
+    _check_socket(path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        # The file check above can race with a swap; the peer's uid cannot
+        uid = _peer_uid(sock)
+        if uid is not None and uid != os.getuid():
+            raise PermissionError(f"{path} is served by uid {uid}, not by you")
+        send_message(sock, payload)
+        reply = recv_message(sock)
+    if not reply.get("ok"):
+        raise RuntimeError(reply.get("error", "daemon request failed"))
+    return reply.get("result")
+
+
+def request_or_spawn(payload: dict[str, Any], path: Path | None = None) -> Any:
+    """Send a request, starting the daemon first if none is listening.
+
+    Args:
+        payload: Request message
+        path: Socket path (defaults to :func:`socket_path`)
+
+    Returns:
+        The daemon's result
+    """
+    command = [sys.executable, "-m", "pig_coding_agent.cli", "serve"]
+    if path is not None:
+        command += ["--socket", str(path)]
+    # Without --socket the daemon creates the private default directory itself
+    path = path or socket_path()
+    try:
+        return request(payload, path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + SPAWN_TIMEOUT
+    while not _is_listening(path):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"pig-code daemon did not start on {path}")
+        time.sleep(0.05)
+    return request(payload, path)
@@ -1,5 +1,6 @@
 """Built-in tools for coding agent."""
 
+import re
 import subprocess
 from pathlib import Path
 
@@ -24,7 +25,7 @@ class FileTools:
             raise ValueError(f"Path {path} is outside workspace")
         return full_path
 
-    @tool(description="Read contents of a file")
+    @tool(description="Read contents of a file", thread_safe=True)
     def read_file(self, path: str) -> str:
         """Read file contents.
 
@@ -55,7 +56,7 @@ class FileTools:
         file_path.write_text(content)
         return f"Successfully wrote to {path}"
 
-    @tool(description="List files in a directory")
+    @tool(description="List files in a directory", thread_safe=True)
     def list_files(self, directory: str = ".") -> str:
         """List files in directory.
 
@@ -78,7 +79,7 @@ class FileTools:
 
         return "\n".join(files) if files else "Empty directory"
 
-    @tool(description="Check if file exists")
+    @tool(description="Check if file exists", thread_safe=True)
     def file_exists(self, path: str) -> bool:
         """Check if file exists.
 
@@ -90,7 +91,7 @@ class FileTools:
         """
         return self._resolve_path(path).exists()
 
-    @tool(description="Search for text in files (grep)")
+    @tool(description="Search for text in files (grep)", thread_safe=True)
     def grep_files(self, pattern: str, path: str = ".", recursive: bool = True) -> str:
         """Search for pattern in files.
 
@@ -102,17 +103,16 @@ class FileTools:
         Returns:
             Matching lines with file names
         """
-        import re
-
         search_path = self._resolve_path(path)
         results = []
 
         try:
+            regex = re.compile(pattern, re.IGNORECASE)
             if search_path.is_file():
                 # Search single file
                 content = search_path.read_text()
                 for i, line in enumerate(content.split("\n"), 1):
-                    if re.search(pattern, line, re.IGNORECASE):
+                    if regex.search(line):
                         results.append(f"{search_path.name}:{i}: {line.strip()}")
             else:
                 # Search directory
@@ -122,7 +122,7 @@ class FileTools:
                         try:
                             content = file_path.read_text()
                             for i, line in enumerate(content.split("\n"), 1):
-                                if re.search(pattern, line, re.IGNORECASE):
+                                if regex.search(line):
                                     rel_path = file_path.relative_to(self.workspace)
                                     results.append(f"{rel_path}:{i}: {line.strip()}")
                         except (UnicodeDecodeError, PermissionError):
@@ -139,7 +139,7 @@ class FileTools:
 
         return "\n".join(results)
 
-    @tool(description="Find files by name pattern")
+    @tool(description="Find files by name pattern", thread_safe=True)
     def find_files(self, pattern: str, path: str = ".") -> str:
         """Find files matching pattern.
 
@@ -170,7 +170,7 @@ class FileTools:
 
         return "\n".join(results)
 
-    @tool(description="List files with details (ls -la)")
+    @tool(description="List files with details (ls -la)", thread_safe=True)
     def ls_detailed(self, path: str = ".") -> str:
         """List files with detailed information.
 
@@ -216,7 +216,7 @@ class FileTools:
 class CodeTools:
     """Code generation and analysis tools."""
 
-    @tool(description="Generate code from description")
+    @tool(description="Generate code from description", thread_safe=True)
     def generate_code(self, description: str, language: str = "python") -> str:
         """Generate code from natural language description.
 
@@ -230,7 +230,7 @@ class CodeTools:
         # This is a placeholder - actual implementation would use LLM
         return f"# Generated {language} code for: {description}\n# TODO: Implement"
 
-    @tool(description="Explain what code does")
+    @tool(description="Explain what code does", thread_safe=True)
     def explain_code(self, code: str) -> str:
         """Explain what code does.
 
@@ -243,7 +243,7 @@ class CodeTools:
         # Placeholder
         return f"This code appears to be {len(code.split())} lines long."
 
-    @tool(description="Add type hints to Python code")
+    @tool(description="Add type hints to Python code", thread_safe=True)
     def add_type_hints(self, code: str) -> str:
         """Add type hints to Python code.
 
@@ -289,7 +289,7 @@ class ShellTools:
         except Exception as e:
             return f"Error: {e}"
 
-    @tool(description="Get git status")
+    @tool(description="Get git status", thread_safe=True)
     def git_status(self) -> str:
         """Get git repository status.
 
@@ -298,7 +298,7 @@ class ShellTools:
         """
         return self.run_command("git status --short")
 
-    @tool(description="Get git diff")
+    @tool(description="Get git diff", thread_safe=True)
     def git_diff(self, path: str | None = None) -> str:
         """Get git diff.
 
@@ -363,7 +363,7 @@ class ShellTools:
         else:
             return self.run_command(f"git branch {branch_name}")
 
-    @tool(description="Get git log")
+    @tool(description="Get git log", thread_safe=True)
     def git_log(self, limit: int = 10) -> str:
         """Get recent git commits.
 
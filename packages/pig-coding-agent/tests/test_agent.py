@@ -1,6 +1,6 @@
 """Tests for CodingAgent."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from pig_coding_agent.agent import CodingAgent
@@ -59,6 +59,18 @@ def test_coding_agent_has_tools(mock_llm, temp_workspace):
     assert "list_files" in tool_names
 
 
+def test_coding_agent_parallel_tools(mock_llm, temp_workspace):
+    """Test only read-only tools are eligible for concurrent execution."""
+    agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace), parallel_tools=3)
+
+    assert agent.agent.parallel_tools == 3
+    tools = agent.agent._tools
+    assert tools["read_file"].thread_safe
+    assert tools["git_diff"].thread_safe
+    assert not tools["write_file"].thread_safe
+    assert not tools["run_command"].thread_safe
+
+
 def test_coding_agent_system_prompt(mock_llm, temp_workspace):
     """Test agent has proper system prompt."""
     agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace))
@@ -68,6 +80,17 @@ def test_coding_agent_system_prompt(mock_llm, temp_workspace):
     assert str(temp_workspace) in system_prompt
 
 
+def test_coding_agent_system_prompt_cached(mock_llm, temp_workspace):
+    """Test system prompt is built once and rebuilt only on refresh."""
+    agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace))
+
+    prompt = agent._get_system_prompt()
+    assert agent._get_system_prompt() is prompt
+
+    (temp_workspace / "AGENTS.md").write_text("Use tabs.")
+    assert "Use tabs." in agent._get_system_prompt(refresh=True)
+
+
 def test_coding_agent_run_once(mock_llm, temp_workspace):
     """Test running agent once."""
     # Mock the agent's run method
@@ -83,6 +106,34 @@ def test_coding_agent_run_once(mock_llm, temp_workspace):
         mock_agent_instance.run.assert_called_once()
 
 
+def test_coding_agent_stream_response(mock_llm, temp_workspace):
+    """Test responses are written to the UI chunk by chunk."""
+    agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace), verbose=False)
+    agent.agent.stream = Mock(return_value=iter(["Hel", "lo"]))
+    sink = Mock()
+    agent.ui.assistant_stream = MagicMock()
+    agent.ui.assistant_stream.return_value.__enter__.return_value = sink
+
+    assert agent._stream_response("Hi") == "Hello"
+    assert [c.args for c in sink.write.call_args_list] == [("Hel",), ("lo",)]
+
+
+def test_coding_agent_stream_response_interrupted(mock_llm, temp_workspace):
+    """Test Ctrl-C stops the response but keeps the text shown so far."""
+
+    def chunks(message):
+        yield "partial"
+        raise KeyboardInterrupt
+
+    agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace), verbose=False)
+    agent.agent.stream = chunks
+    agent.ui = Mock()
+    agent.ui.assistant_stream = MagicMock()
+
+    assert agent._stream_response("Hi") == "partial"
+    agent.ui.system.assert_called_with("Response interrupted")
+
+
 def test_coding_agent_handle_exit_command(mock_llm, temp_workspace):
     """Test handling exit command."""
     agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace))
@@ -142,6 +193,15 @@ def test_coding_agent_handle_status_command(mock_llm, temp_workspace):
     agent.ui.panel.assert_called()
 
 
+def test_coding_agent_handle_sessions_command(mock_llm, temp_workspace):
+    """Test /sessions lists sessions instead of matching the /session prefix."""
+    agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace))
+    agent.ui = Mock()
+    agent._handle_command("/sessions")
+
+    agent.ui.system.assert_any_call("No sessions found")
+
+
 def test_coding_agent_handle_unknown_command(mock_llm, temp_workspace):
     """Test handling unknown command."""
     agent = CodingAgent(llm=mock_llm, workspace=str(temp_workspace))
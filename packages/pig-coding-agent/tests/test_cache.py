@@ -0,0 +1,60 @@
+"""Tests for the persistent response cache."""
+
+import time
+from unittest.mock import patch
+
+from pig_coding_agent.cache import ResponseCache, cache_key, default_cache_path
+
+
+def test_cache_key_separates_parts():
+    """Test keys are stable and part boundaries matter."""
+    assert cache_key("a", "b") == cache_key("a", "b")
+    assert cache_key("ab", "") != cache_key("a", "b")
+
+
+def test_default_cache_path_honours_xdg(tmp_path, monkeypatch):
+    """Test XDG_CACHE_HOME relocates the database."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_path() == tmp_path / "pig-code" / "responses.sqlite"
+
+
+def test_response_cache_roundtrip(tmp_path):
+    """Test stored responses persist across instances."""
+    path = tmp_path / "responses.sqlite"
+    cache = ResponseCache(path)
+    assert cache.get("k") is None
+    cache.put("k", "response")
+    cache.close()
+
+    cache = ResponseCache(path)
+    assert cache.get("k") == "response"
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_response_cache_ttl(tmp_path):
+    """Test expired responses are misses."""
+    cache = ResponseCache(tmp_path / "responses.sqlite", ttl=60)
+    with patch("pig_coding_agent.cache.time.time", return_value=1000.0):
+        cache.put("k", "old")
+    with patch("pig_coding_agent.cache.time.time", return_value=1030.0):
+        assert cache.get("k") == "old"
+    with patch("pig_coding_agent.cache.time.time", return_value=1061.0):
+        assert cache.get("k") is None
+    cache.close()
+
+
+def test_response_cache_size_cap(tmp_path):
+    """Test the oldest responses are evicted beyond max_entries."""
+    cache = ResponseCache(tmp_path / "responses.sqlite", max_entries=2)
+    now = time.time()
+    for i, key in enumerate(["a", "b", "c"]):
+        with patch("pig_coding_agent.cache.time.time", return_value=now - 10 + i):
+            cache.put(key, key)
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+    cache.close()
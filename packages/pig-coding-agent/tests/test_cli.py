@@ -1,5 +1,6 @@
 """Tests for CLI commands."""
 
+import json
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -115,6 +116,57 @@ def test_analyze_command(mock_agent_class, mock_llm_class, mock_env, tmp_path):
         mock_console.print.assert_called()
 
 
+@patch("pig_coding_agent.cli.LLM")
+@patch("pig_coding_agent.cli.CodingAgent")
+def test_gen_command_reuses_cached_response(
+    mock_agent_class, mock_llm_class, mock_env, tmp_path, monkeypatch
+):
+    """Test a repeated gen request is answered from the persistent cache."""
+    from pig_coding_agent.cli import gen
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    mock_agent = Mock()
+    mock_agent.llm.config.model = "test-model"
+    mock_agent._get_system_prompt = Mock(return_value="system")
+    mock_agent.run_once = Mock(return_value="print('hello')")
+    mock_agent_class.return_value = mock_agent
+
+    with patch("pig_coding_agent.cli.console"):
+        gen(description="Create script", output=None, model=None, no_cache=False)
+        gen(description="Create script", output=None, model=None, no_cache=False)
+        gen(description="Other script", output=None, model=None, no_cache=False)
+
+    assert mock_agent.run_once.call_count == 2
+    assert (tmp_path / "pig-code" / "responses.sqlite").exists()
+
+
+@patch("pig_coding_agent.cli.LLM")
+@patch("pig_coding_agent.cli.CodingAgent")
+def test_analyze_command_cache_tracks_file_content(
+    mock_agent_class, mock_llm_class, mock_env, tmp_path, monkeypatch
+):
+    """Test editing the analyzed file invalidates its cached analysis."""
+    from pig_coding_agent.cli import analyze
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    test_file = tmp_path / "test.py"
+    test_file.write_text("print('hello')")
+    mock_agent = Mock()
+    mock_agent.llm.config.model = "test-model"
+    mock_agent._get_system_prompt = Mock(return_value="system")
+    mock_agent.run_once = Mock(return_value="Analysis")
+    mock_agent_class.return_value = mock_agent
+
+    with patch("pig_coding_agent.cli.console"):
+        analyze(path=test_file, model=None, no_cache=False)
+        analyze(path=test_file, model=None, no_cache=False)
+        assert mock_agent.run_once.call_count == 1
+
+        test_file.write_text("print('changed')")
+        analyze(path=test_file, model=None, no_cache=False)
+        assert mock_agent.run_once.call_count == 2
+
+
 def test_analyze_command_missing_file(mock_env):
     """Test analyze command with missing file."""
     from pig_coding_agent.cli import analyze
@@ -159,6 +211,60 @@ def test_main_with_custom_model(mock_agent_class, mock_llm_class, mock_env, mock
         assert mock_llm_class.call_args.kwargs.get("model") == "gpt-4"
 
 
+@patch("pig_coding_agent.cli.LLM")
+@patch("pig_coding_agent.cli.CodingAgent")
+def test_main_with_cache(mock_agent_class, mock_llm_class, mock_env, mock_ctx):
+    """Test --cache enables deterministic response caching on the LLM."""
+    from pig_coding_agent.cli import main
+
+    mock_agent = Mock()
+    mock_agent.session = None
+    mock_agent.skill_manager = None
+    mock_agent.extension_manager = None
+    mock_agent_class.return_value = mock_agent
+
+    with patch("pig_coding_agent.cli.console"):
+        main(ctx=mock_ctx, provider="openai", workspace=Path("."), cache=True)
+
+    kwargs = mock_llm_class.call_args.kwargs
+    assert kwargs["enable_cache"] is True
+    assert kwargs["temperature"] == 0.0
+
+
+@patch("pig_coding_agent.cli.LLM")
+@patch("pig_coding_agent.cli.CodingAgent")
+def test_main_continue_picks_newest_session(
+    mock_agent_class, mock_llm_class, mock_env, mock_ctx, tmp_path
+):
+    """Test --continue resumes the most recently modified session file."""
+    from pig_coding_agent.cli import main
+
+    sessions_dir = tmp_path / ".sessions"
+    sessions_dir.mkdir()
+    for name, mtime in [("old", 1_000_000), ("newest", 1_000_002), ("middle", 1_000_001)]:
+        path = sessions_dir / f"{name}.jsonl"
+        path.write_text(json.dumps({"type": "session", "name": name}) + "\n")
+        os.utime(path, (mtime, mtime))
+    (sessions_dir / "notes.txt").write_text("not a session")
+
+    mock_agent = Mock()
+    mock_agent.session = None
+    mock_agent.skill_manager = None
+    mock_agent.extension_manager = None
+    mock_agent_class.return_value = mock_agent
+
+    with patch("pig_coding_agent.cli.console"):
+        main(
+            ctx=mock_ctx,
+            provider="openai",
+            workspace=tmp_path,
+            resume=False,
+            continue_session=True,
+        )
+
+    assert mock_agent_class.call_args.kwargs["session_path"] == sessions_dir / "newest.jsonl"
+
+
 @patch("pig_coding_agent.cli.LLM")
 @patch("pig_coding_agent.cli.CodingAgent")
 def test_main_with_workspace(mock_agent_class, mock_llm_class, mock_env, mock_ctx, tmp_path):
@@ -181,3 +287,18 @@ def test_main_with_workspace(mock_agent_class, mock_llm_class, mock_env, mock_ct
 
         # Verify agent created with correct workspace
         assert mock_agent_class.call_args.kwargs.get("workspace") == str(tmp_path)
+
+
+def test_cli_import_defers_agent_stack():
+    """Test importing the CLI does not load the LLM/agent/TUI packages."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, pig_coding_agent.cli; "
+        "print(sorted(m for m in ('pig_llm', 'pig_agent_core', 'pig_tui') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
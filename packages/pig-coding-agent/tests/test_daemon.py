@@ -0,0 +1,145 @@
+"""Tests for the pig-code daemon."""
+
+import os
+import socket
+import stat
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from pig_coding_agent import daemon as daemon_module
+from pig_coding_agent.daemon import AgentDaemon, recv_message, request, send_message, socket_path
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon with fake agents on a temporary socket."""
+    agents = {}
+
+    def factory(workspace, model):
+        agent = Mock()
+        agent.llm.config.model = model or "default-model"
+        agent._get_system_prompt = Mock(return_value="system")
+        agent.run_once = Mock(side_effect=lambda message: f"{workspace}:{message}")
+        agents[(workspace, model)] = agent
+        return agent
+
+    server = AgentDaemon(tmp_path / "d.sock", agent_factory=factory)
+    server.agents = agents
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_socket_path_uses_runtime_dir(tmp_path, monkeypatch):
+    """Test the socket lives in XDG_RUNTIME_DIR when set."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert socket_path() == tmp_path / "pig-code" / "pig-code.sock"
+
+
+def test_daemon_binds_in_private_dir(tmp_path, monkeypatch):
+    """Test the default socket is created 0600 inside a 0700 directory."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    server = AgentDaemon(agent_factory=Mock())
+    try:
+        assert stat.S_IMODE(os.stat(server.path.parent).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(server.path).st_mode) == 0o600
+    finally:
+        server.server_close()
+
+
+def test_daemon_refuses_shared_socket_dir(tmp_path, monkeypatch):
+    """Test a socket directory others can enter is not used."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    (tmp_path / "pig-code").mkdir()
+    os.chmod(tmp_path / "pig-code", 0o755)
+    with pytest.raises(PermissionError, match="mode 0700"):
+        AgentDaemon(agent_factory=Mock())
+
+
+def test_daemon_rejects_other_users(daemon, monkeypatch):
+    """Test peers with another uid are dropped and refused by clients."""
+    left, right = socket.socketpair(socket.AF_UNIX)
+    with left, right:
+        assert daemon.verify_request(left, None) is True
+        monkeypatch.setattr(daemon_module, "_peer_uid", lambda sock: os.getuid() + 1)
+        assert daemon.verify_request(left, None) is False
+
+    with pytest.raises(PermissionError, match="served by uid"):
+        request({"cmd": "ping"}, daemon.path)
+
+
+def test_request_refuses_non_socket(tmp_path):
+    """Test clients do not connect to a path that is not a socket."""
+    path = tmp_path / "d.sock"
+    path.write_text("")
+    with pytest.raises(PermissionError, match="not a pig-code socket"):
+        request({"cmd": "ping"}, path)
+
+
+def test_message_framing_roundtrip():
+    """Test length-prefixed JSON survives a socket pair."""
+    left, right = socket.socketpair()
+    with left, right:
+        send_message(left, {"cmd": "ping", "text": "x" * 100_000})
+        assert recv_message(right) == {"cmd": "ping", "text": "x" * 100_000}
+
+
+def test_daemon_reuses_agent_per_workspace(daemon):
+    """Test one warm agent serves repeated requests, reset between them."""
+    payload = {"cmd": "run", "message": "hi", "workspace": "/ws", "use_cache": False}
+
+    assert request({"cmd": "ping"}, daemon.path) == "pong"
+    assert request(payload, daemon.path) == "/ws:hi"
+    assert request(payload, daemon.path) == "/ws:hi"
+    assert request({**payload, "workspace": "/other"}, daemon.path) == "/other:hi"
+
+    agent = daemon.agents[("/ws", None)]
+    assert agent.run_once.call_count == 2
+    assert agent.reset.call_count == 2
+    assert len(daemon.agents) == 2
+
+
+def test_daemon_reports_errors(daemon):
+    """Test failures come back as RuntimeError on the client."""
+    with pytest.raises(RuntimeError, match="Unknown command"):
+        request({"cmd": "nope"}, daemon.path)
+
+
+def test_daemon_replaces_stale_socket(tmp_path):
+    """Test a socket file left by a dead daemon does not block startup."""
+    path = tmp_path / "d.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+
+    server = AgentDaemon(path, agent_factory=Mock())
+    server.server_close()
+    assert not path.exists()
+
+
+def test_daemon_refuses_live_socket(daemon):
+    """Test a second daemon cannot take over a live socket."""
+    with pytest.raises(OSError, match="already running"):
+        AgentDaemon(daemon.path, agent_factory=Mock())
+
+
+def test_cli_routes_through_daemon(daemon, monkeypatch):
+    """Test PIG_CODE_DAEMON=1 sends gen requests to the daemon."""
+    from pig_coding_agent.cli import gen
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("PIG_CODE_DAEMON", "1")
+    monkeypatch.setattr("pig_coding_agent.daemon.socket_path", lambda: daemon.path)
+
+    with (
+        patch("pig_coding_agent.cli.console") as mock_console,
+        patch("pig_coding_agent.cli.CodingAgent") as mock_agent_class,
+    ):
+        gen(description="hello", output=None, model=None, no_cache=True)
+
+    mock_agent_class.assert_not_called()
+    printed = mock_console.print.call_args_list[-1].args[0]
+    assert printed.endswith(":Generate code for: hello")
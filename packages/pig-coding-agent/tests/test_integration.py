@@ -158,6 +158,20 @@ def test_fork_command(mock_llm, temp_workspace):
     assert fork_file.exists()
 
 
+def test_command_arguments_keep_case(mock_llm, temp_workspace):
+    """Test only the command word is lowercased, not its arguments."""
+    agent = CodingAgent(
+        llm=mock_llm,
+        workspace=str(temp_workspace),
+        verbose=False,
+    )
+
+    agent.session.add_message("user", "Message")
+    agent._handle_command("/FORK Release-Notes")
+
+    assert (temp_workspace / ".sessions" / "Release-Notes.jsonl").exists()
+
+
 def test_compact_command(mock_llm, temp_workspace):
     """Test /compact command."""
     agent = CodingAgent(
@@ -2,6 +2,7 @@
 
 from .client import LLM
 from .config import Config
+from .latency import LatencyTracker, ProviderTimeout
 from .models import Message, Response, StreamChunk
 from .providers import Provider
 
@@ -14,4 +15,6 @@ __all__ = [
     "Response",
     "StreamChunk",
     "Provider",
+    "LatencyTracker",
+    "ProviderTimeout",
 ]
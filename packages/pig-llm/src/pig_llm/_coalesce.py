@@ -0,0 +1,135 @@
+"""Coalescing of small streamed text deltas into fewer chunks."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+
+from .models import StreamChunk
+
+# Flush a buffered run once it holds this many characters
+_MAX_BUFFERED_CHARS = 64
+
+
+def _mergeable(chunk: StreamChunk) -> bool:
+    """Text deltas can be merged; stop and tool-call chunks pass through.
+
+    Per-delta metadata such as a response ``id`` does not break a run.
+    """
+    if chunk.finish_reason is not None:
+        return False
+    metadata = chunk.metadata
+    return not metadata or "tool_calls" not in metadata
+
+
+def _joined(buf: list[str], metadata: dict | None) -> StreamChunk:
+    """Merge a run of deltas, keeping the first delta's metadata."""
+    return StreamChunk.model_construct(
+        content="".join(buf), finish_reason=None, metadata=metadata or {}
+    )
+
+
+def coalesce(chunks: Iterator[StreamChunk], window_ms: float) -> Iterator[StreamChunk]:
+    """Join consecutive text deltas that arrive within ``window_ms``.
+
+    A sync iterator can only be checked when the next chunk arrives, so a
+    buffered run is flushed on the first arrival after the window expires, when
+    it reaches 64 characters, or before any non-text chunk.
+
+    Args:
+        chunks: Provider stream
+        window_ms: Coalescing window in milliseconds
+
+    Yields:
+        StreamChunk objects, with runs of text deltas merged
+    """
+    window = window_ms / 1000
+    buf: list[str] = []
+    metadata: dict | None = None
+    size = 0
+    started = 0.0
+
+    for chunk in chunks:
+        if not _mergeable(chunk):
+            if buf:
+                yield _joined(buf, metadata)
+                buf, size = [], 0
+            yield chunk
+            continue
+
+        if not buf:
+            started = time.monotonic()
+            metadata = chunk.metadata
+        buf.append(chunk.content)
+        size += len(chunk.content)
+        if size >= _MAX_BUFFERED_CHARS or time.monotonic() - started >= window:
+            yield _joined(buf, metadata)
+            buf, size = [], 0
+
+    if buf:
+        yield _joined(buf, metadata)
+
+
+async def acoalesce(
+    chunks: AsyncIterator[StreamChunk], window_ms: float
+) -> AsyncIterator[StreamChunk]:
+    """Async variant of :func:`coalesce` that also flushes on a quiet stream.
+
+    The pending ``__anext__`` is awaited with a timeout (and never cancelled),
+    so buffered text is released once the window expires even if the provider
+    stalls.
+
+    Args:
+        chunks: Provider stream
+        window_ms: Coalescing window in milliseconds
+
+    Yields:
+        StreamChunk objects, with runs of text deltas merged
+    """
+    window = window_ms / 1000
+    iterator = aiter(chunks)
+    buf: list[str] = []
+    metadata: dict | None = None
+    size = 0
+    deadline = 0.0
+    pending: asyncio.Task | None = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+
+            timeout = max(deadline - time.monotonic(), 0) if buf else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                # Window expired with no new delta
+                yield _joined(buf, metadata)
+                buf, size = [], 0
+                continue
+
+            task, pending = pending, None
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                break
+
+            if not _mergeable(chunk):
+                if buf:
+                    yield _joined(buf, metadata)
+                    buf, size = [], 0
+                yield chunk
+                continue
+
+            if not buf:
+                deadline = time.monotonic() + window
+                metadata = chunk.metadata
+            buf.append(chunk.content)
+            size += len(chunk.content)
+            if size >= _MAX_BUFFERED_CHARS:
+                yield _joined(buf, metadata)
+                buf, size = [], 0
+
+        if buf:
+            yield _joined(buf, metadata)
+    finally:
+        if pending is not None:
+            pending.cancel()
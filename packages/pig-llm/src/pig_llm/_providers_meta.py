@@ -0,0 +1,19 @@
+"""Built-in provider table shared by config, client and providers."""
+
+# (provider name, module under pig_llm.providers, provider class name)
+PROVIDERS: tuple[tuple[str, str, str], ...] = (
+    ("openai", "openai", "OpenAIProvider"),
+    ("anthropic", "anthropic", "AnthropicProvider"),
+    ("google", "google", "GoogleProvider"),
+    ("azure", "azure", "AzureOpenAIProvider"),
+    ("groq", "groq", "GroqProvider"),
+    ("mistral", "mistral", "MistralProvider"),
+    ("openrouter", "openrouter", "OpenRouterProvider"),
+    ("bedrock", "bedrock", "BedrockProvider"),
+    ("xai", "xai", "XAIProvider"),
+    ("cerebras", "cerebras", "CerebrasProvider"),
+    ("cohere", "cohere", "CohereProvider"),
+    ("perplexity", "perplexity", "PerplexityProvider"),
+    ("deepseek", "deepseek", "DeepSeekProvider"),
+    ("together", "together", "TogetherProvider"),
+)
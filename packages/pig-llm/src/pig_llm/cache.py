@@ -0,0 +1,95 @@
+"""Exact-match response cache for deterministic completions."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from .models import Message, Response
+
+try:
+    from orjson import OPT_SORT_KEYS
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return _orjson_dumps(obj, option=OPT_SORT_KEYS)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode()
+
+
+def response_key(provider: str, messages: list[Message], params: dict[str, Any]) -> str | None:
+    """Hash a request into a cache key.
+
+    Args:
+        provider: Provider name
+        messages: Request messages
+        params: Call parameters (model, temperature, tools, ...)
+
+    Returns:
+        Hex digest, or None if the parameters are not JSON-serializable
+    """
+    payload = {
+        "provider": provider,
+        "messages": [msg.model_dump() for msg in messages],
+        "params": params,
+    }
+    try:
+        data = _dumps_sorted(payload)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU of responses keyed by :func:`response_key`."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Response] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Response | None:
+        """Get a cached response, marking it recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response or None
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: Response) -> None:
+        """Store a response, evicting the least recently used if full.
+
+        Args:
+            key: Cache key
+            response: Response to cache (frozen, so safe to share)
+        """
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get number of cached responses."""
+        return len(self._entries)
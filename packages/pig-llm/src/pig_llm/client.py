@@ -1,10 +1,101 @@
 """Main LLM client."""
 
+import asyncio
+import functools
+import importlib
+import threading
+import time
 from collections.abc import AsyncIterator, Iterator
+from types import ModuleType
 
+from ._coalesce import acoalesce, coalesce
+from ._providers_meta import PROVIDERS
+from .cache import ResponseCache, response_key
 from .config import Config
+from .latency import LatencyTracker, ProviderTimeout, is_timeout
 from .models import Message, Response, StreamChunk
 
+# Maps provider name to (module, class_name) for lazy import
+_PROVIDER_MAP = {name: (module, class_name) for name, module, class_name in PROVIDERS}
+
+# Provider modules resolved so far; the class is still looked up on the module
+# so later rebinding (e.g. test patches) is honoured.
+_PROVIDER_MODULES: dict[str, ModuleType] = {}
+
+
+def _provider_class(provider: str) -> type | None:
+    """Resolve the provider class for a known provider name."""
+    entry = _PROVIDER_MAP.get(provider)
+    if entry is None:
+        return None
+    module_name, class_name = entry
+    mod = _PROVIDER_MODULES.get(module_name)
+    if mod is None:
+        mod = importlib.import_module(f".providers.{module_name}", package="pig_llm")
+        _PROVIDER_MODULES[module_name] = mod
+    return getattr(mod, class_name)
+
+
+# Providers whose SDK call accepts a per-request ``timeout`` keyword
+_PER_REQUEST_TIMEOUT = frozenset(
+    {
+        "openai",
+        "anthropic",
+        "azure",
+        "groq",
+        "openrouter",
+        "xai",
+        "cerebras",
+        "perplexity",
+        "deepseek",
+        "together",
+    }
+)
+
+# Latency samples shared by every client in the process
+_LATENCY = LatencyTracker()
+
+# Deterministic responses shared by every client in the process (opt-in)
+_RESPONSE_CACHE = ResponseCache()
+
+
+def _response_chunk(response: Response) -> StreamChunk:
+    """Wrap a complete Response as one final StreamChunk.
+
+    Tool calls travel in ``metadata["tool_calls"]``, as streaming providers
+    report them.
+    """
+    metadata = dict(response.metadata or {})
+    if response.tool_calls:
+        metadata["tool_calls"] = response.tool_calls
+    return StreamChunk(
+        content=response.content,
+        finish_reason=response.finish_reason,
+        metadata=metadata or None,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_config(items: tuple) -> Config:
+    """Build a Config from sorted keyword items, reusing earlier instances.
+
+    Config is frozen, so identical keyword sets can safely share one validated
+    instance across LLM clients.
+    """
+    return Config(**dict(items))
+
+
+def _prompt_messages(prompt: str, system: str | None) -> list[Message]:
+    """Build the message list for a single-prompt call.
+
+    Roles are fixed here and prompt/system are typed str by the public API, so
+    model_construct skips the redundant pydantic validation pass.
+    """
+    user = Message.model_construct(role="user", content=prompt, metadata=None)
+    if system:
+        return [Message.model_construct(role="system", content=system, metadata=None), user]
+    return [user]
+
 
 class LLM:
     """Unified LLM client supporting multiple providers."""
@@ -29,38 +120,36 @@ class LLM:
             if api_key:
                 config_dict["api_key"] = api_key
             config_dict.update(kwargs)
-            config = Config(**config_dict)
+            try:
+                config = _cached_config(tuple(sorted(config_dict.items())))
+            except TypeError:
+                # Unhashable values can't key the cache; validate directly
+                config = Config(**config_dict)
 
         self.config = config
+        # Per-call defaults; Config is frozen so these cannot go stale
+        self._defaults = {
+            "model": config.model,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+        }
         self._provider = self._init_provider()
-
-    # Maps provider name to (module, class_name) for lazy import
-    _PROVIDER_MAP = {
-        "openai": ("openai", "OpenAIProvider"),
-        "anthropic": ("anthropic", "AnthropicProvider"),
-        "google": ("google", "GoogleProvider"),
-        "azure": ("azure", "AzureOpenAIProvider"),
-        "groq": ("groq", "GroqProvider"),
-        "mistral": ("mistral", "MistralProvider"),
-        "openrouter": ("openrouter", "OpenRouterProvider"),
-        "bedrock": ("bedrock", "BedrockProvider"),
-        "xai": ("xai", "XAIProvider"),
-        "cerebras": ("cerebras", "CerebrasProvider"),
-        "cohere": ("cohere", "CohereProvider"),
-        "perplexity": ("perplexity", "PerplexityProvider"),
-        "deepseek": ("deepseek", "DeepSeekProvider"),
-        "together": ("together", "TogetherProvider"),
-    }
+        self._warmup_task = None
+        if config.eager_warmup:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Sync caller: warm the sync client's pool in the background
+                threading.Thread(
+                    target=self._provider.warmup_sync, name="pig-llm-warmup", daemon=True
+                ).start()
+            else:
+                self._warmup_task = loop.create_task(self._provider.warmup())
 
     def _init_provider(self):
         """Initialize the provider client."""
-        entry = self._PROVIDER_MAP.get(self.config.provider)
-        if entry:
-            module_name, class_name = entry
-            import importlib
-
-            mod = importlib.import_module(f".providers.{module_name}", package="pig_llm")
-            provider_class = getattr(mod, class_name)
+        provider_class = _provider_class(self.config.provider)
+        if provider_class is not None:
             return provider_class(self.config)
 
         # Unknown provider → OpenAI-compatible with base_url
@@ -69,9 +158,7 @@ class LLM:
                 f"Unknown provider '{self.config.provider}'. "
                 f"Provide base_url for OpenAI-compatible custom providers."
             )
-        from .providers.openai import OpenAIProvider
-
-        return OpenAIProvider(self.config)
+        return _provider_class("openai")(self.config)
 
     def complete(
         self,
@@ -89,18 +176,7 @@ class LLM:
         Returns:
             Response object with content and metadata
         """
-        messages = []
-        if system:
-            messages.append(Message(role="system", content=system))
-        messages.append(Message(role="user", content=prompt))
-
-        return self._provider.complete(
-            messages=messages,
-            model=kwargs.get("model", self.config.model),
-            temperature=kwargs.get("temperature", self.config.temperature),
-            max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            **kwargs,
-        )
+        return self.chat(_prompt_messages(prompt, system), **kwargs)
 
     def stream(
         self,
@@ -118,18 +194,15 @@ class LLM:
         Yields:
             StreamChunk objects with content
         """
-        messages = []
-        if system:
-            messages.append(Message(role="system", content=system))
-        messages.append(Message(role="user", content=prompt))
+        messages = _prompt_messages(prompt, system)
 
-        yield from self._provider.stream(
+        stream = self._provider.stream(
             messages=messages,
-            model=kwargs.get("model", self.config.model),
-            temperature=kwargs.get("temperature", self.config.temperature),
-            max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            **kwargs,
+            **{**self._defaults, **kwargs},
         )
+        if self.config.stream_coalesce_ms:
+            stream = coalesce(stream, self.config.stream_coalesce_ms)
+        yield from stream
 
     def chat(
         self,
@@ -145,17 +218,69 @@ class LLM:
         Returns:
             Response object with content and metadata
         """
-        model = kwargs.pop("model", self.config.model)
-        temperature = kwargs.pop("temperature", self.config.temperature)
-        max_tokens = kwargs.pop("max_tokens", self.config.max_tokens)
+        params = {**self._defaults, **kwargs}
+        key = self._cache_key(messages, params)
+        if key is not None and (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+
+        if not self.config.adaptive_timeout:
+            response = self._provider.complete(messages=messages, **params)
+        else:
+            latency_key, timeout = self._apply_timeout(params)
+            start = time.perf_counter()
+            try:
+                response = self._provider.complete(messages=messages, **params)
+            except Exception as e:
+                if is_timeout(e):
+                    raise ProviderTimeout(latency_key[0], latency_key[1], timeout) from e
+                raise
+            _LATENCY.record(latency_key, time.perf_counter() - start)
+
+        if key is not None:
+            _RESPONSE_CACHE.put(key, response)
+        return response
+
+    @property
+    def streams_tool_calls(self) -> bool:
+        """Whether chat_stream()/achat_stream() surface tool calls."""
+        return self._provider.streams_tool_calls
+
+    def chat_stream(
+        self,
+        messages: list[Message],
+        **kwargs,
+    ) -> Iterator[StreamChunk]:
+        """Stream a chat completion with full message history.
 
-        return self._provider.complete(
-            messages=messages,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
+        Args:
+            messages: List of Message objects
+            **kwargs: Additional parameters (tools, etc.)
+
+        Yields:
+            StreamChunk objects with content. When :attr:`streams_tool_calls`
+            is true, requested tool calls arrive in a final chunk's
+            ``metadata["tool_calls"]``. A cacheable request is answered by
+            :meth:`chat` as a single chunk.
+        """
+        params = {**self._defaults, **kwargs}
+        if self._cache_key(messages, params) is not None:
+            yield _response_chunk(self.chat(messages, **kwargs))
+            return
+
+        # Stream durations scale with output length, so they are not recorded
+        # as latency samples; the timeout learned from chat() still applies.
+        latency_key, timeout = (
+            self._apply_timeout(params) if self.config.adaptive_timeout else (None, None)
         )
+        stream = self._provider.stream(messages=messages, **params)
+        if self.config.stream_coalesce_ms:
+            stream = coalesce(stream, self.config.stream_coalesce_ms)
+        try:
+            yield from stream
+        except Exception as e:
+            if latency_key is not None and is_timeout(e):
+                raise ProviderTimeout(latency_key[0], latency_key[1], timeout) from e
+            raise
 
     async def achat(
         self,
@@ -171,16 +296,122 @@ class LLM:
         Returns:
             Response object with content and metadata
         """
-        model = kwargs.pop("model", self.config.model)
-        temperature = kwargs.pop("temperature", self.config.temperature)
-        max_tokens = kwargs.pop("max_tokens", self.config.max_tokens)
+        params = {**self._defaults, **kwargs}
+        key = self._cache_key(messages, params)
+        if key is not None and (cached := _RESPONSE_CACHE.get(key)) is not None:
+            return cached
+
+        if not self.config.adaptive_timeout:
+            response = await self._provider.acomplete(messages=messages, **params)
+        else:
+            latency_key, timeout = self._apply_timeout(params)
+            start = time.perf_counter()
+            try:
+                response = await self._provider.acomplete(messages=messages, **params)
+            except Exception as e:
+                if is_timeout(e):
+                    raise ProviderTimeout(latency_key[0], latency_key[1], timeout) from e
+                raise
+            _LATENCY.record(latency_key, time.perf_counter() - start)
+
+        if key is not None:
+            _RESPONSE_CACHE.put(key, response)
+        return response
+
+    def _cache_key(self, messages: list[Message], params: dict) -> str | None:
+        """Get the response-cache key for a deterministic request.
 
-        return await self._provider.acomplete(
-            messages=messages,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
+        Args:
+            messages: Request messages
+            params: Call parameters
+
+        Returns:
+            Cache key, or None when caching is off or the request is sampled
+        """
+        if not self.config.enable_cache or params.get("temperature") != 0:
+            return None
+        return response_key(self.config.provider, messages, params)
+
+    def _apply_timeout(self, params: dict) -> tuple[tuple[str, str], float]:
+        """Set an adaptive per-request timeout in ``params`` where supported.
+
+        Args:
+            params: Call parameters (mutated)
+
+        Returns:
+            Tuple of ((provider, model), timeout applied)
+        """
+        key = (self.config.provider, params.get("model") or self.config.model)
+        if "timeout" in params:
+            return key, params["timeout"]
+        timeout = _LATENCY.timeout_for(key, self.config.timeout, self.config.min_timeout)
+        provider = self.config.provider
+        # Unknown providers are served by the OpenAI-compatible client
+        if provider in _PER_REQUEST_TIMEOUT or provider not in _PROVIDER_MAP:
+            params["timeout"] = timeout
+        return key, timeout
+
+    async def warmup(self) -> None:
+        """Pre-open the provider connection so the first request skips the handshake."""
+        await self._provider.warmup()
+
+    def batch(
+        self,
+        batches: list[list[Message]],
+        **kwargs,
+    ) -> list[Response | BaseException]:
+        """Run several independent chat completions concurrently from sync code.
+
+        Args:
+            batches: One message list per conversation
+            **kwargs: Additional parameters (max_concurrency, return_exceptions, etc.)
+
+        Returns:
+            Responses (or exceptions, with ``return_exceptions=True``) in the
+            same order as ``batches``
+        """
+        return self._provider.batch(
+            batches,
+            **{**self._defaults, **kwargs},
+        )
+
+    async def abatch(
+        self,
+        batches: list[list[Message]],
+        **kwargs,
+    ) -> list[Response | BaseException]:
+        """Run several independent chat completions concurrently.
+
+        Args:
+            batches: One message list per conversation
+            **kwargs: Additional parameters (max_concurrency, return_exceptions, etc.)
+
+        Returns:
+            Responses (or exceptions, with ``return_exceptions=True``) in the
+            same order as ``batches``
+        """
+        return await self._provider.abatch(
+            batches,
+            **{**self._defaults, **kwargs},
+        )
+
+    async def batch_prompt(
+        self,
+        prompts: list[str],
+        **kwargs,
+    ) -> list[str]:
+        """Answer many short prompts by packing them into numbered requests.
+
+        Args:
+            prompts: Independent prompts
+            **kwargs: Additional parameters (template, etc.)
+
+        Returns:
+            One answer per prompt, in order
+        """
+        return await self._provider.batch_prompt(
+            prompts,
+            **{**self._defaults, **kwargs},
         )
 
     async def achat_stream(
@@ -195,17 +426,24 @@ class LLM:
             **kwargs: Additional parameters (tools, etc.)
 
         Yields:
-            StreamChunk objects with content
+            StreamChunk objects with content. A cacheable request is answered
+            by :meth:`achat` as a single chunk.
         """
-        model = kwargs.pop("model", self.config.model)
-        temperature = kwargs.pop("temperature", self.config.temperature)
-        max_tokens = kwargs.pop("max_tokens", self.config.max_tokens)
+        params = {**self._defaults, **kwargs}
+        if self._cache_key(messages, params) is not None:
+            yield _response_chunk(await self.achat(messages, **kwargs))
+            return
 
-        async for chunk in self._provider.astream(
-            messages=messages,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        ):
-            yield chunk
+        latency_key, timeout = (
+            self._apply_timeout(params) if self.config.adaptive_timeout else (None, None)
+        )
+        stream = self._provider.astream(messages=messages, **params)
+        if self.config.stream_coalesce_ms:
+            stream = acoalesce(stream, self.config.stream_coalesce_ms)
+        try:
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            if latency_key is not None and is_timeout(e):
+                raise ProviderTimeout(latency_key[0], latency_key[1], timeout) from e
+            raise
@@ -1,11 +1,19 @@
 """Configuration for LLM clients."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from ._providers_meta import PROVIDERS
+
+# Providers with a built-in implementation; any other name is treated as an
+# OpenAI-compatible endpoint and needs base_url.
+_PROVIDERS = frozenset(name for name, _, _ in PROVIDERS)
 
 
 class Config(BaseModel):
     """Configuration for LLM client."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str = "openai"
     model: str = "gpt-4"
     api_key: str | None = None
@@ -13,9 +21,20 @@ class Config(BaseModel):
     max_tokens: int | None = Field(default=None, ge=1)
     timeout: int = Field(default=30, ge=1)
     max_retries: int = Field(default=3, ge=0)
+    max_concurrency: int = Field(default=8, ge=1)
+    row_marshal_batch_size: int = Field(default=10, ge=1)
+    stream_coalesce_ms: float = Field(default=0.0, ge=0.0)  # 0 disables coalescing
+    eager_warmup: bool = False
+    adaptive_timeout: bool = False  # Shrink timeout toward observed p99 × 1.5
+    min_timeout: float = Field(default=5.0, gt=0.0)
+    enable_cache: bool = False  # Reuse responses for identical temperature=0 requests
     base_url: str | None = None
 
-    class Config:
-        """Pydantic config."""
-
-        frozen = True
+    @model_validator(mode="after")
+    def _check_provider(self) -> "Config":
+        if self.provider not in _PROVIDERS and not self.base_url:
+            raise ValueError(
+                f"Unknown provider '{self.provider}'. "
+                f"Provide base_url for OpenAI-compatible custom providers."
+            )
+        return self
@@ -0,0 +1,97 @@
+"""Per-provider latency tracking for adaptive request timeouts."""
+
+import threading
+from collections import deque
+
+import httpx
+
+# Recent samples kept per (provider, model); older ones age out
+_WINDOW = 200
+# Samples required before the observed p99 is trusted over the fixed timeout
+_MIN_SAMPLES = 20
+
+
+class ProviderTimeout(TimeoutError):
+    """Raised when a provider call exceeds its (adaptive) timeout.
+
+    Attributes:
+        provider: Provider name
+        model: Model name
+        timeout: Timeout that was applied, in seconds
+    """
+
+    def __init__(self, provider: str, model: str, timeout: float):
+        super().__init__(f"{provider} ({model}) timed out after {timeout:.1f}s")
+        self.provider = provider
+        self.model = model
+        self.timeout = timeout
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Check whether an SDK exception represents a request timeout.
+
+    The OpenAI, Anthropic and Groq SDKs each raise their own
+    ``APITimeoutError``, which does not subclass ``TimeoutError``.
+    """
+    if isinstance(error, (TimeoutError, httpx.TimeoutException)):
+        return True
+    return any(cls.__name__ == "APITimeoutError" for cls in type(error).__mro__)
+
+
+class LatencyTracker:
+    """Sliding window of call latencies per (provider, model)."""
+
+    def __init__(self, window: int = _WINDOW):
+        """Initialize tracker.
+
+        Args:
+            window: Number of recent samples to keep per key
+        """
+        self._window = window
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: tuple[str, str], seconds: float) -> None:
+        """Record a successful call's latency.
+
+        Args:
+            key: (provider, model)
+            seconds: Wall-clock latency
+        """
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def p99(self, key: tuple[str, str]) -> float | None:
+        """Get the 99th percentile latency, or None until enough samples exist.
+
+        Args:
+            key: (provider, model)
+
+        Returns:
+            p99 latency in seconds, or None
+        """
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < _MIN_SAMPLES:
+                return None
+            ordered = sorted(samples)
+        return ordered[int(0.99 * (len(ordered) - 1))]
+
+    def timeout_for(self, key: tuple[str, str], ceiling: float, floor: float) -> float:
+        """Get the timeout to apply to the next call: ``p99 × 1.5`` clamped.
+
+        Args:
+            key: (provider, model)
+            ceiling: Upper bound (the configured fixed timeout)
+            floor: Lower bound
+
+        Returns:
+            Timeout in seconds
+        """
+        p99 = self.p99(key)
+        if p99 is None:
+            return ceiling
+        return min(ceiling, max(floor, p99 * 1.5))
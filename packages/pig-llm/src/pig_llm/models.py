@@ -2,20 +2,24 @@
 
 from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Message(BaseModel):
     """A message in a conversation."""
 
+    model_config = ConfigDict(frozen=True)
+
     role: Literal["system", "user", "assistant", "tool"]
-    content: str
+    content: str | None
     metadata: dict[str, Any] | None = None
 
 
 class Response(BaseModel):
     """Response from an LLM completion."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str
     model: str
     usage: dict[str, int] | None = None
@@ -27,6 +31,8 @@ class Response(BaseModel):
 class StreamChunk(BaseModel):
     """A chunk from a streaming response."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str
     finish_reason: str | None = None
     metadata: dict[str, Any] | None = None
@@ -35,6 +41,8 @@ class StreamChunk(BaseModel):
 class Usage(BaseModel):
     """Token usage information."""
 
+    model_config = ConfigDict(frozen=True)
+
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
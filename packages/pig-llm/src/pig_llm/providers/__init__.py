@@ -1,33 +1,31 @@
 """Provider implementations."""
 
+import importlib
+
+from .._providers_meta import PROVIDERS
 from ._base import Provider
 
-# Import providers with graceful fallback for missing dependencies.
-# Each provider's SDK is optional — only the ones you use need to be installed.
+# Providers are imported lazily on first attribute access (PEP 562).
+# Each provider's SDK is optional — only the ones you use need to be installed;
+# a provider whose SDK is missing resolves to None.
+_PROVIDER_MODULES = {class_name: module for _, module, class_name in PROVIDERS}
 
 
-def _try_import(name, module, attr):
+def __getattr__(name: str):
+    module = _PROVIDER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     try:
-        mod = __import__(f"pig_llm.providers.{module}", fromlist=[attr])
-        return getattr(mod, attr)
-    except (ImportError, ModuleNotFoundError):
-        return None
-
-
-OpenAIProvider = _try_import("openai", "openai", "OpenAIProvider")
-AnthropicProvider = _try_import("anthropic", "anthropic", "AnthropicProvider")
-GoogleProvider = _try_import("google", "google", "GoogleProvider")
-AzureOpenAIProvider = _try_import("azure", "azure", "AzureOpenAIProvider")
-GroqProvider = _try_import("groq", "groq", "GroqProvider")
-MistralProvider = _try_import("mistral", "mistral", "MistralProvider")
-OpenRouterProvider = _try_import("openrouter", "openrouter", "OpenRouterProvider")
-BedrockProvider = _try_import("bedrock", "bedrock", "BedrockProvider")
-XAIProvider = _try_import("xai", "xai", "XAIProvider")
-CerebrasProvider = _try_import("cerebras", "cerebras", "CerebrasProvider")
-CohereProvider = _try_import("cohere", "cohere", "CohereProvider")
-PerplexityProvider = _try_import("perplexity", "perplexity", "PerplexityProvider")
-DeepSeekProvider = _try_import("deepseek", "deepseek", "DeepSeekProvider")
-TogetherProvider = _try_import("together", "together", "TogetherProvider")
+        value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_PROVIDER_MODULES))
+
 
 __all__ = [
     "Provider",
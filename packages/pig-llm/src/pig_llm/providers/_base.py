@@ -1,14 +1,129 @@
 """Base provider class."""
 
+import asyncio
+import json
+import re
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from ..models import Message, Response, StreamChunk
 
+BATCH_PROMPT_TEMPLATE = "Answer each item separately, prefixed 'N)':\n{items}"
+
+# Start of a numbered answer line, e.g. "3) ..."
+_NUMBERED_ITEM_RE = re.compile(r"^\s*(\d+)\)\s*", re.MULTILINE)
+
+
+def _split_numbered(text: str, count: int) -> list[str]:
+    """Split an ``N)``-numbered response into ``count`` answers.
+
+    Items the model skipped (or numbered out of range) come back as "".
+    """
+    answers = [""] * count
+    parts = _NUMBERED_ITEM_RE.split(text)
+    # parts = [preamble, num, body, num, body, ...]
+    for num, body in zip(parts[1::2], parts[2::2], strict=False):
+        index = int(num) - 1
+        if 0 <= index < count:
+            answers[index] = body.strip()
+    return answers
+
+
+STREAM_BATCH_TEMPLATE = (
+    'Each line below is a JSON object with an index "i" and a "prompt". '
+    "Answer every prompt. Reply with exactly one JSON object per line, "
+    '{{"i": <index>, "answer": <string>}}, and nothing else.\n\n{items}'
+)
+
+
+def _batch_chunk(line: str) -> StreamChunk | None:
+    """Parse one ``{"i": ..., "answer": ...}`` line into an indexed chunk.
+
+    Blank lines, code fences and malformed lines are skipped.
+    """
+    line = line.strip()
+    if not line.startswith("{"):
+        return None
+    try:
+        item = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(item, dict) or not isinstance(item.get("i"), int):
+        return None
+    return StreamChunk.model_construct(
+        content=str(item.get("answer", "")), finish_reason=None, metadata={"index": item["i"]}
+    )
+
+
+class _LineBuffer:
+    """Reassembles streamed text deltas into complete lines."""
+
+    def __init__(self):
+        self._partial = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add a delta and return the lines it completed."""
+        *lines, self._partial = (self._partial + text).split("\n")
+        return lines
+
+    def flush(self) -> str:
+        """Return whatever trails the last newline."""
+        rest, self._partial = self._partial, ""
+        return rest
+
+
+def _stream_batch_messages(prompts: list[str], template: str) -> list[Message]:
+    items = "\n".join(json.dumps({"i": i, "prompt": p}) for i, p in enumerate(prompts))
+    return [Message(role="user", content=template.format(items=items))]
+
+
+def _models_list(client: Any) -> Callable | None:
+    """Get an SDK client's ``models.list`` method, if it has one."""
+    return getattr(getattr(client, "models", None), "list", None)
+
 
 class Provider(ABC):
     """Base class for LLM providers."""
 
+    # Whether stream()/astream() surface tool calls (as a final chunk with
+    # metadata["tool_calls"]); providers that only stream text leave this False.
+    streams_tool_calls = False
+
+    # Conversions from the previous call, keyed by id(message). Replaced
+    # wholesale on every call, never mutated, so the class default is safe.
+    _convert_cache: dict[int, tuple[Message, Any]] = {}
+
+    def _convert_cached(self, messages: list[Message], convert: Callable[[Message], Any]) -> list:
+        """Convert messages one by one, reusing conversions from the previous call.
+
+        Message is frozen, so an object seen on the previous call converts to the
+        same payload. Agent loops resend the whole history each turn, so only the
+        newly appended messages are converted. Each cache entry keeps a reference
+        to its message, so a recycled id() can never match a stale entry.
+
+        Args:
+            messages: Messages to convert
+            convert: Per-message conversion function
+
+        Returns:
+            Converted messages in order
+        """
+        lookup = self._convert_cache.get
+        cache = {}
+        # Sized up front so long histories never regrow the list
+        result: list = [None] * len(messages)
+        for i, msg in enumerate(messages):
+            key = id(msg)
+            entry = lookup(key)
+            if entry is None or entry[0] is not msg:
+                entry = (msg, convert(msg))
+            cache[key] = entry
+            result[i] = entry[1]
+        self._convert_cache = cache
+        return result
+
     @abstractmethod
     def complete(
         self,
@@ -56,3 +171,256 @@ class Provider(ABC):
     ) -> AsyncIterator[StreamChunk]:
         """Async stream a completion."""
         pass
+
+    async def warmup(self) -> None:
+        """Open a connection to the provider ahead of the first request.
+
+        Issues a cheap model-listing call on the async SDK client so the DNS
+        lookup and TCP/TLS handshake are paid up front and the connection sits
+        in the keep-alive pool. Best effort: providers whose client has no
+        ``models.list`` are skipped and any error is ignored.
+        """
+        list_models = _models_list(getattr(self, "async_client", None))
+        if list_models is None:
+            return
+        try:
+            await list_models()
+        except Exception:
+            pass
+
+    def warmup_sync(self) -> None:
+        """Sync variant of :meth:`warmup`, warming the sync client's pool."""
+        list_models = _models_list(getattr(self, "client", None))
+        if list_models is None:
+            return
+        try:
+            list_models()
+        except Exception:
+            pass
+
+    def batch(
+        self,
+        batches: list[list[Message]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        *,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> list[Response | BaseException]:
+        """Complete several independent conversations concurrently from sync code.
+
+        Sync counterpart of :meth:`abatch`: requests go through complete on a
+        thread pool, so it works with or without a running event loop and never
+        shares the async SDK clients across loops.
+
+        Args:
+            batches: One message list per conversation
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens per response
+            max_concurrency: In-flight request limit (defaults to
+                ``config.max_concurrency``)
+            return_exceptions: Return a failed item's exception in its slot
+                instead of raising
+            **kwargs: Additional provider parameters
+
+        Returns:
+            Responses (or exceptions) in the same order as ``batches``
+        """
+        if not batches:
+            return []
+
+        def one(messages: list[Message]) -> Response | BaseException:
+            try:
+                return self.complete(messages, model, temperature, max_tokens, **kwargs)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        workers = min(max_concurrency or self.config.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(one, batches))
+
+    async def abatch(
+        self,
+        batches: list[list[Message]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        *,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> list[Response | BaseException]:
+        """Complete several independent conversations concurrently.
+
+        Requests go through acomplete, at most ``max_concurrency`` at a time;
+        rate-limit retries are left to the SDK clients (``max_retries``), so
+        each item is retried on its own without holding up the others.
+
+        Args:
+            batches: One message list per conversation
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens per response
+            max_concurrency: In-flight request limit (defaults to
+                ``config.max_concurrency``)
+            return_exceptions: Return a failed item's exception in its slot
+                instead of raising, so one bad request does not discard the
+                rest of the batch
+            **kwargs: Additional provider parameters
+
+        Returns:
+            Responses (or exceptions) in the same order as ``batches``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.max_concurrency)
+
+        async def one(messages: list[Message]) -> Response:
+            async with semaphore:
+                return await self.acomplete(messages, model, temperature, max_tokens, **kwargs)
+
+        return list(
+            await asyncio.gather(
+                *(one(messages) for messages in batches),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def batch_prompt(
+        self,
+        prompts: list[str],
+        model: str,
+        template: str = BATCH_PROMPT_TEMPLATE,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs,
+    ) -> list[str]:
+        """Answer many short prompts with a few packed requests.
+
+        Prompts are grouped ``config.row_marshal_batch_size`` at a time, each
+        group is rendered as a numbered list into ``template`` and sent as one
+        request, and the numbered answers are split back out. Suited to short
+        outputs (classification, extraction) where per-request overhead
+        dominates; groups run concurrently via :meth:`abatch`.
+
+        Args:
+            prompts: Independent prompts
+            model: Model name
+            template: Prompt template with an ``{items}`` placeholder
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens per packed response
+            **kwargs: Additional provider parameters
+
+        Returns:
+            One answer per prompt, in order ("" where the model skipped an item)
+
+        Raises:
+            TypeError: If ``return_exceptions`` is passed; a failed group
+                cannot be split into per-prompt answers
+        """
+        if "return_exceptions" in kwargs:
+            raise TypeError("batch_prompt() does not support return_exceptions")
+        size = self.config.row_marshal_batch_size
+        groups = [prompts[i : i + size] for i in range(0, len(prompts), size)]
+        batches = [
+            [
+                Message(
+                    role="user",
+                    content=template.format(
+                        items="\n".join(f"{n}) {p}" for n, p in enumerate(group, 1))
+                    ),
+                )
+            ]
+            for group in groups
+        ]
+
+        responses = await self.abatch(batches, model, temperature, max_tokens, **kwargs)
+
+        answers: list[str] = []
+        for group, response in zip(groups, responses, strict=True):
+            answers.extend(_split_numbered(response.content or "", len(group)))
+        return answers
+
+    def stream_batch(
+        self,
+        prompts: list[str],
+        model: str,
+        template: str = STREAM_BATCH_TEMPLATE,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs,
+    ) -> Iterator[StreamChunk]:
+        """Stream answers to many prompts sent as one JSONL request.
+
+        Prompts go out as ``{"i", "prompt"}`` JSON lines and the model is asked
+        to reply one ``{"i", "answer"}`` line per prompt. Deltas are buffered
+        until a newline completes a line, so answers are yielded as soon as
+        each one finishes, tagged with ``metadata["index"]``.
+
+        Args:
+            prompts: Independent prompts
+            model: Model name
+            template: Prompt template with an ``{items}`` placeholder
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens for the whole response
+            **kwargs: Additional provider parameters
+
+        Yields:
+            One indexed StreamChunk per answered prompt, then the stop chunk
+        """
+        messages = _stream_batch_messages(prompts, template)
+        lines = _LineBuffer()
+        stop = None
+
+        for chunk in self.stream(messages, model, temperature, max_tokens, **kwargs):
+            if chunk.finish_reason:
+                stop = chunk
+            for line in lines.feed(chunk.content or ""):
+                if (item := _batch_chunk(line)) is not None:
+                    yield item
+
+        if (item := _batch_chunk(lines.flush())) is not None:
+            yield item
+        if stop is not None:
+            yield stop
+
+    async def astream_batch(
+        self,
+        prompts: list[str],
+        model: str,
+        template: str = STREAM_BATCH_TEMPLATE,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs,
+    ) -> AsyncIterator[StreamChunk]:
+        """Async variant of :meth:`stream_batch`.
+
+        Args:
+            prompts: Independent prompts
+            model: Model name
+            template: Prompt template with an ``{items}`` placeholder
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens for the whole response
+            **kwargs: Additional provider parameters
+
+        Yields:
+            One indexed StreamChunk per answered prompt, then the stop chunk
+        """
+        messages = _stream_batch_messages(prompts, template)
+        lines = _LineBuffer()
+        stop = None
+
+        async for chunk in self.astream(messages, model, temperature, max_tokens, **kwargs):
+            if chunk.finish_reason:
+                stop = chunk
+            for line in lines.feed(chunk.content or ""):
+                if (item := _batch_chunk(line)) is not None:
+                    yield item
+
+        if (item := _batch_chunk(lines.flush())) is not None:
+            yield item
+        if stop is not None:
+            yield stop
@@ -0,0 +1,238 @@
+"""Shared SDK clients and message conversion for OpenAI-compatible providers."""
+
+import atexit
+import importlib.util
+import operator
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+import openai
+
+from ..config import Config
+from ..models import Message, StreamChunk
+
+# One tuned connection pool per endpoint; every provider instance pointing at
+# the same base_url reuses its warm keep-alive connections.
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+
+# Negotiate HTTP/2 (via ALPN, falling back to HTTP/1.1) when h2 is installed,
+# so concurrent streams to one endpoint multiplex over a single connection.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Sync SDK clients keyed by (api_key, base_url, timeout, max_retries). Async
+# clients are not shared: their connection pool is bound to the event loop that
+# first uses it, and a later asyncio.run() would find that loop closed.
+_CLIENT_CACHE: dict[tuple, openai.OpenAI] = {}
+
+
+def _cache_key(config: Config, base_url: str | None) -> tuple:
+    return (config.api_key, base_url, config.timeout, config.max_retries)
+
+
+def get_client(config: Config, base_url: str | None) -> openai.OpenAI:
+    """Get a cached sync OpenAI SDK client for a config and endpoint.
+
+    Args:
+        config: Provider configuration
+        base_url: API base URL (None for the OpenAI default)
+
+    Returns:
+        Sync client
+    """
+    key = _cache_key(config, base_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = openai.OpenAI(
+            api_key=config.api_key,
+            base_url=base_url,
+            timeout=config.timeout,
+            max_retries=config.max_retries,
+            http_client=openai.DefaultHttpxClient(limits=_LIMITS, http2=_HTTP2),
+        )
+    return client
+
+
+def new_async_client(config: Config, base_url: str | None) -> openai.AsyncOpenAI:
+    """Create an async OpenAI SDK client for a config and endpoint.
+
+    Args:
+        config: Provider configuration
+        base_url: API base URL (None for the OpenAI default)
+
+    Returns:
+        Async client, owned by the caller
+    """
+    return openai.AsyncOpenAI(
+        api_key=config.api_key,
+        base_url=base_url,
+        timeout=config.timeout,
+        max_retries=config.max_retries,
+        http_client=openai.DefaultAsyncHttpxClient(limits=_LIMITS, http2=_HTTP2),
+    )
+
+
+def get_clients(config: Config, base_url: str | None) -> tuple[openai.OpenAI, openai.AsyncOpenAI]:
+    """Get the shared sync client and a new async client for a config and endpoint.
+
+    Args:
+        config: Provider configuration
+        base_url: API base URL (None for the OpenAI default)
+
+    Returns:
+        Tuple of (sync client, async client)
+    """
+    return get_client(config, base_url), new_async_client(config, base_url)
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close pooled sync connections at interpreter exit.
+
+    Async clients are left to the garbage collector: closing them needs a
+    running event loop, which is usually gone by the time atexit hooks run.
+    """
+    for client in _CLIENT_CACHE.values():
+        client.close()
+    _CLIENT_CACHE.clear()
+
+
+_USAGE_FIELDS = operator.attrgetter("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def extract_usage(usage) -> dict[str, int]:
+    """Convert an SDK ``CompletionUsage`` (or None) to a usage dict.
+
+    Args:
+        usage: ``response.usage`` from a chat completion
+
+    Returns:
+        Dict with prompt, completion and total token counts (zeros if absent)
+    """
+    if usage is None:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    prompt_tokens, completion_tokens, total_tokens = _USAGE_FIELDS(usage)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": total_tokens,
+    }
+
+
+def convert_message(msg: Message) -> dict:
+    """Convert a single internal message to OpenAI chat format."""
+    if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
+        return {
+            "role": "assistant",
+            "content": msg.content or None,
+            "tool_calls": msg.metadata["tool_calls"],
+        }
+    if msg.role == "tool" and msg.metadata:
+        return {
+            "role": "tool",
+            "content": msg.content,
+            "tool_call_id": msg.metadata.get("tool_call_id", ""),
+        }
+    return {"role": msg.role, "content": msg.content}
+
+
+class _ToolCallDeltas:
+    """Reassembles streamed ``delta.tool_calls`` fragments into complete calls."""
+
+    def __init__(self):
+        self._calls: dict[int, dict] = {}
+
+    def feed(self, deltas) -> None:
+        """Merge one chunk's tool call fragments."""
+        for delta in deltas:
+            call = self._calls.get(delta.index)
+            if call is None:
+                call = self._calls[delta.index] = {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""},
+                }
+            if delta.id:
+                call["id"] = delta.id
+            function = delta.function
+            if function is not None:
+                if function.name:
+                    call["function"]["name"] = function.name
+                if function.arguments:
+                    call["function"]["arguments"] += function.arguments
+
+    def result(self) -> list[dict]:
+        """Get the completed calls in index order."""
+        return [self._calls[index] for index in sorted(self._calls)]
+
+
+def _content_chunk(chunk, deltas: _ToolCallDeltas) -> StreamChunk | None:
+    if not chunk.choices:
+        return None
+    choice = chunk.choices[0]
+    delta = choice.delta
+    if delta.tool_calls:
+        deltas.feed(delta.tool_calls)
+    if not delta.content:
+        return None
+    return StreamChunk.model_construct(
+        content=delta.content,
+        finish_reason=choice.finish_reason,
+        metadata={"id": chunk.id},
+    )
+
+
+def _tool_calls_chunk(deltas: _ToolCallDeltas, chunk_id: str | None) -> StreamChunk | None:
+    calls = deltas.result()
+    if not calls:
+        return None
+    return StreamChunk.model_construct(
+        content="",
+        finish_reason="tool_calls",
+        metadata={"id": chunk_id, "tool_calls": calls},
+    )
+
+
+def stream_chunks(stream) -> Iterator[StreamChunk]:
+    """Convert an SDK chat completion stream to StreamChunks.
+
+    Text deltas are yielded as they arrive. Tool call fragments are
+    reassembled and yielded once, complete, as a final chunk with
+    ``finish_reason="tool_calls"`` and the calls in ``metadata["tool_calls"]``.
+
+    Args:
+        stream: Stream returned by ``chat.completions.create(stream=True)``
+
+    Yields:
+        StreamChunk objects
+    """
+    deltas = _ToolCallDeltas()
+    chunk_id = None
+    for chunk in stream:
+        chunk_id = chunk.id
+        out = _content_chunk(chunk, deltas)
+        if out is not None:
+            yield out
+    out = _tool_calls_chunk(deltas, chunk_id)
+    if out is not None:
+        yield out
+
+
+async def astream_chunks(stream) -> AsyncIterator[StreamChunk]:
+    """Async variant of :func:`stream_chunks`.
+
+    Args:
+        stream: Stream returned by async ``chat.completions.create(stream=True)``
+
+    Yields:
+        StreamChunk objects
+    """
+    deltas = _ToolCallDeltas()
+    chunk_id = None
+    async for chunk in stream:
+        chunk_id = chunk.id
+        out = _content_chunk(chunk, deltas)
+        if out is not None:
+            yield out
+    out = _tool_calls_chunk(deltas, chunk_id)
+    if out is not None:
+        yield out
@@ -1,6 +1,7 @@
 """Anthropic provider implementation."""
 
 import json
+import weakref
 from collections.abc import AsyncIterator, Iterator
 
 import anthropic
@@ -9,6 +10,28 @@ from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
 
+# Sync SDK clients keyed by (api_key, base_url, timeout, max_retries); sharing
+# them keeps the connection pool (and its keep-alive connections) across
+# providers. Entries go away once no provider holds the client. Async clients
+# stay per provider: their pool is bound to the event loop that first uses it.
+_CLIENT_CACHE: weakref.WeakValueDictionary[tuple, anthropic.Anthropic] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_client(config: Config) -> anthropic.Anthropic:
+    """Get a cached sync SDK client for a config."""
+    key = (config.api_key, config.base_url, config.timeout, config.max_retries)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = anthropic.Anthropic(
+            api_key=config.api_key,
+            base_url=config.base_url,
+            timeout=config.timeout,
+            max_retries=config.max_retries,
+        )
+    return client
+
 
 class AnthropicProvider(Provider):
     """Anthropic (Claude) provider implementation."""
@@ -16,70 +39,60 @@ class AnthropicProvider(Provider):
     def __init__(self, config: Config):
         """Initialize Anthropic provider."""
         self.config = config
-        self.client = anthropic.Anthropic(
-            api_key=config.api_key,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
+        self.client = _get_client(config)
         self.async_client = anthropic.AsyncAnthropic(
             api_key=config.api_key,
+            base_url=config.base_url,
             timeout=config.timeout,
             max_retries=config.max_retries,
         )
 
+    @staticmethod
+    def _convert_message(msg: Message) -> dict:
+        """Convert a single non-system message to Anthropic format."""
+        if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
+            # Rebuild assistant message with tool_use blocks
+            content = [{"type": "text", "text": msg.content}] if msg.content else []
+            content += [
+                {
+                    "type": "tool_use",
+                    "id": tc["id"],
+                    "name": tc["function"]["name"],
+                    "input": json.loads(tc["function"]["arguments"]),
+                }
+                for tc in msg.metadata["tool_calls"]
+            ]
+            return {"role": "assistant", "content": content}
+
+        if msg.role == "tool" and msg.metadata:
+            # Convert tool result to tool_result block
+            return {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": msg.metadata.get("tool_call_id"),
+                        "content": msg.content,
+                    }
+                ],
+            }
+
+        # Regular message
+        return {"role": msg.role, "content": msg.content}
+
     def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict]]:
         """Convert internal messages to Anthropic format.
 
         Returns:
             Tuple of (system_message, messages_list)
         """
-        system_message = None
-        anthropic_messages = []
-
-        for msg in messages:
-            if msg.role == "system":
-                system_message = msg.content
-
-            elif msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                # Rebuild assistant message with tool_use blocks
-                content = []
-
-                # Add text block if present
-                if msg.content:
-                    content.append({"type": "text", "text": msg.content})
-
-                # Add tool_use blocks
-                for tc in msg.metadata["tool_calls"]:
-                    content.append(
-                        {
-                            "type": "tool_use",
-                            "id": tc["id"],
-                            "name": tc["function"]["name"],
-                            "input": json.loads(tc["function"]["arguments"]),
-                        }
-                    )
-
-                anthropic_messages.append({"role": "assistant", "content": content})
-
-            elif msg.role == "tool" and msg.metadata:
-                # Convert tool result to tool_result block
-                tool_use_id = msg.metadata.get("tool_call_id")
-                anthropic_messages.append(
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tool_use_id,
-                                "content": msg.content,
-                            }
-                        ],
-                    }
-                )
+        # The last system message wins
+        systems = [m.content for m in messages if m.role == "system"]
+        system_message = systems[-1] if systems else None
 
-            else:
-                # Regular message
-                anthropic_messages.append({"role": msg.role, "content": msg.content})
+        anthropic_messages = self._convert_cached(
+            [m for m in messages if m.role != "system"], self._convert_message
+        )
 
         return system_message, anthropic_messages
 
@@ -149,10 +162,7 @@ class AnthropicProvider(Provider):
         )
 
         # Extract text content
-        content = ""
-        for block in response.content:
-            if block.type == "text":
-                content += block.text
+        content = "".join([b.text for b in response.content if b.type == "text"])
 
         # Extract tool_calls
         tool_calls = self._extract_tool_calls(response.content)
@@ -192,7 +202,7 @@ class AnthropicProvider(Provider):
             **kwargs,
         ) as stream:
             for text in stream.text_stream:
-                yield StreamChunk(content=text, finish_reason=None)
+                yield StreamChunk.model_construct(content=text, finish_reason=None)
 
     async def acomplete(
         self,
@@ -221,10 +231,7 @@ class AnthropicProvider(Provider):
         )
 
         # Extract text content
-        content = ""
-        for block in response.content:
-            if block.type == "text":
-                content += block.text
+        content = "".join([b.text for b in response.content if b.type == "text"])
 
         # Extract tool_calls
         tool_calls = self._extract_tool_calls(response.content)
@@ -264,4 +271,4 @@ class AnthropicProvider(Provider):
             **kwargs,
         ) as stream:
             async for text in stream.text_stream:
-                yield StreamChunk(content=text, finish_reason=None)
+                yield StreamChunk.model_construct(content=text, finish_reason=None)
@@ -1,6 +1,11 @@
 """Amazon Bedrock provider implementation."""
 
+import asyncio
+import functools
+import threading
 from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 
 try:
     import boto3
@@ -8,10 +13,57 @@ try:
 except ImportError as err:
     raise ImportError("boto3 is required for Bedrock. Install with: pip install boto3") from err
 
+try:
+    import aioboto3
+except ImportError:  # pragma: no cover - aioboto3 enables the native async path
+    aioboto3 = None
+
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
 
+# Dedicated pool for the sync boto3 fallback so Bedrock traffic doesn't starve
+# other users of the loop's default executor.
+_EXECUTOR_WORKERS = 16
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared Bedrock worker pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_EXECUTOR_WORKERS, thread_name_prefix="bedrock"
+                )
+    return _executor
+
+
+def _delta_chunk(payload: dict) -> StreamChunk | None:
+    """Chunk for a contentBlockDelta event (None for non-text deltas)."""
+    text = payload["delta"].get("text")
+    if text is None:
+        return None
+    return StreamChunk.model_construct(content=text, finish_reason=None, metadata={})
+
+
+def _stop_chunk(payload: dict) -> StreamChunk:
+    """Final chunk for a messageStop event."""
+    return StreamChunk.model_construct(
+        content="",
+        finish_reason=payload.get("stopReason", "stop"),
+        metadata={},
+    )
+
+
+# converse_stream event type -> chunk builder; other event types are skipped
+_EVENT_HANDLERS = {
+    "contentBlockDelta": _delta_chunk,
+    "messageStop": _stop_chunk,
+}
+
 
 class BedrockProvider(Provider):
     """Amazon Bedrock provider implementation."""
@@ -25,7 +77,7 @@ class BedrockProvider(Provider):
         self.config = config
         self.region = config.api_key or "us-east-1"
 
-        boto_config = BotoConfig(
+        self._boto_config = BotoConfig(
             read_timeout=config.timeout,
             retries={"max_attempts": config.max_retries},
         )
@@ -33,8 +85,51 @@ class BedrockProvider(Provider):
         self.client = boto3.client(
             "bedrock-runtime",
             region_name=self.region,
-            config=boto_config,
+            config=self._boto_config,
         )
+        self._aio_session = aioboto3.Session() if aioboto3 is not None else None
+        # One async client per provider, entered lazily and kept open so its
+        # connection pool and TLS sessions are reused across requests
+        self._aio_loop: asyncio.AbstractEventLoop | None = None
+        self._aio_stack: AsyncExitStack | None = None
+        self._aio_client_task: asyncio.Task | None = None
+
+    async def _aio_client(self):
+        """Get the pooled async Bedrock client, opening it on first use.
+
+        aiobotocore clients are bound to the event loop that opened them, so
+        a client opened under a different (usually already closed) loop is
+        abandoned and a new one opened on the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aio_loop is not loop:
+            self._aio_loop = loop
+            self._aio_stack = AsyncExitStack()
+            self._aio_client_task = loop.create_task(
+                self._aio_stack.enter_async_context(
+                    self._aio_session.client(
+                        "bedrock-runtime",
+                        region_name=self.region,
+                        config=self._boto_config,
+                    )
+                )
+            )
+        task = self._aio_client_task
+        try:
+            # Shielded: a cancelled caller must not cancel the shared open
+            return await asyncio.shield(task)
+        except Exception:
+            if self._aio_client_task is task:
+                # Let the next call retry instead of replaying the failure
+                self._aio_loop = None
+            raise
+
+    async def aclose(self) -> None:
+        """Close the pooled async client, if one is open."""
+        stack = self._aio_stack
+        self._aio_loop = self._aio_stack = self._aio_client_task = None
+        if stack is not None:
+            await stack.aclose()
 
     def _convert_messages(self, messages: list[Message]) -> tuple[str, list[dict]]:
         """Convert internal messages to Bedrock format.
@@ -42,17 +137,22 @@ class BedrockProvider(Provider):
         Returns:
             Tuple of (system_prompt, messages_list)
         """
-        system_prompt = ""
-        converted = []
+        # The last system message wins
+        systems = [msg.content for msg in messages if msg.role == "system"]
+        system_prompt = systems[-1] if systems else ""
 
-        for msg in messages:
-            if msg.role == "system":
-                system_prompt = msg.content
-            else:
-                converted.append({"role": msg.role, "content": [{"text": msg.content}]})
+        converted = self._convert_cached(
+            [msg for msg in messages if msg.role != "system" and msg.content is not None],
+            self._convert_message,
+        )
 
         return system_prompt, converted
 
+    @staticmethod
+    def _convert_message(msg: Message) -> dict:
+        """Convert a single non-system message to Bedrock format."""
+        return {"role": msg.role, "content": [{"text": msg.content}]}
+
     def _build_request_body(
         self,
         messages: list[Message],
@@ -63,16 +163,11 @@ class BedrockProvider(Provider):
         """Build request body for Bedrock."""
         system_prompt, converted_messages = self._convert_messages(messages)
 
-        body = {
-            "messages": converted_messages,
-            "inferenceConfig": {
-                "temperature": temperature,
-            },
-        }
-
+        inference_config = {"temperature": temperature}
         if max_tokens:
-            body["inferenceConfig"]["maxTokens"] = max_tokens
+            inference_config["maxTokens"] = max_tokens
 
+        body = {"messages": converted_messages, "inferenceConfig": inference_config}
         if system_prompt:
             body["system"] = [{"text": system_prompt}]
 
@@ -93,7 +188,11 @@ class BedrockProvider(Provider):
             modelId=model,
             **body,
         )
+        return self._parse_response(response, model)
 
+    @staticmethod
+    def _parse_response(response: dict, model: str) -> Response:
+        """Convert a Bedrock converse response to a Response."""
         output = response["output"]["message"]
         content = output["content"][0]["text"]
 
@@ -131,21 +230,18 @@ class BedrockProvider(Provider):
         stream = response.get("stream")
         if stream:
             for event in stream:
-                if "contentBlockDelta" in event:
-                    delta = event["contentBlockDelta"]["delta"]
-                    if "text" in delta:
-                        yield StreamChunk(
-                            content=delta["text"],
-                            finish_reason=None,
-                            metadata={},
-                        )
-                elif "messageStop" in event:
-                    stop_reason = event["messageStop"].get("stopReason", "stop")
-                    yield StreamChunk(
-                        content="",
-                        finish_reason=stop_reason,
-                        metadata={},
-                    )
+                chunk = self._parse_stream_event(event)
+                if chunk is not None:
+                    yield chunk
+
+    @staticmethod
+    def _parse_stream_event(event: dict) -> StreamChunk | None:
+        """Convert a converse_stream event to a StreamChunk, if it carries one."""
+        # Each event is a single-key dict naming its type
+        for event_type, payload in event.items():
+            handler = _EVENT_HANDLERS.get(event_type)
+            return handler(payload) if handler is not None else None
+        return None
 
     async def acomplete(
         self,
@@ -157,11 +253,20 @@ class BedrockProvider(Provider):
     ) -> Response:
         """Async generate a completion.
 
-        Note: Bedrock doesn't have native async support, this uses sync client.
-        For true async, use aioboto3 library.
+        Uses aioboto3 when installed; otherwise runs the sync boto3 call on the
+        Bedrock worker pool so the event loop is not blocked.
         """
-        # For now, use sync client (true async would require aioboto3)
-        return self.complete(messages, model, temperature, max_tokens, **kwargs)
+        if self._aio_session is None:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(
+                self.complete, messages, model, temperature, max_tokens, **kwargs
+            )
+            return await loop.run_in_executor(_get_executor(), call)
+
+        body = self._build_request_body(messages, model, temperature, max_tokens)
+        client = await self._aio_client()
+        response = await client.converse(modelId=model, **body)
+        return self._parse_response(response, model)
 
     async def astream(
         self,
@@ -173,9 +278,64 @@ class BedrockProvider(Provider):
     ) -> AsyncIterator[StreamChunk]:
         """Async stream a completion.
 
-        Note: Bedrock doesn't have native async support, this uses sync client.
-        For true async, use aioboto3 library.
+        Uses aioboto3 when installed; otherwise drives the sync boto3 stream on
+        the Bedrock worker pool and hands chunks back through a queue.
         """
-        # For now, use sync client (true async would require aioboto3)
-        for chunk in self.stream(messages, model, temperature, max_tokens, **kwargs):
-            yield chunk
+        if self._aio_session is None:
+            async for chunk in self._astream_in_thread(
+                messages, model, temperature, max_tokens, **kwargs
+            ):
+                yield chunk
+            return
+
+        body = self._build_request_body(messages, model, temperature, max_tokens)
+        client = await self._aio_client()
+        response = await client.converse_stream(modelId=model, **body)
+        stream = response.get("stream")
+        if stream:
+            async for event in stream:
+                chunk = self._parse_stream_event(event)
+                if chunk is not None:
+                    yield chunk
+
+    async def _astream_in_thread(
+        self,
+        messages: list[Message],
+        model: str,
+        temperature: float,
+        max_tokens: int | None,
+        **kwargs,
+    ) -> AsyncIterator[StreamChunk]:
+        """Run the sync stream in a worker thread, yielding chunks as they arrive."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()
+
+        def put(item) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # Event loop already closed; nobody is listening
+                stop.set()
+
+        def produce() -> None:
+            try:
+                for chunk in self.stream(messages, model, temperature, max_tokens, **kwargs):
+                    if stop.is_set():
+                        break
+                    put(chunk)
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        future = loop.run_in_executor(_get_executor(), produce)
+        try:
+            while (item := await queue.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+        await future
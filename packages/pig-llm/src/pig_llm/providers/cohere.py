@@ -1,6 +1,7 @@
 """Cohere provider implementation."""
 
 from collections.abc import AsyncIterator, Iterator
+from functools import cached_property
 
 try:
     from cohere import AsyncClient, Client
@@ -11,6 +12,24 @@ from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
 
+# Sync SDK clients keyed by (api_key, timeout, max_retries), shared across
+# providers. Async clients stay per provider: their connection pool is bound to
+# the event loop that first uses it.
+_CLIENT_CACHE: dict[tuple, Client] = {}
+
+
+def _get_client(config: Config) -> Client:
+    """Get a cached sync SDK client for a config."""
+    key = (config.api_key, config.timeout, config.max_retries)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = Client(
+            api_key=config.api_key,
+            timeout=config.timeout,
+            max_retries=config.max_retries,
+        )
+    return client
+
 
 class CohereProvider(Provider):
     """Cohere provider implementation (Command models)."""
@@ -19,15 +38,20 @@ class CohereProvider(Provider):
         """Initialize Cohere provider."""
         self.config = config
 
-        self.client = Client(
-            api_key=config.api_key,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
-        self.async_client = AsyncClient(
-            api_key=config.api_key,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
+    # Clients are resolved on first use, so sync-only or async-only callers
+    # never build the other one.
+    @cached_property
+    def client(self) -> Client:
+        """Sync SDK client."""
+        return _get_client(self.config)
+
+    @cached_property
+    def async_client(self) -> AsyncClient:
+        """Async SDK client."""
+        return AsyncClient(
+            api_key=self.config.api_key,
+            timeout=self.config.timeout,
+            max_retries=self.config.max_retries,
         )
 
     def _convert_messages(self, messages: list[Message]) -> tuple[str, str, list[dict]]:
@@ -36,33 +60,41 @@ class CohereProvider(Provider):
         Returns:
             Tuple of (preamble/system, final_message, chat_history)
         """
-        preamble = ""
-        chat_history = []
-        final_message = ""
+        # The last system message wins
+        systems = [msg.content for msg in messages if msg.role == "system"]
+        preamble = systems[-1] if systems else ""
 
-        for i, msg in enumerate(messages):
-            if msg.role == "system":
-                preamble = msg.content
-            elif msg.role == "user":
-                if i == len(messages) - 1:
-                    # Last user message is the prompt
-                    final_message = msg.content
-                else:
-                    chat_history.append({"role": "USER", "message": msg.content})
-            elif msg.role == "assistant":
-                chat_history.append({"role": "CHATBOT", "message": msg.content})
+        final_message = ""
+        if messages and messages[-1].role == "user":
+            # Last user message is the prompt
+            final_message = messages[-1].content
+            messages = messages[:-1]
+
+        chat_history = self._convert_cached(
+            [
+                msg
+                for msg in messages
+                if msg.role == "user" or (msg.role == "assistant" and msg.content is not None)
+            ],
+            self._convert_message,
+        )
 
         return preamble, final_message, chat_history
 
-    def complete(
+    @staticmethod
+    def _convert_message(msg: Message) -> dict:
+        """Convert a single user/assistant message to a chat_history entry."""
+        role = "USER" if msg.role == "user" else "CHATBOT"
+        return {"role": role, "message": msg.content}
+
+    def _build_params(
         self,
         messages: list[Message],
         model: str,
-        temperature: float = 0.7,
-        max_tokens: int | None = None,
-        **kwargs,
-    ) -> Response:
-        """Generate a completion."""
+        temperature: float,
+        max_tokens: int | None,
+    ) -> dict:
+        """Build chat request parameters shared by all four entry points."""
         preamble, message, chat_history = self._convert_messages(messages)
 
         params = {
@@ -78,26 +110,57 @@ class CohereProvider(Provider):
         if max_tokens:
             params["max_tokens"] = max_tokens
 
-        response = self.client.chat(**params)
+        return params
 
-        usage = {
-            "prompt_tokens": response.meta.tokens.input_tokens if response.meta else 0,
-            "completion_tokens": response.meta.tokens.output_tokens if response.meta else 0,
-            "total_tokens": (
-                response.meta.tokens.input_tokens + response.meta.tokens.output_tokens
-                if response.meta
-                else 0
-            ),
-        }
+    @staticmethod
+    def _parse_response(response, model: str) -> Response:
+        """Convert a Cohere chat response to a Response."""
+        tokens = response.meta.tokens if response.meta else None
+        prompt_tokens = tokens.input_tokens if tokens else 0
+        completion_tokens = tokens.output_tokens if tokens else 0
 
         return Response(
             content=response.text,
             model=model,
-            usage=usage,
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
             finish_reason=response.finish_reason,
             metadata={"generation_id": response.generation_id},
         )
 
+    @staticmethod
+    def _parse_stream_event(event) -> StreamChunk | None:
+        """Convert a chat_stream event to a StreamChunk, if it carries one."""
+        if event.event_type == "text-generation":
+            return StreamChunk.model_construct(
+                content=event.text,
+                finish_reason=None,
+                metadata={},
+            )
+        if event.event_type == "stream-end":
+            return StreamChunk.model_construct(
+                content="",
+                finish_reason=getattr(event, "finish_reason", "stop"),
+                metadata={},
+            )
+        return None
+
+    def complete(
+        self,
+        messages: list[Message],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs,
+    ) -> Response:
+        """Generate a completion."""
+        params = self._build_params(messages, model, temperature, max_tokens)
+        response = self.client.chat(**params)
+        return self._parse_response(response, model)
+
     def stream(
         self,
         messages: list[Message],
@@ -107,38 +170,13 @@ class CohereProvider(Provider):
         **kwargs,
     ) -> Iterator[StreamChunk]:
         """Stream a completion."""
-        preamble, message, chat_history = self._convert_messages(messages)
-
-        params = {
-            "model": model,
-            "message": message,
-            "temperature": temperature,
-        }
-
-        if preamble:
-            params["preamble"] = preamble
-        if chat_history:
-            params["chat_history"] = chat_history
-        if max_tokens:
-            params["max_tokens"] = max_tokens
-
+        params = self._build_params(messages, model, temperature, max_tokens)
         stream = self.client.chat_stream(**params)
 
         for event in stream:
-            if event.event_type == "text-generation":
-                yield StreamChunk(
-                    content=event.text,
-                    finish_reason=None,
-                    metadata={},
-                )
-            elif event.event_type == "stream-end":
-                yield StreamChunk(
-                    content="",
-                    finish_reason=event.finish_reason
-                    if hasattr(event, "finish_reason")
-                    else "stop",
-                    metadata={},
-                )
+            chunk = self._parse_stream_event(event)
+            if chunk is not None:
+                yield chunk
 
     async def acomplete(
         self,
@@ -149,40 +187,9 @@ class CohereProvider(Provider):
         **kwargs,
     ) -> Response:
         """Async generate a completion."""
-        preamble, message, chat_history = self._convert_messages(messages)
-
-        params = {
-            "model": model,
-            "message": message,
-            "temperature": temperature,
-        }
-
-        if preamble:
-            params["preamble"] = preamble
-        if chat_history:
-            params["chat_history"] = chat_history
-        if max_tokens:
-            params["max_tokens"] = max_tokens
-
+        params = self._build_params(messages, model, temperature, max_tokens)
         response = await self.async_client.chat(**params)
-
-        usage = {
-            "prompt_tokens": response.meta.tokens.input_tokens if response.meta else 0,
-            "completion_tokens": response.meta.tokens.output_tokens if response.meta else 0,
-            "total_tokens": (
-                response.meta.tokens.input_tokens + response.meta.tokens.output_tokens
-                if response.meta
-                else 0
-            ),
-        }
-
-        return Response(
-            content=response.text,
-            model=model,
-            usage=usage,
-            finish_reason=response.finish_reason,
-            metadata={"generation_id": response.generation_id},
-        )
+        return self._parse_response(response, model)
 
     async def astream(
         self,
@@ -193,35 +200,10 @@ class CohereProvider(Provider):
         **kwargs,
     ) -> AsyncIterator[StreamChunk]:
         """Async stream a completion."""
-        preamble, message, chat_history = self._convert_messages(messages)
-
-        params = {
-            "model": model,
-            "message": message,
-            "temperature": temperature,
-        }
-
-        if preamble:
-            params["preamble"] = preamble
-        if chat_history:
-            params["chat_history"] = chat_history
-        if max_tokens:
-            params["max_tokens"] = max_tokens
-
+        params = self._build_params(messages, model, temperature, max_tokens)
         stream = self.async_client.chat_stream(**params)
 
         async for event in stream:
-            if event.event_type == "text-generation":
-                yield StreamChunk(
-                    content=event.text,
-                    finish_reason=None,
-                    metadata={},
-                )
-            elif event.event_type == "stream-end":
-                yield StreamChunk(
-                    content="",
-                    finish_reason=event.finish_reason
-                    if hasattr(event, "finish_reason")
-                    else "stop",
-                    metadata={},
-                )
+            chunk = self._parse_stream_event(event)
+            if chunk is not None:
+                yield chunk
@@ -1,12 +1,21 @@
 """DeepSeek provider implementation (Chinese LLM)."""
 
 from collections.abc import AsyncIterator, Iterator
+from functools import cached_property
 
 import openai
 
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
+from ._openai_compat import (
+    astream_chunks,
+    convert_message,
+    extract_usage,
+    get_client,
+    new_async_client,
+    stream_chunks,
+)
 
 
 class DeepSeekProvider(Provider):
@@ -15,47 +24,28 @@ class DeepSeekProvider(Provider):
     DeepSeek uses OpenAI-compatible API, optimized for Chinese and code.
     """
 
+    streams_tool_calls = True
+
     def __init__(self, config: Config):
         """Initialize DeepSeek provider."""
         self.config = config
-        base_url = config.base_url or "https://api.deepseek.com"
+        self._base_url = config.base_url or "https://api.deepseek.com"
 
-        self.client = openai.OpenAI(
-            api_key=config.api_key,
-            base_url=base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
-        self.async_client = openai.AsyncOpenAI(
-            api_key=config.api_key,
-            base_url=base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
+    # Clients are resolved on first use, so sync-only or async-only callers
+    # never build the other one.
+    @cached_property
+    def client(self) -> openai.OpenAI:
+        """Sync SDK client."""
+        return get_client(self.config, self._base_url)
+
+    @cached_property
+    def async_client(self) -> openai.AsyncOpenAI:
+        """Async SDK client."""
+        return new_async_client(self.config, self._base_url)
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert internal messages to DeepSeek format."""
-        result = []
-        for msg in messages:
-            if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                result.append(
-                    {
-                        "role": "assistant",
-                        "content": msg.content or None,
-                        "tool_calls": msg.metadata["tool_calls"],
-                    }
-                )
-            elif msg.role == "tool" and msg.metadata:
-                result.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content,
-                        "tool_call_id": msg.metadata.get("tool_call_id", ""),
-                    }
-                )
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-        return result
+        return self._convert_cached(messages, convert_message)
 
     @staticmethod
     def _extract_tool_calls(message) -> list[dict] | None:
@@ -92,11 +82,7 @@ class DeepSeekProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -125,14 +111,7 @@ class DeepSeekProvider(Provider):
             **kwargs,
         )
 
-        for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        yield from stream_chunks(stream)
 
     async def acomplete(
         self,
@@ -152,11 +131,7 @@ class DeepSeekProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -185,11 +160,5 @@ class DeepSeekProvider(Provider):
             **kwargs,
         )
 
-        async for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        async for chunk in astream_chunks(stream):
+            yield chunk
@@ -20,57 +20,87 @@ class GoogleProvider(Provider):
         self.config = config
         self.client = genai.Client(api_key=config.api_key)
 
+    @staticmethod
+    def _convert_message(msg: Message) -> types.Content:
+        """Convert a single non-system message to a Gemini Content."""
+        if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
+            # Rebuild assistant message with function_call
+            parts = []
+
+            # Add text part if present
+            if msg.content:
+                parts.append(types.Part(text=msg.content))
+
+            # Add function_call parts
+            for tc in msg.metadata["tool_calls"]:
+                parts.append(
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            name=tc["function"]["name"],
+                            args=json.loads(tc["function"]["arguments"]),
+                        )
+                    )
+                )
+
+            return types.Content(role="model", parts=parts)
+
+        if msg.role == "tool" and msg.metadata:
+            # Convert tool result to function_response
+            function_name = msg.metadata.get("function_name")
+            parts = [
+                types.Part.from_function_response(
+                    name=function_name, response={"result": msg.content}
+                )
+            ]
+            return types.Content(role="user", parts=parts)
+
+        # Regular message
+        role = "model" if msg.role == "assistant" else "user"
+        return types.Content(role=role, parts=[types.Part(text=msg.content)])
+
     def _convert_messages(self, messages: list[Message]) -> list:
         """Convert internal messages to Google Gemini format.
 
+        Contents for messages already sent on the previous call are reused, so
+        a growing history only builds Content objects for the new turns.
+
         Returns:
             List of Content objects for Gemini API
         """
-        contents = []
-        system_instruction = None
-
-        for msg in messages:
-            if msg.role == "system":
-                # Store system message separately
-                system_instruction = msg.content
-
-            elif msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                # Rebuild assistant message with function_call
-                parts = []
-
-                # Add text part if present
-                if msg.content:
-                    parts.append(types.Part(text=msg.content))
-
-                # Add function_call parts
-                for tc in msg.metadata["tool_calls"]:
-                    parts.append(
-                        types.Part(
-                            function_call=types.FunctionCall(
-                                name=tc["function"]["name"],
-                                args=json.loads(tc["function"]["arguments"]),
-                            )
-                        )
-                    )
+        # Store system message separately; the last one wins
+        systems = [msg.content for msg in messages if msg.role == "system"]
+        system_instruction = systems[-1] if systems else None
 
-                contents.append(types.Content(role="model", parts=parts))
+        contents = self._convert_cached(
+            [msg for msg in messages if msg.role != "system"], self._convert_message
+        )
 
-            elif msg.role == "tool" and msg.metadata:
-                # Convert tool result to function_response
-                function_name = msg.metadata.get("function_name")
-                parts = [
-                    types.Part.from_function_response(
-                        name=function_name, response={"result": msg.content}
-                    )
-                ]
-                contents.append(types.Content(role="user", parts=parts))
+        return contents, system_instruction
 
-            else:
-                # Regular message
-                role = "model" if msg.role == "assistant" else "user"
-                contents.append(types.Content(role=role, parts=[types.Part(text=msg.content)]))
+    @staticmethod
+    def _parse_stream_chunk(chunk) -> list[StreamChunk]:
+        """Convert one streamed response to StreamChunks.
 
-        return contents, system_instruction
+        Tolerates candidates without content (safety stops, empty keep-alive
+        chunks) and emits a final chunk carrying the finish reason.
+        """
+        if not chunk.candidates:
+            return []
+        candidate = chunk.candidates[0]
+        parts = candidate.content.parts if candidate.content else None
+
+        result = [
+            StreamChunk.model_construct(content=part.text, finish_reason=None, metadata=None)
+            for part in parts or ()
+            if getattr(part, "text", None)
+        ]
+        if candidate.finish_reason:
+            result.append(
+                StreamChunk.model_construct(
+                    content="", finish_reason=str(candidate.finish_reason), metadata=None
+                )
+            )
+        return result
 
     @staticmethod
     def _extract_tool_calls(response) -> list[dict] | None:
@@ -214,13 +244,7 @@ class GoogleProvider(Provider):
         )
 
         for chunk in response_stream:
-            if chunk.candidates and chunk.candidates[0].content.parts:
-                for part in chunk.candidates[0].content.parts:
-                    if hasattr(part, "text") and part.text:
-                        yield StreamChunk(
-                            content=part.text,
-                            finish_reason=None,
-                        )
+            yield from self._parse_stream_chunk(chunk)
 
     async def acomplete(
         self,
@@ -312,10 +336,5 @@ class GoogleProvider(Provider):
         )
 
         async for chunk in response_stream:
-            if chunk.candidates and chunk.candidates[0].content.parts:
-                for part in chunk.candidates[0].content.parts:
-                    if hasattr(part, "text") and part.text:
-                        yield StreamChunk(
-                            content=part.text,
-                            finish_reason=None,
-                        )
+            for stream_chunk in self._parse_stream_chunk(chunk):
+                yield stream_chunk
@@ -7,11 +7,14 @@ from groq import AsyncGroq, Groq
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
+from ._openai_compat import astream_chunks, convert_message, extract_usage, stream_chunks
 
 
 class GroqProvider(Provider):
     """Groq provider implementation (fast LLM inference)."""
 
+    streams_tool_calls = True
+
     def __init__(self, config: Config):
         """Initialize Groq provider."""
         self.config = config
@@ -28,27 +31,7 @@ class GroqProvider(Provider):
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert internal messages to Groq format."""
-        result = []
-        for msg in messages:
-            if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                result.append(
-                    {
-                        "role": "assistant",
-                        "content": msg.content or None,
-                        "tool_calls": msg.metadata["tool_calls"],
-                    }
-                )
-            elif msg.role == "tool" and msg.metadata:
-                result.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content,
-                        "tool_call_id": msg.metadata.get("tool_call_id", ""),
-                    }
-                )
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-        return result
+        return self._convert_cached(messages, convert_message)
 
     @staticmethod
     def _extract_tool_calls(message) -> list[dict] | None:
@@ -85,11 +68,7 @@ class GroqProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -118,14 +97,7 @@ class GroqProvider(Provider):
             **kwargs,
         )
 
-        for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        yield from stream_chunks(stream)
 
     async def acomplete(
         self,
@@ -145,11 +117,7 @@ class GroqProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -178,11 +146,5 @@ class GroqProvider(Provider):
             **kwargs,
         )
 
-        async for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        async for chunk in astream_chunks(stream):
+            yield chunk
@@ -1,6 +1,7 @@
 """Mistral AI provider implementation."""
 
 from collections.abc import AsyncIterator, Iterator
+from functools import cached_property
 
 from mistralai.async_client import MistralAsyncClient
 from mistralai.client import MistralClient
@@ -9,6 +10,16 @@ from mistralai.models.chat_completion import ChatMessage
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
+from ._openai_compat import extract_usage
+
+# Sync SDK clients keyed by api_key, shared across providers. Async clients
+# stay per provider: their connection pool is bound to the event loop that
+# first uses it.
+_CLIENT_CACHE: dict[str | None, MistralClient] = {}
+
+# Role and content are already validated by Message, so skip ChatMessage's own
+# validation (pydantic v2 model_construct, v1 construct).
+_build_chat_message = getattr(ChatMessage, "model_construct", None) or ChatMessage.construct
 
 
 class MistralProvider(Provider):
@@ -17,12 +28,32 @@ class MistralProvider(Provider):
     def __init__(self, config: Config):
         """Initialize Mistral provider."""
         self.config = config
-        self.client = MistralClient(api_key=config.api_key)
-        self.async_client = MistralAsyncClient(api_key=config.api_key)
+
+    # Clients are resolved on first use, so sync-only or async-only callers
+    # never build the other one.
+    @cached_property
+    def client(self) -> MistralClient:
+        """Sync SDK client."""
+        client = _CLIENT_CACHE.get(self.config.api_key)
+        if client is None:
+            client = _CLIENT_CACHE[self.config.api_key] = MistralClient(api_key=self.config.api_key)
+        return client
+
+    @cached_property
+    def async_client(self) -> MistralAsyncClient:
+        """Async SDK client."""
+        return MistralAsyncClient(api_key=self.config.api_key)
+
+    @staticmethod
+    def _convert_message(msg: Message) -> ChatMessage:
+        """Convert a single message to a Mistral ChatMessage."""
+        return _build_chat_message(role=msg.role, content=msg.content)
 
     def _convert_messages(self, messages: list[Message]) -> list[ChatMessage]:
         """Convert internal messages to Mistral format."""
-        return [ChatMessage(role=msg.role, content=msg.content) for msg in messages]
+        return self._convert_cached(
+            [msg for msg in messages if msg.content is not None], self._convert_message
+        )
 
     def complete(
         self,
@@ -42,11 +73,7 @@ class MistralProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -76,7 +103,7 @@ class MistralProvider(Provider):
         for chunk in stream:
             choice = chunk.choices[0]
             if choice.delta.content:
-                yield StreamChunk(
+                yield StreamChunk.model_construct(
                     content=choice.delta.content,
                     finish_reason=choice.finish_reason,
                 )
@@ -99,11 +126,7 @@ class MistralProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -133,7 +156,7 @@ class MistralProvider(Provider):
         async for chunk in stream:
             choice = chunk.choices[0]
             if choice.delta.content:
-                yield StreamChunk(
+                yield StreamChunk.model_construct(
                     content=choice.delta.content,
                     finish_reason=choice.finish_reason,
                 )
@@ -2,55 +2,31 @@
 
 from collections.abc import AsyncIterator, Iterator
 
-import openai
-
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
+from ._openai_compat import (
+    astream_chunks,
+    convert_message,
+    extract_usage,
+    get_clients,
+    stream_chunks,
+)
 
 
 class OpenAIProvider(Provider):
     """OpenAI provider implementation."""
 
+    streams_tool_calls = True
+
     def __init__(self, config: Config):
         """Initialize OpenAI provider."""
         self.config = config
-        self.client = openai.OpenAI(
-            api_key=config.api_key,
-            base_url=config.base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
-        self.async_client = openai.AsyncOpenAI(
-            api_key=config.api_key,
-            base_url=config.base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
+        self.client, self.async_client = get_clients(config, config.base_url)
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert internal messages to OpenAI format."""
-        result = []
-        for msg in messages:
-            if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                result.append(
-                    {
-                        "role": "assistant",
-                        "content": msg.content or None,
-                        "tool_calls": msg.metadata["tool_calls"],
-                    }
-                )
-            elif msg.role == "tool" and msg.metadata:
-                result.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content,
-                        "tool_call_id": msg.metadata.get("tool_call_id", ""),
-                    }
-                )
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-        return result
+        return self._convert_cached(messages, convert_message)
 
     @staticmethod
     def _extract_tool_calls(message) -> list[dict] | None:
@@ -87,11 +63,7 @@ class OpenAIProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -120,14 +92,7 @@ class OpenAIProvider(Provider):
             **kwargs,
         )
 
-        for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        yield from stream_chunks(stream)
 
     async def acomplete(
         self,
@@ -147,11 +112,7 @@ class OpenAIProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -180,11 +141,5 @@ class OpenAIProvider(Provider):
             **kwargs,
         )
 
-        async for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        async for chunk in astream_chunks(stream):
+            yield chunk
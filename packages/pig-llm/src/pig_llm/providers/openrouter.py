@@ -2,16 +2,23 @@
 
 from collections.abc import AsyncIterator, Iterator
 
-import openai
-
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
+from ._openai_compat import (
+    astream_chunks,
+    convert_message,
+    extract_usage,
+    get_clients,
+    stream_chunks,
+)
 
 
 class OpenRouterProvider(Provider):
     """OpenRouter provider (access multiple models via one API)."""
 
+    streams_tool_calls = True
+
     def __init__(self, config: Config):
         """Initialize OpenRouter provider.
 
@@ -20,43 +27,11 @@ class OpenRouterProvider(Provider):
         self.config = config
 
         # OpenRouter uses OpenAI client with custom base URL
-        self.client = openai.OpenAI(
-            api_key=config.api_key,
-            base_url="https://openrouter.ai/api/v1",
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
-
-        self.async_client = openai.AsyncOpenAI(
-            api_key=config.api_key,
-            base_url="https://openrouter.ai/api/v1",
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
+        self.client, self.async_client = get_clients(config, "https://openrouter.ai/api/v1")
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert internal messages to OpenRouter/OpenAI format."""
-        result = []
-        for msg in messages:
-            if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                result.append(
-                    {
-                        "role": "assistant",
-                        "content": msg.content or None,
-                        "tool_calls": msg.metadata["tool_calls"],
-                    }
-                )
-            elif msg.role == "tool" and msg.metadata:
-                result.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content,
-                        "tool_call_id": msg.metadata.get("tool_call_id", ""),
-                    }
-                )
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-        return result
+        return self._convert_cached(messages, convert_message)
 
     @staticmethod
     def _extract_tool_calls(message) -> list[dict] | None:
@@ -93,11 +68,7 @@ class OpenRouterProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -126,14 +97,7 @@ class OpenRouterProvider(Provider):
             **kwargs,
         )
 
-        for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        yield from stream_chunks(stream)
 
     async def acomplete(
         self,
@@ -153,11 +117,7 @@ class OpenRouterProvider(Provider):
         )
 
         choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
+        usage = extract_usage(response.usage)
 
         return Response(
             content=choice.message.content or "",
@@ -186,11 +146,5 @@ class OpenRouterProvider(Provider):
             **kwargs,
         )
 
-        async for chunk in stream:
-            choice = chunk.choices[0]
-            if choice.delta.content:
-                yield StreamChunk(
-                    content=choice.delta.content,
-                    finish_reason=choice.finish_reason,
-                    metadata={"id": chunk.id},
-                )
+        async for chunk in astream_chunks(stream):
+            yield chunk
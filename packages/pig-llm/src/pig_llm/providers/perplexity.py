@@ -2,11 +2,32 @@
 
 from collections.abc import AsyncIterator, Iterator
 
-import openai
-
 from ..config import Config
 from ..models import Message, Response, StreamChunk
 from ._base import Provider
+from ._openai_compat import convert_message, extract_usage, get_clients
+
+
+def _stream_metadata(chunk, previous: dict) -> dict:
+    """Get metadata for a stream chunk, reusing the previous dict when unchanged.
+
+    The id and citations are normally constant for a whole stream, so one dict
+    is shared by every chunk instead of building a new one per token.
+
+    Args:
+        chunk: SDK stream chunk
+        previous: Metadata yielded with the previous chunk
+
+    Returns:
+        Metadata dict with the chunk id and citations (if available)
+    """
+    citations = getattr(chunk, "citations", None)
+    if previous.get("id") == chunk.id and previous.get("citations") == citations:
+        return previous
+    metadata = {"id": chunk.id}
+    if citations is not None:
+        metadata["citations"] = citations
+    return metadata
 
 
 class PerplexityProvider(Provider):
@@ -20,42 +41,14 @@ class PerplexityProvider(Provider):
         self.config = config
         base_url = config.base_url or "https://api.perplexity.ai"
 
-        self.client = openai.OpenAI(
-            api_key=config.api_key,
-            base_url=base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
-        self.async_client = openai.AsyncOpenAI(
-            api_key=config.api_key,
-            base_url=base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
+        self.client, self.async_client = get_clients(config, base_url)
+        # Bound once; every call otherwise walks client.chat.completions
+        self._create = self.client.chat.completions.create
+        self._acreate = self.async_client.chat.completions.create
 
     def _convert_messages(self, messages: list[Message]) -> list[dict]:
         """Convert internal messages to Perplexity format."""
-        result = []
-        for msg in messages:
-            if msg.role == "assistant" and msg.metadata and "tool_calls" in msg.metadata:
-                result.append(
-                    {
-                        "role": "assistant",
-                        "content": msg.content or None,
-                        "tool_calls": msg.metadata["tool_calls"],
-                    }
-                )
-            elif msg.role == "tool" and msg.metadata:
-                result.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content,
-                        "tool_call_id": msg.metadata.get("tool_call_id", ""),
-                    }
-                )
-            else:
-                result.append({"role": msg.role, "content": msg.content})
-        return result
+        return self._convert_cached(messages, convert_message)
 
     @staticmethod
     def _extract_tool_calls(message) -> list[dict] | None:
@@ -74,44 +67,66 @@ class PerplexityProvider(Provider):
             for tc in message.tool_calls
         ]
 
-    def complete(
+    def _build_params(
         self,
         messages: list[Message],
         model: str,
-        temperature: float = 0.7,
-        max_tokens: int | None = None,
-        **kwargs,
-    ) -> Response:
-        """Generate a completion with online search."""
-        response = self.client.chat.completions.create(
-            model=model,
-            messages=self._convert_messages(messages),
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        )
-
-        choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
+        temperature: float,
+        max_tokens: int | None,
+        extra: dict,
+    ) -> dict:
+        """Build chat request parameters shared by all four entry points.
+
+        ``max_tokens`` is only sent when set, rather than as an explicit null.
+        """
+        params = {
+            "model": model,
+            "messages": self._convert_messages(messages),
+            "temperature": temperature,
         }
-
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+        if extra:
+            params.update(extra)
+        return params
+
+    @classmethod
+    def _parse_response(cls, response) -> Response:
+        """Convert an SDK chat completion to a Response.
+
+        The fields come straight from the SDK's already-validated objects, so
+        the Response is built with model_construct instead of re-validating.
+        """
+        choice = response.choices[0]
         # Perplexity includes citations in metadata
         metadata = {"id": response.id}
         if hasattr(response, "citations"):
             metadata["citations"] = response.citations
 
-        return Response(
+        return Response.model_construct(
             content=choice.message.content or "",
             model=response.model,
-            usage=usage,
+            usage=extract_usage(response.usage),
             finish_reason=choice.finish_reason,
-            tool_calls=self._extract_tool_calls(choice.message),
+            tool_calls=cls._extract_tool_calls(choice.message),
             metadata=metadata,
         )
 
+    def complete(
+        self,
+        messages: list[Message],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs,
+    ) -> Response:
+        """Generate a completion with online search."""
+        response = self._create(
+            **self._build_params(messages, model, temperature, max_tokens, kwargs),
+        )
+
+        return self._parse_response(response)
+
     def stream(
         self,
         messages: list[Message],
@@ -121,25 +136,23 @@ class PerplexityProvider(Provider):
         **kwargs,
     ) -> Iterator[StreamChunk]:
         """Stream a completion with online search."""
-        stream = self.client.chat.completions.create(
-            model=model,
-            messages=self._convert_messages(messages),
-            temperature=temperature,
-            max_tokens=max_tokens,
+        stream = self._create(
+            **self._build_params(messages, model, temperature, max_tokens, kwargs),
             stream=True,
-            **kwargs,
         )
 
+        # Hoisted out of the per-token loop
+        construct = StreamChunk.model_construct
+        metadata: dict = {}
         for chunk in stream:
+            if not chunk.choices:
+                continue
             choice = chunk.choices[0]
-            if choice.delta.content:
-                metadata = {"id": chunk.id}
-                # Include citations if available
-                if hasattr(chunk, "citations"):
-                    metadata["citations"] = chunk.citations
-
-                yield StreamChunk(
-                    content=choice.delta.content,
+            content = choice.delta.content
+            if content:
+                metadata = _stream_metadata(chunk, metadata)
+                yield construct(
+                    content=content,
                     finish_reason=choice.finish_reason,
                     metadata=metadata,
                 )
@@ -153,34 +166,11 @@ class PerplexityProvider(Provider):
         **kwargs,
     ) -> Response:
         """Async generate a completion with online search."""
-        response = await self.async_client.chat.completions.create(
-            model=model,
-            messages=self._convert_messages(messages),
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
+        response = await self._acreate(
+            **self._build_params(messages, model, temperature, max_tokens, kwargs),
         )
 
-        choice = response.choices[0]
-        usage = {
-            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-            "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-            "total_tokens": response.usage.total_tokens if response.usage else 0,
-        }
-
-        # Perplexity includes citations in metadata
-        metadata = {"id": response.id}
-        if hasattr(response, "citations"):
-            metadata["citations"] = response.citations
-
-        return Response(
-            content=choice.message.content or "",
-            model=response.model,
-            usage=usage,
-            finish_reason=choice.finish_reason,
-            tool_calls=self._extract_tool_calls(choice.message),
-            metadata=metadata,
-        )
+        return self._parse_response(response)
 
     async def astream(
         self,
@@ -191,25 +181,23 @@ class PerplexityProvider(Provider):
         **kwargs,
     ) -> AsyncIterator[StreamChunk]:
         """Async stream a completion with online search."""
-        stream = await self.async_client.chat.completions.create(
-            model=model,
-            messages=self._convert_messages(messages),
-            temperature=temperature,
-            max_tokens=max_tokens,
+        stream = await self._acreate(
+            **self._build_params(messages, model, temperature, max_tokens, kwargs),
             stream=True,
-            **kwargs,
         )
 
+        # Hoisted out of the per-token loop
+        construct = StreamChunk.model_construct
+        metadata: dict = {}
         async for chunk in stream:
+            if not chunk.choices:
+                continue
             choice = chunk.choices[0]
-            if choice.delta.content:
-                metadata = {"id": chunk.id}
-                # Include citations if available
-                if hasattr(chunk, "citations"):
-                    metadata["citations"] = chunk.citations
-
-                yield StreamChunk(
-                    content=choice.delta.content,
+            content = choice.delta.content
+            if content:
+                metadata = _stream_metadata(chunk, metadata)
+                yield construct(
+                    content=content,
                     finish_reason=choice.finish_reason,
                     metadata=metadata,
                 )
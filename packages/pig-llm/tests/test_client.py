@@ -24,6 +24,18 @@ def test_llm_initialization_with_config():
         assert llm.config == config
 
 
+def test_llm_reuses_config_for_identical_kwargs():
+    """Test identical constructor kwargs share one validated Config."""
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        MockProvider.return_value = Mock()
+        a = LLM(provider="openai", api_key="test-key", model="gpt-4o")
+        b = LLM(provider="openai", api_key="test-key", model="gpt-4o")
+        c = LLM(provider="openai", api_key="test-key", model="gpt-4o-mini")
+        assert a.config is b.config
+        assert c.config is not a.config
+        assert c.config.model == "gpt-4o-mini"
+
+
 def test_llm_unknown_provider():
     """Test unknown provider raises error."""
     with pytest.raises((ValueError, Exception)):
@@ -64,6 +76,21 @@ def test_llm_complete_without_system():
         assert messages[0].role == "user"
 
 
+def test_llm_complete_overrides_defaults():
+    """Test per-call overrides replace config defaults without duplicates."""
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock()
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test", model="gpt-4")
+        llm.complete("Hello", model="gpt-4o", temperature=0.1)
+
+        call_args = mock_provider.complete.call_args
+        assert call_args.kwargs["model"] == "gpt-4o"
+        assert call_args.kwargs["temperature"] == 0.1
+        assert call_args.kwargs["max_tokens"] == llm.config.max_tokens
+
+
 def test_llm_chat():
     """Test chat method with message list."""
     with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
@@ -81,3 +108,479 @@ def test_llm_chat():
         call_args = mock_provider.complete.call_args
         passed_messages = call_args.kwargs["messages"]
         assert len(passed_messages) == 3
+
+
+def test_llm_achat_across_event_loops():
+    """Test async calls keep working when each one runs in its own asyncio.run()."""
+    import asyncio
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps(
+                {
+                    "id": "c1",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "stub",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "ok"},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    messages = [Message(role="user", content="Hi")]
+    try:
+        for _ in range(2):
+            llm = LLM(provider="openai", api_key="loop-test", base_url=base_url, max_retries=0)
+            assert asyncio.run(llm.achat(messages)).content == "ok"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_provider_abatch_bounded_and_ordered():
+    """Test abatch keeps input order and respects max_concurrency."""
+    import asyncio
+
+    from pig_llm import Response
+    from pig_llm.providers._base import Provider
+
+    class FakeProvider(Provider):
+        def __init__(self, config):
+            self.config = config
+            self.active = 0
+            self.peak = 0
+
+        def complete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        def stream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        async def acomplete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return Response(content=messages[-1].content, model=model)
+
+        async def astream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+            yield
+
+    provider = FakeProvider(Config(provider="openai", max_concurrency=2))
+    batches = [[Message(role="user", content=str(i))] for i in range(5)]
+
+    responses = await provider.abatch(batches, model="m")
+
+    assert [r.content for r in responses] == ["0", "1", "2", "3", "4"]
+    assert provider.peak == 2
+
+    responses = await provider.abatch(batches, model="m", max_concurrency=3)
+    assert provider.peak == 3
+
+    batches[2] = []  # acomplete fails on messages[-1]
+    responses = await provider.abatch(batches, model="m", return_exceptions=True)
+    assert isinstance(responses[2], IndexError)
+    assert [r.content for i, r in enumerate(responses) if i != 2] == ["0", "1", "3", "4"]
+
+
+def test_provider_batch_sync_bounded_and_ordered():
+    """Test the sync batch keeps input order and respects max_concurrency."""
+    import threading
+    import time
+
+    from pig_llm import Response
+    from pig_llm.providers._base import Provider
+
+    class FakeProvider(Provider):
+        def __init__(self, config):
+            self.config = config
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def complete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            with self.lock:
+                self.active -= 1
+            return Response(content=messages[-1].content, model=model)
+
+        def stream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        async def acomplete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        async def astream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+            yield
+
+    provider = FakeProvider(Config(provider="openai", max_concurrency=2))
+    batches = [[Message(role="user", content=str(i))] for i in range(5)]
+
+    responses = provider.batch(batches, model="m")
+    assert [r.content for r in responses] == ["0", "1", "2", "3", "4"]
+    assert provider.peak == 2
+
+    batches[2] = []  # complete fails on messages[-1]
+    responses = provider.batch(batches, model="m", return_exceptions=True)
+    assert isinstance(responses[2], IndexError)
+    with pytest.raises(IndexError):
+        provider.batch(batches, model="m")
+
+    with patch("pig_llm.providers.openai.OpenAIProvider", return_value=provider):
+        llm = LLM(provider="openai", api_key="test")
+        assert [r.content for r in llm.batch(batches[:2])] == ["0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_provider_batch_prompt_packs_and_splits():
+    """Test batch_prompt packs prompts into numbered requests and splits answers."""
+    from pig_llm import Response
+    from pig_llm.providers._base import Provider
+
+    class EchoProvider(Provider):
+        def __init__(self, config):
+            self.config = config
+            self.requests = []
+
+        def complete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        def stream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        async def acomplete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            prompt = messages[-1].content
+            self.requests.append(prompt)
+            # Answer every numbered item with its text upper-cased
+            lines = [line for line in prompt.splitlines() if line[:1].isdigit()]
+            return Response(content="\n".join(line.upper() for line in lines), model=model)
+
+        async def astream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+            yield
+
+    provider = EchoProvider(Config(provider="openai", row_marshal_batch_size=2))
+    answers = await provider.batch_prompt(["a", "b", "c"], model="m", template="{items}")
+
+    assert answers == ["A", "B", "C"]
+    assert provider.requests == ["1) a\n2) b", "1) c"]
+
+    with pytest.raises(TypeError, match="return_exceptions"):
+        await provider.batch_prompt(["a"], model="m", return_exceptions=True)
+
+
+def test_split_numbered_handles_gaps():
+    """Test numbered answers tolerate preambles, gaps and out-of-range items."""
+    from pig_llm.providers._base import _split_numbered
+
+    text = "Sure:\n1) yes\n3) no\n  multi\n9) extra"
+    assert _split_numbered(text, 3) == ["yes", "", "no\n  multi"]
+
+
+def test_llm_stream_coalesces_deltas():
+    """Test stream_coalesce_ms merges text deltas but keeps the stop chunk."""
+    from pig_llm import StreamChunk
+
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock()
+        mock_provider.stream.return_value = iter(
+            [StreamChunk(content=c) for c in "hello"]
+            + [StreamChunk(content="", finish_reason="stop")]
+        )
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test", stream_coalesce_ms=10_000)
+        chunks = list(llm.stream("Hi"))
+
+        assert [(c.content, c.finish_reason) for c in chunks] == [("hello", None), ("", "stop")]
+
+
+def test_coalesce_merges_id_tagged_deltas():
+    """Test per-delta metadata (e.g. response id) does not stop coalescing."""
+    from pig_llm import StreamChunk
+    from pig_llm._coalesce import coalesce
+
+    tool_calls = [{"id": "t0", "type": "function", "function": {"name": "f", "arguments": ""}}]
+    source = [StreamChunk(content=c, metadata={"id": "x"}) for c in "abcdefgh"] + [
+        StreamChunk(content="", finish_reason="tool_calls", metadata={"tool_calls": tool_calls})
+    ]
+
+    chunks = list(coalesce(iter(source), window_ms=10_000))
+
+    assert [c.content for c in chunks] == ["abcdefgh", ""]
+    assert chunks[0].metadata == {"id": "x"}
+    assert chunks[1].metadata == {"tool_calls": tool_calls}
+
+
+def test_stream_chunks_reassembles_tool_calls():
+    """Test streamed tool call fragments arrive as one final chunk."""
+    from types import SimpleNamespace as NS
+
+    from pig_llm.providers._openai_compat import stream_chunks
+
+    def chunk(content=None, tool_calls=None, finish_reason=None):
+        delta = NS(content=content, tool_calls=tool_calls)
+        return NS(id="c1", choices=[NS(delta=delta, finish_reason=finish_reason)])
+
+    def fragment(index, id=None, name=None, arguments=None):
+        return NS(index=index, id=id, function=NS(name=name, arguments=arguments))
+
+    sdk_stream = [
+        chunk(content="Let me look"),
+        chunk(tool_calls=[fragment(0, id="t0", name="read_file", arguments='{"pa')]),
+        chunk(tool_calls=[fragment(0, arguments='th": "a"}'), fragment(1, id="t1", name="ls")]),
+        chunk(finish_reason="tool_calls"),
+        NS(id="c1", choices=[]),
+    ]
+
+    chunks = list(stream_chunks(sdk_stream))
+
+    assert [c.content for c in chunks] == ["Let me look", ""]
+    assert chunks[-1].finish_reason == "tool_calls"
+    assert chunks[-1].metadata["tool_calls"] == [
+        {
+            "id": "t0",
+            "type": "function",
+            "function": {"name": "read_file", "arguments": '{"path": "a"}'},
+        },
+        {"id": "t1", "type": "function", "function": {"name": "ls", "arguments": ""}},
+    ]
+
+
+def test_llm_chat_stream():
+    """Test chat_stream streams a full history through the provider."""
+    from pig_llm import StreamChunk
+
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock(streams_tool_calls=True)
+        mock_provider.stream.return_value = iter([StreamChunk(content="Hi")])
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test")
+        messages = [Message(role="user", content="Hello")]
+        chunks = list(llm.chat_stream(messages, tools=[]))
+
+        assert [c.content for c in chunks] == ["Hi"]
+        assert llm.streams_tool_calls is True
+        call = mock_provider.stream.call_args
+        assert call.kwargs["messages"] == messages
+        assert call.kwargs["tools"] == []
+
+
+def test_llm_chat_stream_serves_cached_responses():
+    """Test chat_stream answers cacheable requests through chat() as one chunk."""
+    from pig_llm import Response
+
+    tool_calls = [{"id": "t0", "type": "function", "function": {"name": "ls", "arguments": ""}}]
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock()
+        mock_provider.complete.return_value = Response(
+            content="Listing", model="stream-cache-model", tool_calls=tool_calls
+        )
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test", model="stream-cache-model", enable_cache=True)
+        messages = [Message(role="user", content="ls")]
+        first = list(llm.chat_stream(messages, temperature=0))
+        second = list(llm.chat_stream(messages, temperature=0))
+
+        assert first == second
+        assert [c.content for c in first] == ["Listing"]
+        assert first[0].metadata["tool_calls"] == tool_calls
+        assert mock_provider.complete.call_count == 1
+        mock_provider.stream.assert_not_called()
+
+
+def test_llm_chat_stream_adaptive_timeout():
+    """Test chat_stream passes the adaptive timeout and surfaces ProviderTimeout."""
+    from pig_llm import ProviderTimeout, StreamChunk
+
+    def slow_stream(**kwargs):
+        yield StreamChunk(content="Hi")
+        raise TimeoutError("slow")
+
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock()
+        mock_provider.stream.side_effect = slow_stream
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test", model="stream-timeout", adaptive_timeout=True)
+        received = []
+        with pytest.raises(ProviderTimeout):
+            for chunk in llm.chat_stream([Message(role="user", content="Hi")]):
+                received.append(chunk.content)
+
+        assert received == ["Hi"]
+        assert mock_provider.stream.call_args.kwargs["timeout"] == llm.config.timeout
+
+
+@pytest.mark.asyncio
+async def test_acoalesce_flushes_on_quiet_stream():
+    """Test buffered text is released when the async stream stalls."""
+    import asyncio
+
+    from pig_llm import StreamChunk
+    from pig_llm._coalesce import acoalesce
+
+    async def source():
+        yield StreamChunk(content="a")
+        yield StreamChunk(content="b")
+        await asyncio.sleep(0.2)
+        yield StreamChunk(content="c")
+
+    received = []
+    async for chunk in acoalesce(source(), window_ms=20):
+        received.append(chunk.content)
+
+    assert received == ["ab", "c"]
+
+
+@pytest.mark.asyncio
+async def test_llm_eager_warmup_lists_models():
+    """Test eager_warmup schedules a model listing on the async client."""
+    from unittest.mock import AsyncMock
+
+    from pig_llm.providers.openai import OpenAIProvider
+
+    llm = LLM(provider="openai", api_key="warmup-key", eager_warmup=True)
+    assert isinstance(llm._provider, OpenAIProvider)
+
+    llm._warmup_task.cancel()
+    llm._provider.async_client = Mock()
+    llm._provider.async_client.models.list = AsyncMock(side_effect=RuntimeError("offline"))
+
+    # Errors are swallowed; warmup is best effort
+    await llm.warmup()
+    llm._provider.async_client.models.list.assert_awaited_once()
+
+
+def test_llm_eager_warmup_without_loop_uses_thread():
+    """Test eager_warmup warms the sync client in a thread when no loop runs."""
+    with (
+        patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider,
+        patch("pig_llm.client.threading.Thread") as MockThread,
+    ):
+        llm = LLM(provider="openai", api_key="test", eager_warmup=True)
+
+    assert llm._warmup_task is None
+    assert MockThread.call_args.kwargs["target"] == MockProvider.return_value.warmup_sync
+    assert MockThread.call_args.kwargs["daemon"] is True
+    MockThread.return_value.start.assert_called_once()
+
+
+def test_latency_tracker_timeout_for():
+    """Test adaptive timeout uses p99 × 1.5 once enough samples exist."""
+    from pig_llm import LatencyTracker
+
+    tracker = LatencyTracker()
+    key = ("openai", "gpt-4")
+    assert tracker.timeout_for(key, ceiling=30, floor=1) == 30
+
+    for _ in range(50):
+        tracker.record(key, 2.0)
+    assert tracker.p99(key) == 2.0
+    assert tracker.timeout_for(key, ceiling=30, floor=1) == 3.0
+    assert tracker.timeout_for(key, ceiling=30, floor=5) == 5
+    assert tracker.timeout_for(key, ceiling=2, floor=1) == 2
+
+
+def test_llm_adaptive_timeout_raises_provider_timeout():
+    """Test adaptive mode passes a timeout and surfaces ProviderTimeout."""
+    from pig_llm import ProviderTimeout
+
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock()
+        mock_provider.complete.side_effect = TimeoutError("slow")
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test", model="adaptive-model", adaptive_timeout=True)
+        with pytest.raises(ProviderTimeout) as exc_info:
+            llm.complete("Hi")
+
+        assert exc_info.value.provider == "openai"
+        assert exc_info.value.model == "adaptive-model"
+        assert mock_provider.complete.call_args.kwargs["timeout"] == llm.config.timeout
+
+
+def test_llm_response_cache_reuses_deterministic_responses():
+    """Test enable_cache serves repeated temperature=0 chats from the cache."""
+    from pig_llm import Response
+
+    with patch("pig_llm.providers.openai.OpenAIProvider") as MockProvider:
+        mock_provider = Mock()
+        mock_provider.complete.return_value = Response(content="4", model="cache-model")
+        MockProvider.return_value = mock_provider
+
+        llm = LLM(provider="openai", api_key="test", model="cache-model", enable_cache=True)
+        first = llm.complete("2+2?", temperature=0)
+        second = llm.complete("2+2?", temperature=0)
+        assert first is second
+        assert mock_provider.complete.call_count == 1
+
+        llm.complete("2+2?", temperature=0.7)
+        llm.complete("2+2?", temperature=0.7)
+        assert mock_provider.complete.call_count == 3
+
+
+def test_provider_stream_batch_reassembles_lines():
+    """Test stream_batch buffers split deltas and yields indexed answers."""
+    from pig_llm import StreamChunk
+    from pig_llm.providers._base import Provider
+
+    class SplitProvider(Provider):
+        def __init__(self):
+            self.prompt = None
+
+        def complete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        def stream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            self.prompt = messages[-1].content
+            text = '```\n{"i": 1, "answer": "B"}\nnot json\n{"i": 0, "answer": "A"}'
+            for i in range(0, len(text), 5):
+                yield StreamChunk(content=text[i : i + 5])
+            yield StreamChunk(content="", finish_reason="stop")
+
+        async def acomplete(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+
+        async def astream(self, messages, model, temperature=0.7, max_tokens=None, **kwargs):
+            raise NotImplementedError
+            yield
+
+    provider = SplitProvider()
+    chunks = list(provider.stream_batch(["first", "second"], model="m"))
+
+    answers = [(c.metadata["index"], c.content) for c in chunks[:-1]]
+    assert answers == [(1, "B"), (0, "A")]
+    assert chunks[-1].finish_reason == "stop"
+    assert '{"i": 0, "prompt": "first"}' in provider.prompt
+    assert '{"i": <index>, "answer": <string>}' in provider.prompt
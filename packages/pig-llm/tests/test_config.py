@@ -48,3 +48,12 @@ def test_config_frozen():
     config = Config()
     with pytest.raises(Exception):  # Pydantic ValidationError  # noqa: B017
         config.temperature = 0.5
+
+
+def test_config_unknown_provider():
+    """Test unknown providers require a base_url."""
+    with pytest.raises(ValueError):
+        Config(provider="unknown")
+
+    config = Config(provider="local", base_url="http://localhost:8000/v1")
+    assert config.provider == "local"
@@ -18,6 +18,17 @@ def test_message_with_metadata():
     assert msg.metadata["model"] == "gpt-4"
 
 
+def test_message_tool_call_without_content():
+    """Test assistant tool-call message with no text content."""
+    msg = Message(
+        role="assistant",
+        content=None,
+        metadata={"tool_calls": [{"id": "call_1", "name": "search", "arguments": "{}"}]},
+    )
+    assert msg.content is None
+    assert msg.metadata["tool_calls"][0]["name"] == "search"
+
+
 def test_response_creation():
     """Test response creation."""
     response = Response(
@@ -13,6 +13,70 @@ class TestNewProviders:
 
         assert BedrockProvider is not None
 
+    def test_bedrock_reuses_async_client(self, monkeypatch):
+        """Test aioboto3 clients are opened once per loop and closed by aclose()."""
+        import asyncio
+        import sys
+        import types
+        from unittest.mock import AsyncMock, MagicMock
+
+        from pig_llm import Config, Message
+
+        opened = []
+        client = MagicMock()
+        client.converse = AsyncMock(
+            return_value={
+                "output": {"message": {"content": [{"text": "hi"}]}},
+                "ResponseMetadata": {"RequestId": "r1"},
+            }
+        )
+
+        def open_client(*args, **kwargs):
+            cm = MagicMock()
+            cm.__aenter__ = AsyncMock(return_value=client)
+            cm.__aexit__ = AsyncMock(return_value=False)
+            opened.append(cm)
+            return cm
+
+        boto3 = types.ModuleType("boto3")
+        boto3.client = MagicMock()
+        botocore = types.ModuleType("botocore")
+        botocore_config = types.ModuleType("botocore.config")
+        botocore_config.Config = MagicMock()
+        aioboto3 = types.ModuleType("aioboto3")
+        aioboto3.Session = MagicMock(return_value=MagicMock(client=open_client))
+        for name, module in [
+            ("boto3", boto3),
+            ("botocore", botocore),
+            ("botocore.config", botocore_config),
+            ("aioboto3", aioboto3),
+        ]:
+            monkeypatch.setitem(sys.modules, name, module)
+        monkeypatch.delitem(sys.modules, "pig_llm.providers.bedrock", raising=False)
+        from pig_llm.providers.bedrock import BedrockProvider
+
+        provider = BedrockProvider(Config(provider="bedrock", api_key="us-east-1"))
+        messages = [Message(role="user", content="Hello")]
+
+        async def main():
+            results = await asyncio.gather(
+                *(provider.acomplete(messages, model="m") for _ in range(3))
+            )
+            await provider.acomplete(messages, model="m")
+            await provider.aclose()
+            return results
+
+        results = asyncio.run(main())
+
+        assert [r.content for r in results] == ["hi"] * 3
+        assert client.converse.await_count == 4
+        assert len(opened) == 1
+        opened[0].__aexit__.assert_awaited_once()
+
+        # A new event loop opens a fresh client
+        asyncio.run(provider.acomplete(messages, model="m"))
+        assert len(opened) == 2
+
     def test_xai_import(self):
         """Test xAI provider import."""
         from pig_llm.providers.xai import XAIProvider
@@ -50,6 +114,118 @@ class TestNewProviders:
 
         assert TogetherProvider is not None
 
+    def test_anthropic_clients_shared(self):
+        """Test Anthropic providers with the same settings share the sync client."""
+        from pig_llm.config import Config
+        from pig_llm.providers import anthropic as anthropic_module
+        from pig_llm.providers.anthropic import AnthropicProvider
+
+        config = Config(provider="anthropic", api_key="test-key")
+        first = AnthropicProvider(config)
+        second = AnthropicProvider(config)
+        other = AnthropicProvider(Config(provider="anthropic", api_key="other-key"))
+
+        assert first.client is second.client
+        assert first.async_client is not second.async_client
+        assert other.client is not first.client
+
+        proxied = AnthropicProvider(
+            Config(provider="anthropic", api_key="test-key", base_url="http://localhost:9")
+        )
+        assert proxied.client is not first.client
+        assert str(proxied.client.base_url).startswith("http://localhost:9")
+
+        # Unused clients are not kept alive by the cache
+        key = ("other-key", None, other.config.timeout, other.config.max_retries)
+        del other
+        assert key not in anthropic_module._CLIENT_CACHE
+
+    def test_openai_compatible_clients_shared(self):
+        """Test OpenAI-compatible providers share sync clients per endpoint."""
+        from pig_llm.config import Config
+        from pig_llm.providers.deepseek import DeepSeekProvider
+        from pig_llm.providers.xai import XAIProvider
+
+        config = Config(provider="deepseek", api_key="test-key")
+        first = DeepSeekProvider(config)
+        second = DeepSeekProvider(config)
+        xai = XAIProvider(Config(provider="xai", api_key="test-key"))
+
+        assert first.client is second.client
+        # Async pools are bound to an event loop, so each provider owns its own
+        assert first.async_client is not second.async_client
+        assert xai.client is not first.client
+        assert str(xai.client.base_url).startswith("https://api.x.ai")
+
+    def test_message_conversion_reused(self):
+        """Test unchanged messages keep their converted payload across calls."""
+        from pig_llm.config import Config
+        from pig_llm.models import Message
+        from pig_llm.providers.openai import OpenAIProvider
+
+        provider = OpenAIProvider(Config(provider="openai", api_key="test-key"))
+        history = [Message(role="system", content="sys"), Message(role="user", content="hi")]
+        first = provider._convert_messages(history)
+
+        history.append(Message(role="assistant", content="hello"))
+        second = provider._convert_messages(history)
+
+        assert second[0] is first[0]
+        assert second[1] is first[1]
+        assert second[2] == {"role": "assistant", "content": "hello"}
+
+    def test_perplexity_stream_metadata_shared(self):
+        """Test Perplexity stream chunks share metadata until it changes."""
+        from types import SimpleNamespace
+
+        from pig_llm.providers.perplexity import _stream_metadata
+
+        first = _stream_metadata(SimpleNamespace(id="a", citations=["u"]), {})
+        same = _stream_metadata(SimpleNamespace(id="a", citations=["u"]), first)
+        changed = _stream_metadata(SimpleNamespace(id="a", citations=["u", "v"]), same)
+
+        assert first == {"id": "a", "citations": ["u"]}
+        assert same is first
+        assert changed == {"id": "a", "citations": ["u", "v"]}
+        assert _stream_metadata(SimpleNamespace(id="b"), changed) == {"id": "b"}
+
+    def test_perplexity_parse_response(self):
+        """Test Perplexity responses keep usage, citations and tool calls."""
+        from types import SimpleNamespace as NS
+
+        from pig_llm.providers.perplexity import PerplexityProvider
+
+        raw = NS(
+            id="r1",
+            model="sonar",
+            usage=NS(prompt_tokens=3, completion_tokens=2, total_tokens=5),
+            choices=[NS(message=NS(content="hi", tool_calls=None), finish_reason="stop")],
+            citations=["https://example.com"],
+        )
+        response = PerplexityProvider._parse_response(raw)
+
+        assert response.content == "hi"
+        assert response.usage == {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+        assert response.metadata == {"id": "r1", "citations": ["https://example.com"]}
+        assert response.tool_calls is None
+
+    def test_perplexity_params_omit_unset_max_tokens(self):
+        """Test Perplexity requests only carry max_tokens when it is set."""
+        from pig_llm.config import Config
+        from pig_llm.models import Message
+        from pig_llm.providers.perplexity import PerplexityProvider
+
+        provider = PerplexityProvider(Config(provider="perplexity", api_key="test-key"))
+        messages = [Message(role="user", content="hi")]
+
+        params = provider._build_params(messages, "sonar", 0.2, None, {})
+        assert "max_tokens" not in params
+        assert params["messages"] == [{"role": "user", "content": "hi"}]
+
+        params = provider._build_params(messages, "sonar", 0.2, 50, {"top_p": 0.9})
+        assert params["max_tokens"] == 50
+        assert params["top_p"] == 0.9
+
 
 class TestProviderRegistration:
     """Test that providers are registered in client."""
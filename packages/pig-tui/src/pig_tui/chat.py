@@ -5,37 +5,73 @@ from contextlib import contextmanager
 from datetime import datetime
 
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.text import Text
 
 from .theme import Theme
 
 
 class StreamWriter:
-    """Context manager for streaming text output."""
+    """Context manager for streaming text output.
 
-    def __init__(self, console: Console, prefix: str, style: str):
+    In markdown mode the buffered text is redrawn as Markdown in a rich Live
+    region, so the finished response looks as :meth:`ChatUI.assistant` would
+    render it.
+    """
+
+    def __init__(self, console: Console, prefix: str, style: str, markdown: bool = False):
         """Initialize stream writer."""
         self.console = console
         self.prefix = prefix
         self.style = style
+        self.markdown = markdown
         self.buffer = []
+        self._live: Live | None = None
+
+    def __rich_console__(self, console: Console, options):
+        """Render prefix and buffered text; Live calls this on each refresh."""
+        yield Text.from_markup(self.prefix)
+        yield Markdown("".join(self.buffer))
 
     def write(self, text: str) -> None:
         """Write text to stream."""
         self.buffer.append(text)
-        # Print immediately for streaming effect
-        self.console.print(text, style=self.style, end="")
+        if self._live is not None:
+            # Live redraws on its own refresh tick, so the Markdown is parsed
+            # a few times a second rather than once per chunk
+            return
+        # Print immediately for streaming effect; model output is plain text,
+        # so brackets like "list[int]" must not be parsed as markup
+        self.console.print(text, style=self.style, end="", markup=False)
         sys.stdout.flush()
 
     def __enter__(self):
         """Enter context."""
-        self.console.print(self.prefix, style=self.style, end="")
+        if self.markdown:
+            self._live = Live(
+                self,
+                console=self.console,
+                refresh_per_second=8,
+                vertical_overflow="visible",
+            )
+            self._live.__enter__()
+        else:
+            self.console.print(self.prefix, style=self.style, end="")
         return self
 
     def __exit__(self, *args):
         """Exit context."""
-        self.console.print()  # New line
+        if self._live is not None:
+            # Stopping Live draws the final frame; it only ends the line itself
+            # on a terminal
+            self._live.__exit__(*args)
+            self._live = None
+            if not self.console.is_terminal:
+                self.console.line()
+        else:
+            self.console.print()  # New line
 
 
 class ChatUI:
@@ -108,8 +144,10 @@ class ChatUI:
         timestamp = self._format_timestamp()
         prefix = f"{timestamp}[bold {self.theme.assistant_color}]Assistant:[/] "
 
-        writer = StreamWriter(self.console, prefix, self.theme.assistant_color)
-        yield writer
+        with StreamWriter(
+            self.console, prefix, self.theme.assistant_color, markdown=self.markdown_mode
+        ) as writer:
+            yield writer
 
     def system(self, message: str) -> None:
         """Display system message.
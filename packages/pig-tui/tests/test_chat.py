@@ -87,3 +87,38 @@ def test_chat_ui_clear(mock_console):
     chat.clear()
 
     chat.console.clear.assert_called_once()
+
+
+@patch("pig_tui.chat.Console")
+def test_chat_ui_assistant_stream(mock_console):
+    """Test streamed chunks are printed verbatim and buffered."""
+    chat = ChatUI(markdown_mode=False)
+    with chat.assistant_stream() as sink:
+        sink.write("x: list[int]")
+
+    assert sink.buffer == ["x: list[int]"]
+    style = chat.theme.assistant_color
+    calls = chat.console.print.call_args_list
+    assert calls[1].args == ("x: list[int]",)
+    assert calls[1].kwargs == {"style": style, "end": "", "markup": False}
+    assert len(calls) == 3  # prefix, chunk, closing newline
+
+
+def test_chat_ui_assistant_stream_renders_markdown():
+    """Test markdown mode redraws the streamed text as Markdown."""
+    import io
+
+    from rich.console import Console
+
+    chat = ChatUI()
+    chat.console = Console(file=io.StringIO(), width=40)
+    with chat.assistant_stream() as sink:
+        sink.write("# Title\n\n- x: list")
+        sink.write("[int]\n- **bold**")
+
+    assert sink.buffer == ["# Title\n\n- x: list", "[int]\n- **bold**"]
+    lines = [line.rstrip() for line in chat.console.file.getvalue().splitlines()]
+    assert lines[0] == "Assistant:"
+    assert "Title" in lines[1]
+    assert " • x: list[int]" in lines
+    assert " • bold" in lines